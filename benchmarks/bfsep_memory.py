@@ -0,0 +1,57 @@
+"""Peak memory of `bfsep`, the baseflow separation of the flows once read.
+
+Run as::
+
+    python benchmarks/bfsep_memory.py [years] [columns] [--print_input]
+
+The peak resident set size of the baseflow separation, above the memory
+already used for the flows, is printed as a multiple of the size of the
+flows as a float64 block.  Only works on Linux.
+"""
+
+import sys
+
+import numpy as np
+import pandas as pd
+
+from hydrotoolbox import baseflow_sep
+
+
+def _status(field):
+    """A memory field of /proc/self/status, in bytes."""
+    with open("/proc/self/status") as fpi:
+        for line in fpi:
+            if line.startswith(f"{field}:"):
+                return int(line.split()[1]) * 1024
+    raise KeyError(field)
+
+
+def main(years=100, columns=50, print_input=False):
+    index = pd.date_range("1900-01-01", periods=int(365.25 * years), freq="D")
+    rng = np.random.default_rng(48)
+    flow = pd.DataFrame(
+        rng.lognormal(2, 1, (len(index), columns)),
+        index=index,
+        columns=[f"r{column:04d}" for column in range(columns)],
+    ).astype("Float64")
+    # A few gaps and missing values, like real records.
+    flow = flow.drop(index[1000:1010])
+    flow.iloc[::97, 0] = pd.NA
+    size = len(index) * columns * 8
+
+    before = _status("VmRSS")
+    # Linux resets the peak resident set size (VmHWM) to the current one.
+    with open("/proc/self/clear_refs", "w") as fpo:
+        fpo.write("5")
+    baseflow_sep.bfsep(flow, "eckhardt", print_input, k=0.97, bfi_max=0.8)
+    peak = _status("VmHWM") - before
+    print(
+        f"{len(index)} days x {columns} columns, print_input={print_input}: "
+        f"flows {size / 2**20:.1f} MiB, peak {peak / 2**20:.1f} MiB "
+        f"({peak / size:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if arg != "--print_input"]
+    main(*(int(arg) for arg in args), print_input="--print_input" in sys.argv)
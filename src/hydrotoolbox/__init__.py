@@ -3,6 +3,7 @@
 # Import main functions from hydrotoolbox module
 from hydrotoolbox.hydrotoolbox import (
     about,
+    exceedance_events,
     exceedance_time,
     flow_duration,
     indices,
@@ -14,6 +15,7 @@ from hydrotoolbox.hydrotoolbox import (
 __all__ = [
     # Main functions
     "about",
+    "exceedance_events",
     "exceedance_time",
     "flow_duration",
     "indices",
@@ -0,0 +1,216 @@
+"""Memory-mapped flow archives for very long or many-station records.
+
+A flow archive is a directory, by convention named "<name>.flows", with
+
+values.npy
+    The flows as one float64 array of rows by columns, in column major
+    order so that each column is one contiguous block of the file.
+meta.json
+    The column names and the index, as the first date/time and frequency
+    for regular records.
+index.npy
+    The date/times as datetime64 values, only for irregular records.
+
+The flows are memory mapped, so only the pages of the columns and rows that
+are used are read.  Every hydrotoolbox function accepts the archive
+directory as `input_ts`, optionally followed by the columns to read like
+"realizations.flows,r0001,r0002", and `flow_duration` with `chunksize`
+reads it a block of rows at a time.
+"""
+
+__all__ = [
+    "FlowArchive",
+    "write_archive",
+]
+
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from hydrotoolbox.toolbox_utils.src.toolbox_utils import tsutils
+
+EXTENSION = ".flows"
+
+
+class FlowArchive:
+    """A memory-mapped flow archive.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        The archive directory.
+    mode : str
+        [optional, default is "r"]
+
+        "r" to read, or "r+" to also change the flows in place.
+    """
+
+    def __init__(self, path, mode="r"):
+        self.path = os.fspath(path)
+        with open(os.path.join(self.path, "meta.json"), encoding="utf-8") as fpi:
+            meta = json.load(fpi)
+        self.columns = pd.Index(meta["columns"])
+        self.values = np.load(os.path.join(self.path, "values.npy"), mmap_mode=mode)
+        if meta.get("freq") is not None:
+            self.index = pd.date_range(
+                meta["start"],
+                periods=len(self.values),
+                freq=meta["freq"],
+                name="Datetime",
+            )
+        else:
+            self.index = pd.DatetimeIndex(
+                np.load(os.path.join(self.path, "index.npy")), name="Datetime"
+            )
+
+    @classmethod
+    def create(cls, path, index, columns):
+        """Create an empty archive to fill in a column at a time.
+
+        Parameters
+        ----------
+        path : str or os.PathLike
+            The new archive directory.
+        index : pandas.DatetimeIndex
+            The date/times of the flows.
+        columns : list
+            The column names.
+
+        Returns
+        -------
+        archive
+            The FlowArchive, opened with mode "r+", with all flows NaN.
+        """
+        path = os.fspath(path)
+        index = pd.DatetimeIndex(index)
+        columns = [str(column) for column in columns]
+        os.makedirs(path, exist_ok=True)
+
+        freq = index.freqstr if index.freq is not None else None
+        if freq is None and len(index) > 2:
+            freq = pd.infer_freq(index)
+        meta = {"columns": columns, "freq": freq}
+        if freq is not None and len(index) > 0:
+            meta["start"] = index[0].isoformat()
+        else:
+            meta["freq"] = None
+            np.save(os.path.join(path, "index.npy"), index.to_numpy())
+
+        values = np.lib.format.open_memmap(
+            os.path.join(path, "values.npy"),
+            mode="w+",
+            dtype="float64",
+            shape=(len(index), len(columns)),
+            fortran_order=True,
+        )
+        values[:] = np.nan
+        values.flush()
+        del values
+        with open(os.path.join(path, "meta.json"), "w", encoding="utf-8") as fpo:
+            json.dump(meta, fpo)
+        return cls(path, mode="r+")
+
+    def __len__(self):
+        return len(self.index)
+
+    def __getitem__(self, column):
+        """The flows of one column as a Series over the memory map."""
+        return pd.Series(
+            self.values[:, self._position(column)],
+            index=self.index,
+            name=column,
+            copy=False,
+        )
+
+    def __setitem__(self, column, flow):
+        self.values[:, self._position(column)] = np.asarray(flow, dtype="float64")
+
+    def _position(self, column):
+        try:
+            return self.columns.get_loc(column)
+        except KeyError as exc:
+            raise ValueError(
+                tsutils.error_wrapper(
+                    f"""
+                    The column {column} is not in the archive {self.path}.
+                    """
+                )
+            ) from exc
+
+    def frame(self, columns=None, start=None, stop=None):
+        """The flows as a DataFrame over the memory map.
+
+        Parameters
+        ----------
+        columns : list
+            [optional, default is all columns]
+
+            The columns to include.
+        start, stop : int
+            [optional, default is all rows]
+
+            The rows to include, as a slice.
+        """
+        rows = slice(start, stop)
+        if columns is None:
+            positions = slice(None)
+            columns = self.columns
+        else:
+            positions = [self._position(column) for column in columns]
+            # Consecutive columns are a view, others are only read for the
+            # chosen columns.
+            if positions == list(range(positions[0], positions[-1] + 1)):
+                positions = slice(positions[0], positions[-1] + 1)
+        return pd.DataFrame(
+            self.values[rows, positions],
+            index=self.index[rows],
+            columns=columns,
+            copy=False,
+        )
+
+    def chunks(self, chunksize, columns=None):
+        """DataFrames of `chunksize` rows at a time."""
+        for start in range(0, len(self), chunksize):
+            yield self.frame(columns=columns, start=start, stop=start + chunksize)
+
+    def flush(self):
+        """Write changed flows to the file."""
+        self.values.flush()
+
+
+def write_archive(path, flow):
+    """Write flows to a new flow archive.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        The new archive directory.
+    flow : pandas.DataFrame or pandas.Series
+        The flows, with a date/time index.
+
+    Returns
+    -------
+    archive
+        The FlowArchive.
+    """
+    if isinstance(flow, pd.Series):
+        flow = flow.to_frame()
+    archive = FlowArchive.create(path, flow.index, flow.columns)
+    for position, column in enumerate(flow.columns):
+        archive.values[:, position] = flow[column].to_numpy(
+            dtype="float64", na_value=np.nan
+        )
+    archive.flush()
+    return archive
+
+
+def split_name(input_ts):
+    """The archive path and columns of "path.flows,col1,col2", or None."""
+    if not isinstance(input_ts, (str, os.PathLike)):
+        return None
+    path, *columns = os.fspath(input_ts).split(",")
+    if os.path.splitext(path.rstrip("/\\"))[1].lower() != EXTENSION:
+        return None
+    return path, columns or None
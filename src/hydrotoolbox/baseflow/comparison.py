@@ -14,26 +14,31 @@ def strict_baseflow(Q):
 
     # 2. Previous 2 points before points with dQ/dt >= 0, as well as the next
     #    three points.
-    idx_first = np.where(wet1[1:].astype(int) - wet1[:-1].astype(int) == 1)[0] + 1
-    idx_last = np.where(wet1[1:].astype(int) - wet1[:-1].astype(int) == -1)[0]
-    idx_before = np.repeat([idx_first], 2) - np.tile(range(1, 3), idx_first.shape)
-    idx_next = np.repeat([idx_last], 3) + np.tile(range(1, 4), idx_last.shape)
-    idx_remove = np.concatenate([idx_before, idx_next])
-    wet2 = np.full(Q.shape, False)
-    wet2[idx_remove.clip(min=0, max=Q.shape[0] - 1)] = True
+    before = np.append(wet1[1:] & ~wet1[:-1], False)
+    wet2 = before.copy()
+    wet2[:-1] |= before[1:]
+    wet2 |= _after(np.append(wet1[:-1] & ~wet1[1:], False), 3)
 
     # 3. Five data points after major events.  A major event is identified as
     #    greater than the 90th quantile.
     growing = np.concatenate([[True], (Q[1:] - Q[:-1]) >= 0, [True]])
-    idx_major = np.where((Q >= np.quantile(Q, 0.9)) & growing[:-1] & ~growing[1:])[0]
-    idx_after = np.repeat([idx_major], 5) + np.tile(range(1, 6), idx_major.shape)
-    wet3 = np.full(Q.shape, False)
-    wet3[idx_after.clip(min=0, max=Q.shape[0] - 1)] = True
+    major = (Q >= np.quantile(Q, 0.9)) & growing[:-1] & ~growing[1:]
+    wet3 = _after(major, 5)
 
     # 4. Flow data followed by a data point with a larger value of -dQ/dt.
     wet4 = np.concatenate([[True], delta_q[1:] - delta_q[:-1] < 0, [True, True]])
 
-    return ~(wet1 + wet2 + wet3 + wet4)
+    return ~(wet1 | wet2 | wet3 | wet4)
+
+
+def _after(mask, count):
+    """Mask of the `count` points after each point of `mask`."""
+    # Shifted slices instead of index arrays.  The last point of `mask` is
+    # never set, so no point is shifted past the end.
+    after = np.full(mask.shape, False)
+    for shift in range(1, count + 1):
+        after[shift:] |= mask[:-shift]
+    return after
 
 
 def KGE(simulations, evaluation):
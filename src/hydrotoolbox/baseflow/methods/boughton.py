@@ -5,13 +5,13 @@ __all__ = [
 from hydrotoolbox.baseflow.methods.general_form import general_form_digital_filter
 
 
-def boughton(flow, k, C):
+def boughton(flow, k, C, state=None):
     """Boughton double-parameter filter (Boughton, 2004)"""
     alpha = k / (1 + C)
     beta = C / (1 + C)
     gamma = 0.0
 
-    return general_form_digital_filter(flow, alpha, beta, gamma)
+    return general_form_digital_filter(flow, alpha, beta, gamma, state=state)
 
 
 def f_Boughton(k):
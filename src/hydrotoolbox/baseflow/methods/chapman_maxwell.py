@@ -5,10 +5,10 @@ __all__ = [
 from hydrotoolbox.baseflow.methods.general_form import general_form_digital_filter
 
 
-def chapman_maxwell(flow, k):
+def chapman_maxwell(flow, k, state=None):
     """CM filter (Chapman & Maxwell, 1996)"""
     alpha = k / (2 - k)
     beta = (1 - k) / (2 - k)
     gamma = 0
 
-    return general_form_digital_filter(flow, alpha, beta, gamma)
+    return general_form_digital_filter(flow, alpha, beta, gamma, state=state)
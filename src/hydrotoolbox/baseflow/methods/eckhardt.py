@@ -5,14 +5,14 @@ __all__ = [
 from hydrotoolbox.baseflow.methods.general_form import general_form_digital_filter
 
 
-def eckhardt(flow, k, BFImax):
+def eckhardt(flow, k, BFImax, state=None):
     """Eckhardt filter (Eckhardt, 2005)"""
     denom = 1 - k * BFImax
     alpha = ((1 - BFImax) * k) / denom
     beta = ((1 - k) * BFImax) / denom
     gamma = 0
 
-    return general_form_digital_filter(flow, alpha, beta, gamma)
+    return general_form_digital_filter(flow, alpha, beta, gamma, state=state)
 
 
 def f_Eckhardt(a):
@@ -1,8 +1,7 @@
 import numpy as np
-from scipy.signal import lfilter, lfilter_zi
 
 
-def general_form_digital_filter(flow, alpha, beta, gamma, delta=1):
+def general_form_digital_filter(flow, alpha, beta, gamma, delta=1, state=None):
     """
     Use a general form digital filter given coefficients alpha, beta, and gamma.
 
@@ -37,6 +36,10 @@ def general_form_digital_filter(flow, alpha, beta, gamma, delta=1):
         Parameter for the current and previous total flow values.
     gamma
         Parameter for the previous total flow value.
+    state : dict, optional
+        To filter a series a piece at a time, the filter state after the
+        previous piece as "zi", which is updated to the state after `flow`.
+        The first piece starts from the same state as the whole series.
 
     Returns
     -------
@@ -45,11 +48,17 @@ def general_form_digital_filter(flow, alpha, beta, gamma, delta=1):
     num_exceeds
         The count of baseflow values that exceed the input flow.
     """
+    from scipy.signal import lfilter, lfilter_zi
+
     b = [beta * delta, gamma * beta]
     a = [1.0, -alpha]
 
-    zi = lfilter_zi(b, a)
-    bf = lfilter(b, a, flow, axis=0, zi=zi)[0]
+    if state is None:
+        state = {}
+    zi = state.get("zi")
+    if zi is None:
+        zi = lfilter_zi(b, a)
+    bf, state["zi"] = lfilter(b, a, flow, axis=0, zi=zi)
 
     num_exceeds = np.count_nonzero(bf > flow)
     bf = np.clip(bf, a_min=0, a_max=flow)
@@ -19,6 +19,7 @@ def ihacres(
     k: float,
     C: float,
     a: float,
+    state=None,
 ):
     """IHACRES baseflow separation.
 
@@ -28,4 +29,4 @@ def ihacres(
     beta = C / (1 + C)
     gamma = a
 
-    return general_form_digital_filter(flow, alpha, beta, gamma)
+    return general_form_digital_filter(flow, alpha, beta, gamma, state=state)
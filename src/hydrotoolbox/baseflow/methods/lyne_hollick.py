@@ -5,8 +5,11 @@ __all__ = [
 from hydrotoolbox.baseflow.methods.general_form import general_form_digital_filter
 
 
-def lyne_hollick(flow, k, passes=1):
-    """LH digital filter (Lyne & Hollick, 1979)"""
+def lyne_hollick(flow, k, passes=1, state=None):
+    """LH digital filter (Lyne & Hollick, 1979)
+
+    Only one pass can carry a `state` from a previous piece of the series.
+    """
     alpha = k
     beta = (1 - k) / 2
     gamma = 1.0
@@ -14,6 +17,7 @@ def lyne_hollick(flow, k, passes=1):
     for pss in range(passes):
         if pss > 0:
             flow = flow[::-1]
-        flow, count = general_form_digital_filter(flow, alpha, beta, gamma)
+            state = None
+        flow, count = general_form_digital_filter(flow, alpha, beta, gamma, state=state)
 
     return flow, count
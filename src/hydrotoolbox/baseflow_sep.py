@@ -52,6 +52,7 @@ try:
 except ImportError:
     from pydantic import validate_arguments as validate_call
 
+from . import columnar
 from .baseflow.separation import separation
 from .toolbox_utils.src.toolbox_utils import tsutils
 
@@ -88,6 +89,179 @@ tsutils.docstrings["bfi_max"] = """bfi_max
         [optional, default is None, where bfi_max will be calculated from the
         input data]
 """
+tsutils.docstrings["resolution"] = """resolution: str
+        [optional, default is "daily"]
+
+        The time step of the baseflow separation.  With "daily" the flows
+        are averaged over each day, counted from the first date/time, so
+        hourly or 15 minute flows are separated as daily flows.  With
+        "native" the flows are separated at their own most common time step
+        and the recession constant `k` of a day is used as k**(step/1 day)
+        for each step, with the `C` of boughton changed to keep the same
+        steady baseflow.  Only the recursive digital filters boughton,
+        chapman, chapman_maxwell, eckhardt and lyne_hollick with a given
+        `k`, and `C` for boughton, can use "native", and not with
+        `chunksize`.
+"""
+tsutils.docstrings["chunksize"] = """chunksize: int
+        [optional, default is None]
+
+        Read and filter the flows `chunksize` rows at a time and return an
+        iterator of the baseflow DataFrames of each chunk, which the command
+        line writes as each is done.  The filter state is carried from one
+        chunk to the next, so the baseflow is the same as without
+        `chunksize`, but the filter parameters can't be estimated from the
+        flows and must be given.  Only ".csv", ".txt" and ".dat" files, flow
+        archives, standard input and DataFrames are read in chunks, each by
+        the same reader as the whole input, and `clean` only applies within
+        each chunk.
+"""
+
+
+def _warn_dropped(negative, missing):
+    """Log the number of flows the baseflow separation skips."""
+    if negative:
+        logging.warning(
+            tsutils.error_wrapper(
+                f"""{negative} negative or 0 values in input data.  No
+                baseflow separation technique works with negative values.
+                Negative values dropped from the analysis. This means that
+                positive values on either side of negative flows are
+                considered adjacent. Negative flow in the output baseflow
+                represented as missing.
+                """
+            )
+        )
+    if missing:
+        logging.warning(
+            tsutils.error_wrapper(
+                f"""{missing} missing values in input data.  No
+                baseflow separation technique works with missing values.
+                Missing values dropped from the analysis. This means that
+                positive values on either side of missing flows are
+                considered adjacent. Missing flow in the output baseflow
+                represented as missing.
+                """
+            )
+        )
+
+
+def _bfsep_chunks(
+    method,
+    input_ts,
+    chunksize,
+    print_input,
+    filter_kwds,
+    resolution="daily",
+    skiprows=None,
+    names=None,
+    index_type="datetime",
+    **kwds,
+):
+    """Baseflow DataFrames of `chunksize` rows of the input at a time."""
+    from .hydrotoolbox import _flow_chunks
+    from .streaming import BaseflowFilter
+
+    if resolution != "daily":
+        raise ValueError(
+            tsutils.error_wrapper(
+                f"""
+                Only daily flows can be separated a chunk at a time,
+                instead of a {resolution} resolution.
+                """
+            )
+        )
+
+    # Made here so that missing parameters are reported before reading.
+    bf_filter = BaseflowFilter(method, **filter_kwds)
+
+    def chunks():
+        for chunk in _flow_chunks(input_ts, int(chunksize), skiprows):
+            flow = tsutils.common_kwds(
+                columnar.read_iso_ts(
+                    chunk, skiprows=skiprows, names=names, index_type=index_type
+                ),
+                **kwds,
+            )
+            q_base = bf_filter.update(flow)
+            yield tsutils.return_input(
+                print_input,
+                flow.reindex(q_base.index),
+                q_base,
+                suffix=method,
+            )
+        _warn_dropped(bf_filter.negative, bf_filter.missing)
+
+    return chunks()
+
+
+# The recursive digital filters, which can separate baseflow at any time step.
+# The IHACRES filter is left out, because its weight `a` of the previous flow
+# has no equivalent at another time step.
+_NATIVE_METHODS = (
+    "boughton",
+    "chapman",
+    "chapman_maxwell",
+    "eckhardt",
+    "lyne_hollick",
+)
+
+
+def _step_parameters(method, k, C, days):
+    """The filter parameters of a time step of `days`, from those of a day.
+
+    Every filter recedes by k each day, so k**days each step.  The steady
+    baseflow of the other filters only depends on k, but that of the
+    Boughton filter is C/(1 + C - k), so its C is also changed to keep it.
+    The Boughton filter then gives the same baseflow at the end of a day of
+    constant flow at either time step.
+    """
+    if method != "boughton":
+        return float(k) ** days, C
+    alpha = float(k) / (1 + float(C))
+    beta = float(C) / (1 + float(C))
+    step_alpha = alpha**days
+    step_beta = beta * (1 - step_alpha) / (1 - alpha)
+    step_C = step_beta / (1 - step_beta)
+    return step_alpha * (1 + step_C), step_C
+
+
+def _time_steps(index, resolution):
+    """The time step and the step of each date/time of the index.
+
+    Steps are counted from the first date/time.  A "daily" `resolution` has
+    steps of a day, and a "native" one the most common time step of the
+    index.
+    """
+    if resolution not in ("daily", "native"):
+        raise ValueError(
+            tsutils.error_wrapper(
+                f"""
+                The resolution must be "daily" or "native", instead of
+                {resolution}.
+                """
+            )
+        )
+    day = pd.Timedelta(days=1).value
+    times = index.as_unit("ns")
+    if resolution == "daily" and times.tz is not None:
+        # Days follow the clock through daylight saving time changes.
+        times = times.tz_localize(None)
+    times = times.asi8
+    step = day
+    if resolution == "native" and len(times) > 1:
+        steps, counts = np.unique(np.diff(times), return_counts=True)
+        step = int(steps[counts.argmax()])
+    return pd.Timedelta(step), (times - times[0]) // step
+
+
+def _step_means(values, positions, out):
+    """Write the mean of the values at each position into out."""
+    valid = ~np.isnan(values)
+    counts = np.bincount(positions[valid], minlength=len(out))
+    sums = np.bincount(positions[valid], weights=values[valid], minlength=len(out))
+    with np.errstate(invalid="ignore"):
+        np.divide(sums, counts, out=out)
 
 
 def bfsep(
@@ -105,65 +279,103 @@ def bfsep(
     a=None,
     bfi_max=None,
     passes=1,
+    resolution="daily",
 ):
-    complete_index = pd.date_range(start=flow.index[0], end=flow.index[-1], freq="D")
-    flow = flow.reindex(complete_index, fill_value=np.nan)
-    ntsd = pd.DataFrame()
-    if print_input is True:
-        ntsd = flow.copy()
-    q_base = pd.DataFrame()
-    for col in flow.columns:
-        ncol = flow[col].astype("float64")
-        negmask = ncol <= 0
-        if negmask.any():
-            logging.warning(
-                tsutils.error_wrapper(
-                    f"""{negmask.sum()} negative or 0 values in input data.  No
-                    baseflow separation technique works with negative values.
-                    Negative values dropped from the analysis. This means that
-                    positive values on either side of negative flows are
-                    considered adjacent. Negative flow in the output baseflow
-                    represented as missing.
-                    """
-                )
+    """Baseflow of each column of `flow` by one `method` of `separation`.
+
+    The flows are averaged over each day, or each time step of the input
+    for a "native" `resolution`, into one float64 block, a column at a
+    time, and the baseflow of each column is written into a second block of
+    the same size.  Only the positive flows of the column being separated
+    are copied for `separation`.  The nullable float columns of the output
+    are views of the two blocks, so the peak memory is about twice the size
+    of the flows as a float64 block, plus a column.
+    """
+    if not flow.index.is_unique:
+        raise ValueError(
+            tsutils.error_wrapper(
+                """
+                The baseflow separation needs one flow for each date/time,
+                but the index has duplicates.
+                """
             )
-        missingmask = ncol.isnull()
-        if missingmask.any():
-            logging.warning(
+        )
+    step, positions = _time_steps(flow.index, resolution)
+    day = pd.Timedelta(days=1)
+    if resolution == "native":
+        if (
+            method not in _NATIVE_METHODS
+            or k is None
+            or (method == "boughton" and C is None)
+        ):
+            raise ValueError(
                 tsutils.error_wrapper(
-                    f"""{missingmask.sum()} missing values in input data.  No
-                    baseflow separation technique works with missing values.
-                    Missing values dropped from the analysis. This means that
-                    positive values on either side of missing flows are
-                    considered adjacent. Missing flow in the output baseflow
-                    represented as missing.
+                    f"""
+                    Only the {_NATIVE_METHODS} filters with a given k, and C
+                    for boughton, can separate baseflow at the native
+                    resolution, instead of {method} with k={k} and C={C}.
                     """
                 )
             )
-        ncol[negmask] = pd.NA
-        ncol = ncol.dropna()
-        ndf = pd.DataFrame(
-            separation(
-                ncol.values,
-                date=date,
-                num_days=num_days,
-                area=area,
-                ice_period=ice_period,
-                method=method,
-                k=k,
-                c3c1=c3c1,
-                C=C,
-                a=a,
-                bfi_max=bfi_max,
-                passes=passes,
-            )[bfi],
-            index=ncol.index,
+        k, C = _step_parameters(method, k, C, step / day)
+    length = positions[-1] + 1 if len(positions) else 0
+    index = pd.date_range(
+        start=flow.index[0],
+        periods=length,
+        freq="D" if step == day else step,
+        name="Datetime",
+    )
+
+    inflow = np.full((len(index), len(flow.columns)), np.nan, order="F")
+    q_base = np.full((len(index), len(flow.columns)), np.nan, order="F")
+    for position, col in enumerate(flow.columns):
+        _step_means(
+            flow[col].to_numpy(dtype="float64", na_value=np.nan),
+            positions,
+            inflow[:, position],
         )
-        ndf.columns = [col]
-        q_base = q_base.join(ndf, how="outer")
-    q_base = q_base.reindex(flow.index)
-    q_base.index.name = "Datetime"
-    return tsutils.return_input(print_input, ntsd, q_base, suffix=method.lower())
+        ncol = inflow[:, position]
+        missingmask = np.isnan(ncol)
+        valid = ncol > 0
+        _warn_dropped(np.count_nonzero(~valid & ~missingmask), missingmask.sum())
+        q_base[valid, position] = separation(
+            ncol[valid],
+            date=date,
+            num_days=num_days,
+            area=area,
+            ice_period=ice_period,
+            method=method,
+            k=k,
+            c3c1=c3c1,
+            C=C,
+            a=a,
+            bfi_max=bfi_max,
+            passes=passes,
+        )[bfi][method]
+
+    columns = {}
+    if print_input is True:
+        columns.update(_nullable_columns(inflow, flow.columns))
+    columns.update(
+        _nullable_columns(
+            q_base,
+            [tsutils.renamer(col, method.lower()) for col in flow.columns],
+        )
+    )
+    return tsutils.memory_optimize(pd.DataFrame(columns, index=index, copy=False))
+
+
+def _nullable_columns(block, names):
+    """The columns of a block by name, with the dtypes of convert_dtypes."""
+    columns = {}
+    for position, name in enumerate(names):
+        values = block[:, position]
+        column = pd.Series(values, copy=False).convert_dtypes().array
+        if column.dtype == "Float64":
+            # The same column as a view of the block.
+            column = pd.arrays.FloatingArray(values, np.isnan(values))
+        columns[name] = column
+    return columns
 
 
 @tsutils.doc(tsutils.docstrings)
@@ -183,6 +395,8 @@ def boughton(
     names=None,
     target_units=None,
     print_input=False,
+    resolution="daily",
+    chunksize=None,
 ):
     """
     Boughton double-parameter filter [1]_
@@ -218,6 +432,8 @@ def boughton(
     ${names}
     ${target_units}
     ${print_input}
+    ${resolution}
+    ${chunksize}
     ${tablefmt}
 
     References
@@ -226,8 +442,28 @@ def boughton(
        estimating water yield of ungauged catchments, Institute of Engineers
        Australia National Conference. Publ. 93/14, pp. 317-324.
     """
+    if chunksize is not None:
+        return _bfsep_chunks(
+            "boughton",
+            input_ts,
+            chunksize,
+            print_input,
+            {"k": k, "C": C},
+            resolution=resolution,
+            skiprows=skiprows,
+            names=names,
+            index_type=index_type,
+            start_date=start_date,
+            end_date=end_date,
+            pick=columns,
+            round_index=round_index,
+            dropna=dropna,
+            clean=clean,
+            source_units=source_units,
+            target_units=target_units,
+        )
     flow = tsutils.common_kwds(
-        tsutils.read_iso_ts(
+        columnar.read_iso_ts(
             input_ts,
             skiprows=skiprows,
             names=names,
@@ -242,7 +478,7 @@ def boughton(
         source_units=source_units,
         target_units=target_units,
     )
-    return bfsep(flow, "boughton", print_input, k=k, C=C)
+    return bfsep(flow, "boughton", print_input, k=k, C=C, resolution=resolution)
 
 
 @tsutils.doc(tsutils.docstrings)
@@ -261,6 +497,8 @@ def chapman(
     names=None,
     target_units=None,
     print_input=False,
+    resolution="daily",
+    chunksize=None,
 ):
     """
     Chapman filter [1]_
@@ -291,6 +529,8 @@ def chapman(
     ${names}
     ${target_units}
     ${print_input}
+    ${resolution}
+    ${chunksize}
     ${tablefmt}
 
     References
@@ -299,8 +539,28 @@ def chapman(
        techniques for base flow and recession analyses, by RJ Nathan and TA
        McMahon. Water Resources Research, 27(7), pp. 1783-1784.
     """
+    if chunksize is not None:
+        return _bfsep_chunks(
+            "chapman",
+            input_ts,
+            chunksize,
+            print_input,
+            {"k": k},
+            resolution=resolution,
+            skiprows=skiprows,
+            names=names,
+            index_type=index_type,
+            start_date=start_date,
+            end_date=end_date,
+            pick=columns,
+            round_index=round_index,
+            dropna=dropna,
+            clean=clean,
+            source_units=source_units,
+            target_units=target_units,
+        )
     flow = tsutils.common_kwds(
-        tsutils.read_iso_ts(
+        columnar.read_iso_ts(
             input_ts,
             skiprows=skiprows,
             names=names,
@@ -315,7 +575,7 @@ def chapman(
         source_units=source_units,
         target_units=target_units,
     )
-    return bfsep(flow, "chapman", print_input, k=k)
+    return bfsep(flow, "chapman", print_input, k=k, resolution=resolution)
 
 
 @tsutils.doc(tsutils.docstrings)
@@ -334,6 +594,8 @@ def chapman_maxwell(
     names=None,
     target_units=None,
     print_input=False,
+    resolution="daily",
+    chunksize=None,
 ):
     """Digital filter (Chapman and Maxwell, 1996)
     ::
@@ -363,10 +625,32 @@ def chapman_maxwell(
     ${names}
     ${target_units}
     ${print_input}
+    ${resolution}
+    ${chunksize}
     ${tablefmt}
     """
+    if chunksize is not None:
+        return _bfsep_chunks(
+            "chapman_maxwell",
+            input_ts,
+            chunksize,
+            print_input,
+            {"k": k},
+            resolution=resolution,
+            skiprows=skiprows,
+            names=names,
+            index_type=index_type,
+            start_date=start_date,
+            end_date=end_date,
+            pick=columns,
+            round_index=round_index,
+            dropna=dropna,
+            clean=clean,
+            source_units=source_units,
+            target_units=target_units,
+        )
     flow = tsutils.common_kwds(
-        tsutils.read_iso_ts(
+        columnar.read_iso_ts(
             input_ts,
             skiprows=skiprows,
             names=names,
@@ -381,7 +665,7 @@ def chapman_maxwell(
         source_units=source_units,
         target_units=target_units,
     )
-    return bfsep(flow, "chapman_maxwell", print_input, k=k)
+    return bfsep(flow, "chapman_maxwell", print_input, k=k, resolution=resolution)
 
 
 @tsutils.doc(tsutils.docstrings)
@@ -401,6 +685,8 @@ def eckhardt(
     names=None,
     target_units=None,
     print_input=False,
+    resolution="daily",
+    chunksize=None,
 ):
     """Eckhardt filter (Eckhardt, 2005)
     ::
@@ -432,10 +718,32 @@ def eckhardt(
     ${names}
     ${target_units}
     ${print_input}
+    ${resolution}
+    ${chunksize}
     ${tablefmt}
     """
+    if chunksize is not None:
+        return _bfsep_chunks(
+            "eckhardt",
+            input_ts,
+            chunksize,
+            print_input,
+            {"k": k, "bfi_max": bfi_max},
+            resolution=resolution,
+            skiprows=skiprows,
+            names=names,
+            index_type=index_type,
+            start_date=start_date,
+            end_date=end_date,
+            pick=columns,
+            round_index=round_index,
+            dropna=dropna,
+            clean=clean,
+            source_units=source_units,
+            target_units=target_units,
+        )
     flow = tsutils.common_kwds(
-        tsutils.read_iso_ts(
+        columnar.read_iso_ts(
             input_ts,
             skiprows=skiprows,
             names=names,
@@ -450,7 +758,14 @@ def eckhardt(
         source_units=source_units,
         target_units=target_units,
     )
-    return bfsep(flow, "eckhardt", print_input, k=k, bfi_max=bfi_max)
+    return bfsep(
+        flow,
+        "eckhardt",
+        print_input,
+        k=k,
+        bfi_max=bfi_max,
+        resolution=resolution,
+    )
 
 
 @tsutils.doc(tsutils.docstrings)
@@ -468,6 +783,7 @@ def ewma(
     names=None,
     target_units=None,
     print_input=False,
+    resolution="daily",
 ):
     """Exponential Weighted Moving Average (EWMA) filter (Tularam and Ilahee, 2008)
 
@@ -487,10 +803,11 @@ def ewma(
     ${names}
     ${target_units}
     ${print_input}
+    ${resolution}
     ${tablefmt}
     """
     flow = tsutils.common_kwds(
-        tsutils.read_iso_ts(
+        columnar.read_iso_ts(
             input_ts,
             skiprows=skiprows,
             names=names,
@@ -505,7 +822,7 @@ def ewma(
         source_units=source_units,
         target_units=target_units,
     )
-    return bfsep(flow, "ewma", print_input)
+    return bfsep(flow, "ewma", print_input, resolution=resolution)
 
 
 @tsutils.doc(tsutils.docstrings)
@@ -525,6 +842,7 @@ def usgs_hysep_fixed(
     names=None,
     target_units=None,
     print_input=False,
+    resolution="daily",
 ):
     """USGS HYSEP Fixed interval method.
 
@@ -551,10 +869,11 @@ def usgs_hysep_fixed(
     ${names}
     ${target_units}
     ${print_input}
+    ${resolution}
     ${tablefmt}
     """
     flow = tsutils.common_kwds(
-        tsutils.read_iso_ts(
+        columnar.read_iso_ts(
             input_ts,
             skiprows=skiprows,
             names=names,
@@ -569,7 +888,14 @@ def usgs_hysep_fixed(
         source_units=source_units,
         target_units=target_units,
     )
-    return bfsep(flow, "fixed", print_input, area=area, num_days=num_days)
+    return bfsep(
+        flow,
+        "fixed",
+        print_input,
+        area=area,
+        num_days=num_days,
+        resolution=resolution,
+    )
 
 
 @tsutils.doc(tsutils.docstrings)
@@ -589,6 +915,7 @@ def furey(
     names=None,
     target_units=None,
     print_input=False,
+    resolution="daily",
 ):
     """
     Furey digital filter [Furey and Gupta, 2001]
@@ -635,6 +962,7 @@ def furey(
     ${names}
     ${target_units}
     ${print_input}
+    ${resolution}
     ${tablefmt}
 
     References
@@ -644,7 +972,7 @@ def furey(
        series, Water Resour. Res., 37(11), 2709–2722
     """
     flow = tsutils.common_kwds(
-        tsutils.read_iso_ts(
+        columnar.read_iso_ts(
             input_ts,
             skiprows=skiprows,
             names=names,
@@ -659,7 +987,7 @@ def furey(
         source_units=source_units,
         target_units=target_units,
     )
-    return bfsep(flow, "furey", print_input, k=k, c3c1=c3c1)
+    return bfsep(flow, "furey", print_input, k=k, c3c1=c3c1, resolution=resolution)
 
 
 @tsutils.doc(tsutils.docstrings)
@@ -679,6 +1007,8 @@ def lyne_hollick(
     names=None,
     target_units=None,
     print_input=False,
+    resolution="daily",
+    chunksize=None,
 ):
     """
     Digital filter [1]_
@@ -712,6 +1042,8 @@ def lyne_hollick(
     ${names}
     ${target_units}
     ${print_input}
+    ${resolution}
+    ${chunksize}
     ${tablefmt}
 
     References
@@ -720,8 +1052,37 @@ def lyne_hollick(
        rainfall-runoff modelling. Institute of Engineers Australia National
        Conference. Publ. 79/10, pp. 89-93.
     """
+    if chunksize is not None:
+        if passes != 1:
+            raise ValueError(
+                tsutils.error_wrapper(
+                    f"""
+                    Only one pass of the Lyne and Hollick filter can be
+                    done a chunk at a time, instead of {passes}.
+                    """
+                )
+            )
+        return _bfsep_chunks(
+            "lyne_hollick",
+            input_ts,
+            chunksize,
+            print_input,
+            {"k": alpha},
+            resolution=resolution,
+            skiprows=skiprows,
+            names=names,
+            index_type=index_type,
+            start_date=start_date,
+            end_date=end_date,
+            pick=columns,
+            round_index=round_index,
+            dropna=dropna,
+            clean=clean,
+            source_units=source_units,
+            target_units=target_units,
+        )
     flow = tsutils.common_kwds(
-        tsutils.read_iso_ts(
+        columnar.read_iso_ts(
             input_ts,
             skiprows=skiprows,
             names=names,
@@ -736,7 +1097,14 @@ def lyne_hollick(
         source_units=source_units,
         target_units=target_units,
     )
-    return bfsep(flow, "lyne_hollick", print_input, k=alpha, passes=passes)
+    return bfsep(
+        flow,
+        "lyne_hollick",
+        print_input,
+        k=alpha,
+        passes=passes,
+        resolution=resolution,
+    )
 
 
 @tsutils.doc(tsutils.docstrings)
@@ -756,6 +1124,7 @@ def usgs_hysep_local(
     names=None,
     target_units=None,
     print_input=False,
+    resolution="daily",
 ):
     """
     USGS HYSEP Local minimum graphical method (Sloto and Crouse, 1996)
@@ -778,10 +1147,11 @@ def usgs_hysep_local(
     ${names}
     ${target_units}
     ${print_input}
+    ${resolution}
     ${tablefmt}
     """
     flow = tsutils.common_kwds(
-        tsutils.read_iso_ts(
+        columnar.read_iso_ts(
             input_ts,
             skiprows=skiprows,
             names=names,
@@ -796,7 +1166,14 @@ def usgs_hysep_local(
         source_units=source_units,
         target_units=target_units,
     )
-    return bfsep(flow, "local", print_input, area=area, num_days=num_days)
+    return bfsep(
+        flow,
+        "local",
+        print_input,
+        area=area,
+        num_days=num_days,
+        resolution=resolution,
+    )
 
 
 @validate_call
@@ -818,6 +1195,8 @@ def ihacres(
     names=None,
     target_units=None,
     print_input=False,
+    resolution="daily",
+    chunksize=None,
 ):
     """IHACRES
 
@@ -857,6 +1236,8 @@ def ihacres(
     ${names}
     ${target_units}
     ${print_input}
+    ${resolution}
+    ${chunksize}
     ${tablefmt}
 
     References
@@ -865,8 +1246,28 @@ def ihacres(
        (1993), How much complexity is warranted in a rainfall-runoff model?,
        Water Resour. Res., 29(8), 2637–2649, doi:10.1029/93WR00877.
     """
+    if chunksize is not None:
+        return _bfsep_chunks(
+            "ihacres",
+            input_ts,
+            chunksize,
+            print_input,
+            {"k": k, "C": C, "a": a},
+            resolution=resolution,
+            skiprows=skiprows,
+            names=names,
+            index_type=index_type,
+            start_date=start_date,
+            end_date=end_date,
+            pick=columns,
+            round_index=round_index,
+            dropna=dropna,
+            clean=clean,
+            source_units=source_units,
+            target_units=target_units,
+        )
     flow = tsutils.common_kwds(
-        tsutils.read_iso_ts(
+        columnar.read_iso_ts(
             input_ts,
             skiprows=skiprows,
             names=names,
@@ -881,7 +1282,7 @@ def ihacres(
         source_units=source_units,
         target_units=target_units,
     )
-    return bfsep(flow, "ihacres", print_input, k=k, C=C, a=a)
+    return bfsep(flow, "ihacres", print_input, k=k, C=C, a=a, resolution=resolution)
 
 
 @tsutils.doc(tsutils.docstrings)
@@ -901,6 +1302,7 @@ def usgs_hysep_slide(
     names=None,
     target_units=None,
     print_input=False,
+    resolution="daily",
 ):
     """USGS HYSEP sliding interval method
 
@@ -933,10 +1335,11 @@ def usgs_hysep_slide(
     ${names}
     ${target_units}
     ${print_input}
+    ${resolution}
     ${tablefmt}
     """
     flow = tsutils.common_kwds(
-        tsutils.read_iso_ts(
+        columnar.read_iso_ts(
             input_ts,
             skiprows=skiprows,
             names=names,
@@ -951,7 +1354,14 @@ def usgs_hysep_slide(
         source_units=source_units,
         target_units=target_units,
     )
-    return bfsep(flow, "slide", print_input, area=area, num_days=num_days)
+    return bfsep(
+        flow,
+        "slide",
+        print_input,
+        area=area,
+        num_days=num_days,
+        resolution=resolution,
+    )
 
 
 @tsutils.doc(tsutils.docstrings)
@@ -969,6 +1379,7 @@ def ukih(
     names=None,
     target_units=None,
     print_input=False,
+    resolution="daily",
 ):
     """Graphical method developed by UK Institute of Hydrology (UKIH, 1980)
 
@@ -988,10 +1399,11 @@ def ukih(
     ${names}
     ${target_units}
     ${print_input}
+    ${resolution}
     ${tablefmt}
     """
     flow = tsutils.common_kwds(
-        tsutils.read_iso_ts(
+        columnar.read_iso_ts(
             input_ts,
             skiprows=skiprows,
             names=names,
@@ -1006,7 +1418,7 @@ def ukih(
         source_units=source_units,
         target_units=target_units,
     )
-    return bfsep(flow, "ukih", print_input)
+    return bfsep(flow, "ukih", print_input, resolution=resolution)
 
 
 @tsutils.doc(tsutils.docstrings)
@@ -1024,6 +1436,7 @@ def willems(
     names=None,
     target_units=None,
     print_input=False,
+    resolution="daily",
 ):
     """Digital filter (Willems, 2009)
     ::
@@ -1052,10 +1465,11 @@ def willems(
     ${names}
     ${target_units}
     ${print_input}
+    ${resolution}
     ${tablefmt}
     """
     flow = tsutils.common_kwds(
-        tsutils.read_iso_ts(
+        columnar.read_iso_ts(
             input_ts,
             skiprows=skiprows,
             names=names,
@@ -1070,7 +1484,7 @@ def willems(
         source_units=source_units,
         target_units=target_units,
     )
-    return bfsep(flow, "willems", print_input)
+    return bfsep(flow, "willems", print_input, resolution=resolution)
 
 
 @tsutils.doc(tsutils.docstrings)
@@ -1088,6 +1502,7 @@ def five_day(
     names=None,
     target_units=None,
     print_input=False,
+    resolution="daily",
 ):
     """Value kept if less than 90 percent of adjacent 5-day blocks.
 
@@ -1107,10 +1522,11 @@ def five_day(
     ${names}
     ${target_units}
     ${print_input}
+    ${resolution}
     ${tablefmt}
     """
     flow = tsutils.common_kwds(
-        tsutils.read_iso_ts(
+        columnar.read_iso_ts(
             input_ts,
             skiprows=skiprows,
             names=names,
@@ -1125,7 +1541,7 @@ def five_day(
         source_units=source_units,
         target_units=target_units,
     )
-    return bfsep(flow, "five_day", print_input)
+    return bfsep(flow, "five_day", print_input, resolution=resolution)
 
 
 # @tsutils.doc(tsutils.docstrings)
@@ -1164,7 +1580,7 @@ def five_day(
 #     ${tablefmt}
 #     """
 #     flow = tsutils.common_kwds(
-#         tsutils.read_iso_ts(
+#         columnar.read_iso_ts(
 #             input_ts,
 #             skiprows=skiprows,
 #             names=names,
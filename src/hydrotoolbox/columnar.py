@@ -0,0 +1,454 @@
+"""Read and write flows as Parquet, Feather (Arrow) or NumPy files.
+
+Columnar files keep the numbers as binary columns, so they are read without
+parsing text and written without formatting every value.  Parquet and
+Feather need the optional pyarrow package, the NumPy formats only need
+numpy.  Flow archives (see `hydrotoolbox.archive`) are read as DataFrames
+over their memory-mapped flows.
+
+Numeric tables written as "csv", "tsv", "csv_nos" or "tsv_nos" text are
+formatted a block of rows at a time by `write_text`.
+"""
+
+__all__ = [
+    "FORMATS",
+    "printiso",
+    "read",
+    "read_iso_ts",
+    "to_frame",
+    "write",
+    "write_text",
+]
+
+import itertools
+import os
+import re
+import sys
+from collections.abc import Iterator
+
+import numpy as np
+import pandas as pd
+
+from hydrotoolbox import archive
+from hydrotoolbox.toolbox_utils.src.toolbox_utils import tsutils
+
+# The table formats written by `write` and the file extensions read by `read`.
+FORMATS = ("parquet", "feather", "npz")
+
+_EXTENSIONS = {
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".feather": "feather",
+    ".arrow": "feather",
+    ".npz": "npz",
+    ".npy": "npy",
+}
+
+# Key of the index in .npz files.
+_INDEX = "__index__"
+
+# The separators of the text formats written by `write_text`.
+_SEPARATORS = {"csv": ",", "tsv": "\t", "csv_nos": ",", "tsv_nos": "\t"}
+
+
+def _format(input_ts):
+    """The columnar format of a file name, or None."""
+    if not isinstance(input_ts, (str, os.PathLike)):
+        return None
+    return _EXTENSIONS.get(os.path.splitext(os.fspath(input_ts))[1].lower())
+
+
+def read(input_ts):
+    """Read a columnar file into a DataFrame.
+
+    Parameters
+    ----------
+    input_ts : str or os.PathLike
+        A ".parquet", ".pq", ".feather", ".arrow", ".npz" or ".npy" file,
+        or a ".flows" archive optionally followed by the columns to read,
+        like "realizations.flows,r0001,r0002".  Other inputs are returned
+        unchanged.
+
+    Returns
+    -------
+    flow
+        A DataFrame with the date/time index of the file.  Files without a
+        stored index, like Feather files or NumPy structured arrays, use a
+        first column of dates and times as the index.
+    """
+    name = archive.split_name(input_ts)
+    if name is not None:
+        path, columns = name
+        return archive.FlowArchive(path).frame(columns=columns)
+    fmt = _format(input_ts)
+    if fmt is None:
+        return input_ts
+    if fmt == "parquet":
+        flow = pd.read_parquet(input_ts)
+    elif fmt == "feather":
+        flow = pd.read_feather(input_ts)
+    elif fmt == "npz":
+        with np.load(input_ts) as arrays:
+            flow = pd.DataFrame(
+                {key: arrays[key] for key in arrays.files if key != _INDEX},
+                index=arrays[_INDEX] if _INDEX in arrays.files else None,
+            )
+    else:
+        flow = pd.DataFrame(np.load(input_ts))
+
+    if (
+        isinstance(flow.index, pd.RangeIndex)
+        and len(flow.columns) > 1
+        and pd.api.types.is_datetime64_any_dtype(flow.iloc[:, 0])
+    ):
+        flow = flow.set_index(flow.columns[0])
+    if isinstance(flow.index, pd.DatetimeIndex) and flow.index.name is None:
+        flow.index.name = "Datetime"
+    return flow
+
+
+def read_iso_ts(input_ts, **kwds):
+    """Like `tsutils.read_iso_ts`, also reading columnar files."""
+    return tsutils.read_iso_ts(read(input_ts), **kwds)
+
+
+def to_frame(result, headers=None, name="Value"):
+    """A DataFrame of a table, a list of rows, or a dictionary.
+
+    Parameters
+    ----------
+    result
+        A DataFrame or Series, a list of rows with `headers`, a
+        dictionary of columns or of single values, or an iterator of
+        DataFrames of consecutive rows.
+    headers : list
+        [optional, default is None]
+
+        The column names of a list of rows.  The first is used as the index.
+    name : str
+        [optional, default is "Value"]
+
+        The column name of a Series or a dictionary of single values.
+    """
+    if isinstance(result, pd.DataFrame):
+        return result
+    if isinstance(result, Iterator):
+        # The tables of the chunks of a record.
+        chunks = [to_frame(chunk, name=name) for chunk in result]
+        return pd.concat(chunks) if chunks else pd.DataFrame()
+    if isinstance(result, pd.Series):
+        return result.to_frame(result.name if result.name is not None else name)
+    if isinstance(result, dict):
+        try:
+            return pd.DataFrame(result)
+        except ValueError:
+            # A dictionary of scalars, such as one value for each threshold.
+            return pd.Series(result).to_frame(name)
+    frame = pd.DataFrame(list(result), columns=headers)
+    if headers is not None:
+        frame = frame.set_index(headers[0])
+    return frame
+
+
+def write(result, fmt, output, showindex=True):
+    """Write a table as a columnar file.
+
+    Parameters
+    ----------
+    result : pandas.DataFrame
+        The table.
+    fmt : str
+        One of "parquet", "feather" or "npz".
+    output : str, os.PathLike or binary file
+        Where to write.
+    showindex : bool or str
+        [optional, default is True]
+
+        False or "never" leaves out the index.
+    """
+    frame = result.copy()
+    frame.columns = [str(column) for column in frame.columns]
+    if showindex in (False, "never"):
+        frame = frame.reset_index(drop=True)
+    if fmt == "parquet":
+        frame.to_parquet(output)
+    elif fmt == "feather":
+        # Feather files have no index, so it is the first column.
+        if not isinstance(frame.index, pd.RangeIndex):
+            frame = frame.reset_index()
+        frame.to_feather(output)
+    elif fmt == "npz":
+        arrays = {}
+        if not isinstance(frame.index, pd.RangeIndex):
+            arrays[_INDEX] = _array(frame.index.to_series())
+        for column in frame.columns:
+            arrays[column] = _array(frame[column])
+        np.savez(output, **arrays)
+    else:
+        raise ValueError(
+            tsutils.error_wrapper(
+                f"""
+                The columnar format must be one of {FORMATS}, instead of
+                {fmt}.
+                """
+            )
+        )
+
+
+def _array(values):
+    """A NumPy array of a Series that loads without pickle."""
+    if isinstance(values.dtype, pd.api.extensions.ExtensionDtype) and (
+        pd.api.types.is_numeric_dtype(values.dtype)
+    ):
+        # Nullable columns keep their dtype unless NaN is needed.
+        if values.hasnans:
+            return values.to_numpy(dtype="float64", na_value=np.nan)
+        return values.to_numpy(dtype=values.dtype.numpy_dtype)
+    values = values.to_numpy()
+    if values.dtype == object:
+        return values.astype(str)
+    return values
+
+
+def _index_name(index):
+    """The index name that `tsutils.printiso` writes."""
+    if index.name and "Datetime" in str(index.name):
+        return index.name
+    if isinstance(index, pd.DatetimeIndex):
+        return f"Datetime:{index.tz}" if index.tz else "Datetime"
+    if isinstance(index, pd.PeriodIndex):
+        return "Period"
+    return "UniqueID"
+
+
+def _date_probe(index):
+    """The date/times that decide the format of a date/time index.
+
+    `DatetimeIndex.astype(str)` writes every date/time with a time if any
+    has one, and with the digits of seconds that the finest one needs, so
+    a block formatted after these is formatted like the whole index.
+    """
+    if not isinstance(index, pd.DatetimeIndex) or len(index) == 0:
+        return None
+    positions = [0, *np.flatnonzero(index != index.normalize())[:1]]
+    nanoseconds = index.as_unit("ns").asi8
+    for digits in (1_000, 1_000_000, 1_000_000_000):
+        finer = np.flatnonzero(nanoseconds % digits)
+        if len(finer):
+            positions.append(finer[0])
+            break
+    return index[positions]
+
+
+def _dates_text(dates, probe):
+    """The date/times as `DatetimeIndex.astype(str)` of an index with probe."""
+    if probe is None:
+        return dates.astype(str)
+    return probe.append(dates).astype(str)[len(probe) :]
+
+
+def _same_format(dates, probe):
+    """Whether the format of `dates` is kept with the date/times of probe."""
+    if dates is None or probe is None:
+        return True
+    text = dates.astype(str)
+    return bool((dates.append(probe).astype(str)[: len(dates)] == text).all())
+
+
+def _conversion(values, float_format):
+    """The printf conversion of a numeric column or index, or None."""
+    dtype = values.dtype
+    if pd.api.types.is_bool_dtype(dtype) or not pd.api.types.is_numeric_dtype(dtype):
+        return None
+    if pd.api.types.is_float_dtype(dtype):
+        return f"%{float_format}"
+    if values.hasnans:
+        return None
+    return "%d"
+
+
+def write_text(
+    result,
+    sep=",",
+    float_format="g",
+    date_format=None,
+    showindex=True,
+    chunksize=10000,
+    header=True,
+    dates=None,
+):
+    """Write a numeric table as separated text to standard output.
+
+    The output is the same as `tsutils.printiso` with a "csv" or "tsv"
+    `tablefmt`, but every block of `chunksize` rows is formatted with one
+    string operation and written before the next is formatted.
+
+    Parameters
+    ----------
+    result : pandas.DataFrame or pandas.Series
+        The table, with a date/time or numeric index and numeric columns.
+    sep : str
+        [optional, default is ","]
+
+        The separator of the values.
+    float_format : str
+        [optional, default is "g"]
+
+        The printf conversion of floats, without the "%".
+    date_format : str
+        [optional, default is ISO 8601]
+
+        The strftime format of a date/time index.
+    showindex : bool or str
+        [optional, default is True]
+
+        False or "never" leaves out the index.
+    chunksize : int
+        [optional, default is 10000]
+
+        The number of rows formatted at a time.
+    header : bool
+        [optional, default is True]
+
+        Write the header line, which is left out to continue a table.
+    dates : pandas.DatetimeIndex
+        [optional, default is the index of the table]
+
+        The date/times that the format of a date/time index is decided by,
+        so the pieces of a table are written in the same format.
+
+    Returns
+    -------
+    written
+        False, writing nothing, if the table has other columns or index than
+        `write_text` can format, otherwise True.
+    """
+    frame = to_frame(result)
+    showindex = showindex not in (False, "never")
+    index = frame.index
+    if (
+        frame.columns.empty
+        or frame.columns.nlevels > 1
+        or isinstance(index, pd.MultiIndex)
+    ):
+        return False
+
+    conversions = [_conversion(frame[column], float_format) for column in frame]
+    if showindex:
+        if isinstance(index, pd.DatetimeIndex):
+            index_conversion = "%s"
+        else:
+            index_conversion = _conversion(index, float_format)
+        conversions.insert(0, index_conversion)
+    if None in conversions or frame.columns.duplicated().any():
+        return False
+
+    # One date/time format for all of the blocks.
+    probe = _date_probe(index if dates is None else dates)
+    output = sys.stdout
+    if header:
+        frame.iloc[:0].rename_axis(_index_name(index)).to_csv(
+            output, sep=sep, index=showindex, lineterminator=os.linesep
+        )
+
+    row = sep.join(conversions) + os.linesep
+    escaped = re.escape(sep)
+    # Missing values are empty like in `DataFrame.to_csv`.
+    missing = re.compile(rf"(?m)(?:^|(?<={escaped}))nan(?={escaped}|$)")
+    values = [
+        frame[column].to_numpy(dtype="float64", na_value=np.nan)
+        if conversion != "%d"
+        else frame[column].to_numpy()
+        for column, conversion in zip(frame.columns, conversions[showindex:])
+    ]
+    for start in range(0, len(frame), chunksize):
+        stop = min(start + chunksize, len(frame))
+        fields = np.empty((stop - start, len(conversions)), dtype=object)
+        if showindex:
+            labels = index[start:stop]
+            if isinstance(labels, pd.DatetimeIndex):
+                labels = (
+                    _dates_text(labels, probe)
+                    if date_format is None
+                    else labels.strftime(date_format)
+                )
+            fields[:, 0] = labels
+        for position, column in enumerate(values, start=int(showindex)):
+            fields[:, position] = column[start:stop]
+        text = (row * (stop - start)) % tuple(fields.ravel().tolist())
+        output.write(missing.sub("", text))
+    return True
+
+
+def printiso(result, tablefmt="csv", headers=None, showindex=True, **kwds):
+    """Like `tsutils.printiso`, also writing columnar formats.
+
+    The columnar formats in `FORMATS` are written as binary to standard
+    output, to be redirected to a file, and numeric tables in the text
+    formats "csv", "tsv", "csv_nos" and "tsv_nos" by `write_text`.  An
+    iterator of DataFrames of consecutive rows is written in those text
+    formats as each DataFrame is made, and otherwise as one table.
+    """
+    if isinstance(result, Iterator) and tablefmt in _SEPARATORS:
+        text_kwds = {
+            key: kwds[key] for key in ("float_format", "date_format") if key in kwds
+        }
+        chunks = iter(result)
+        first = next(chunks, None)
+        if first is not None and write_text(
+            first, sep=_SEPARATORS[tablefmt], showindex=showindex, **text_kwds
+        ):
+            # The date/times of the first chunk decide the format of all.
+            dates = _date_probe(to_frame(first).index)
+            for chunk in chunks:
+                chunk = to_frame(chunk)
+                if "date_format" not in text_kwds and not _same_format(
+                    dates, _date_probe(chunk.index)
+                ):
+                    raise ValueError(
+                        tsutils.error_wrapper(
+                            """
+                            The date/times of every chunk must be written in
+                            the format of the first, with or without times
+                            and digits of seconds, or give a date_format.
+                            """
+                        )
+                    )
+                if not write_text(
+                    chunk,
+                    sep=_SEPARATORS[tablefmt],
+                    showindex=showindex,
+                    header=False,
+                    dates=dates,
+                    **text_kwds,
+                ):
+                    raise ValueError(
+                        tsutils.error_wrapper(
+                            """
+                            The columns of every chunk must be numeric
+                            like the first.
+                            """
+                        )
+                    )
+            return
+        result = to_frame(itertools.chain([] if first is None else [first], chunks))
+    elif isinstance(result, Iterator):
+        result = to_frame(result)
+    if tablefmt in _SEPARATORS and isinstance(result, (pd.DataFrame, pd.Series)):
+        text_kwds = {
+            key: kwds[key] for key in ("float_format", "date_format") if key in kwds
+        }
+        if write_text(
+            result, sep=_SEPARATORS[tablefmt], showindex=showindex, **text_kwds
+        ):
+            return
+    if tablefmt not in FORMATS:
+        if headers is not None:
+            kwds["headers"] = headers
+        tsutils.printiso(result, tablefmt=tablefmt, showindex=showindex, **kwds)
+        return
+    if not isinstance(headers, list):
+        headers = None
+    output = getattr(sys.stdout, "buffer", sys.stdout)
+    write(to_frame(result, headers=headers), tablefmt, output, showindex=showindex)
+    output.flush()
@@ -10,6 +10,7 @@ hydrotoolbox recession"""
 
 __all__ = [
     "about",
+    "exceedance_events",
     "exceedance_time",
     "flow_duration",
     "indices",
@@ -17,11 +18,13 @@ __all__ = [
     "storm_events",
 ]
 
+import concurrent.futures
 import datetime
 import itertools
 import os.path
 import re
 import sys
+import tempfile
 import warnings
 from argparse import RawTextHelpFormatter
 from typing import Literal
@@ -34,17 +37,24 @@ try:
 except ImportError:
     from pydantic import validate_arguments as validate_call
 
-from scipy.signal import find_peaks
-
-from hydrotoolbox import baseflow_sep
-from hydrotoolbox.baseflow.comparison import strict_baseflow
-from hydrotoolbox.baseflow.param_estimate import recession_coefficient
+from hydrotoolbox import archive, columnar
 from hydrotoolbox.indices import indices as ind
+from hydrotoolbox.peaks import storm_peaks
 from hydrotoolbox.toolbox_utils.src.toolbox_utils import tsutils
 
 warnings.filterwarnings("ignore")
 
 
+# scipy.signal and the baseflow package are only imported by the functions
+# that use them, so the command line starts without them.
+def __getattr__(name):
+    if name == "baseflow_sep":
+        from hydrotoolbox import baseflow_sep
+
+        return baseflow_sep
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def atoi(text):
     """Support for the natural_keys sorting function."""
     return int(text) if text.isdigit() else text
@@ -71,6 +81,7 @@ def recession(
     index_type="datetime",
     names=None,
     target_units=None,
+    n_jobs=1,
 ):
     """
     Recession coefficient.
@@ -94,9 +105,14 @@ def recession(
     ${index_type}
     ${names}
     ${target_units}
+    n_jobs : int
+        [optional, default=1]
+
+        The number of threads that compute the recession coefficients of
+        the columns at the same time, or -1 for one thread for each CPU.
     """
     flow = tsutils.common_kwds(
-        tsutils.read_iso_ts(
+        columnar.read_iso_ts(
             input_ts,
             skiprows=skiprows,
             names=names,
@@ -111,12 +127,36 @@ def recession(
         source_units=source_units,
         target_units=target_units,
     )
-    rc = {}
-    for col in flow.columns:
-        val = flow.loc[:, col].astype("float64").values
-        strict = strict_baseflow(val)
-        rc[col] = [recession_coefficient(val, strict, date, ice_period)]
-    return rc
+    from hydrotoolbox.baseflow.comparison import strict_baseflow
+    from hydrotoolbox.baseflow.param_estimate import recession_coefficient
+
+    n_jobs = int(n_jobs)
+    if n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+    if n_jobs < 1:
+        raise ValueError(
+            tsutils.error_wrapper(
+                f"""
+                The n_jobs must be a positive number of threads or -1,
+                instead of {n_jobs}.
+                """
+            )
+        )
+
+    # One column major copy of the flows, so every column is contiguous.
+    values = np.asfortranarray(flow.to_numpy(dtype="float64", na_value=np.nan))
+
+    def coefficient(position):
+        val = values[:, position]
+        return [recession_coefficient(val, strict_baseflow(val), date, ice_period)]
+
+    positions = range(values.shape[1])
+    if n_jobs == 1 or len(positions) < 2:
+        return dict(zip(flow.columns, map(coefficient, positions)))
+    # NumPy releases the GIL in the array operations, so the columns are
+    # computed by threads without copying the flows to other processes.
+    with concurrent.futures.ThreadPoolExecutor(n_jobs) as executor:
+        return dict(zip(flow.columns, executor.map(coefficient, positions)))
 
 
 @tsutils.doc(tsutils.docstrings)
@@ -134,6 +174,8 @@ def flow_duration(
     index_type="datetime",
     names=None,
     target_units=None,
+    chunksize=None,
+    groupby=None,
 ):
     """
     Flow duration.
@@ -156,28 +198,394 @@ def flow_duration(
     ${index_type}
     ${names}
     ${target_units}
+    chunksize : int
+        [optional, default=None]
+
+        Read and sort the flows `chunksize` rows at a time instead of all at
+        once.  The sorted chunks are kept in temporary files and the flow
+        duration values are selected from them, so memory is bounded by the
+        chunk size and the result is the same as without `chunksize`.  Only
+        ".csv", ".txt" and ".dat" files, flow archives, standard input and
+        DataFrames are read in chunks, each by the same reader as the whole
+        input, and `clean` only applies within each chunk.
+    groupby : str
+        [optional, default=None]
+
+        Flow duration of each group of flows instead of the whole record,
+        returned with the group as the first level of the index.  One of
+        "month" (calendar month 1 to 12), "season" ("DJF", "MAM", "JJA" or
+        "SON"), "water_year" (October to September, labeled with the year it
+        ends in), "year", or a pandas offset alias such as "MS", "QS-OCT" or
+        "YS-OCT" for consecutive periods labeled by their start.  Fixed
+        length periods such as "7D" start from 1970-01-01, like
+        `resample(origin="epoch")`, and multiples of calendar periods such
+        as "2MS" can not be used with `chunksize`.
     """
-    flow = tsutils.common_kwds(
-        tsutils.read_iso_ts(
-            input_ts,
-            skiprows=skiprows,
-            names=names,
-            index_type=index_type,
-        ),
-        start_date=start_date,
-        end_date=end_date,
-        pick=columns,
-        round_index=round_index,
-        dropna=dropna,
-        clean=clean,
-        source_units=source_units,
-        target_units=target_units,
+    named = (None, "season", *_FLOW_GROUP_NAMES)
+    if chunksize is not None and groupby not in named:
+        offset = _flow_group_offset(groupby)
+        if not isinstance(offset, _FIXED_OFFSETS) and offset.n != 1:
+            raise ValueError(
+                tsutils.error_wrapper(
+                    f"""
+                    The periods of a multiple of a calendar offset like
+                    {groupby} start from the first period of each chunk, so
+                    they can not be used with chunksize.
+                    """
+                )
+            )
+    if chunksize is None:
+        chunks = [input_ts]
+    else:
+        chunks = _flow_chunks(input_ts, int(chunksize), skiprows)
+    flows = (
+        tsutils.common_kwds(
+            columnar.read_iso_ts(
+                chunk,
+                skiprows=skiprows,
+                names=names,
+                index_type=index_type,
+            ),
+            start_date=start_date,
+            end_date=end_date,
+            pick=columns,
+            round_index=round_index,
+            dropna=dropna,
+            clean=clean,
+            source_units=source_units,
+            target_units=target_units,
+        )
+        for chunk in chunks
     )
     exceedance_probabilities = np.array(exceedance_probabilities) / 100
-    ndf = flow.quantile((1 - exceedance_probabilities), axis="rows")
-    ndf.index = exceedance_probabilities
-    ndf.index.name = "Quantiles"
-    return ndf
+    quantiles = 1 - exceedance_probabilities
+    if chunksize is not None:
+        results = _chunked_quantiles(flows, quantiles, groupby)
+    elif groupby is not None:
+        results = _grouped_quantiles(next(flows), quantiles, groupby)
+    else:
+        ndf = next(flows).quantile(quantiles, axis="rows")
+        ndf.index = exceedance_probabilities
+        ndf.index.name = "Quantiles"
+        return ndf
+
+    frames = {}
+    for (key, column), values in results.items():
+        frames.setdefault(key, {})[column] = values
+    frames = {
+        key: pd.DataFrame(
+            frames[key],
+            index=pd.Index(exceedance_probabilities, name="Quantiles"),
+        )
+        for key in sorted(frames, key=lambda key: (key is None, key))
+    }
+    if groupby is None or not frames:
+        return frames.get(None, pd.DataFrame(index=exceedance_probabilities))
+    return pd.concat(
+        frames.values(),
+        keys=_flow_group_labels(list(frames), groupby),
+        names=[_FLOW_GROUP_NAMES.get(groupby, "Period"), "Quantiles"],
+    )
+
+
+_FLOW_GROUP_NAMES = {
+    "month": "Month",
+    "season": "Season",
+    "water_year": "Water year",
+    "year": "Year",
+}
+
+_SEASONS = np.array(["DJF", "MAM", "JJA", "SON"])
+
+# The offsets of periods of a fixed length, as days are since pandas 3.
+_FIXED_OFFSETS = (pd.offsets.Tick, pd.offsets.Day)
+
+
+def _flow_group_keys(index, groupby):
+    """Sortable group key of each time of the index."""
+    index = pd.DatetimeIndex(index)
+    if groupby == "month":
+        return np.asarray(index.month)
+    if groupby == "season":
+        return np.asarray(index.month % 12 // 3)
+    if groupby == "water_year":
+        return np.asarray(index.year + (index.month >= 10))
+    if groupby == "year":
+        return np.asarray(index.year)
+    offset = _flow_group_offset(groupby)
+    if len(index) == 0:
+        return np.asarray(index)
+    if isinstance(offset, _FIXED_OFFSETS):
+        # Fixed length periods start from the epoch, like
+        # resample(origin="epoch"), so they do not depend on the first time
+        # of the record or of a chunk.
+        return np.asarray(index.floor(offset))
+    # Calendar period starts from the first time of the record, each time
+    # goes with the last period start at or before it.
+    starts = pd.date_range(
+        offset.rollback(index.min().normalize()), index.max(), freq=offset
+    )
+    return np.asarray(starts[starts.searchsorted(index, side="right") - 1])
+
+
+def _flow_group_offset(groupby):
+    """The pandas offset of a groupby offset alias."""
+    try:
+        return pd.tseries.frequencies.to_offset(groupby)
+    except ValueError as exc:
+        raise ValueError(
+            tsutils.error_wrapper(
+                f"""
+                The groupby must be "month", "season", "water_year", "year"
+                or a pandas offset alias, instead of {groupby}.
+                """
+            )
+        ) from exc
+
+
+def _flow_group_labels(keys, groupby):
+    """Group labels of sorted group keys."""
+    if groupby == "season":
+        return _SEASONS[keys].tolist()
+    if groupby in _FLOW_GROUP_NAMES:
+        return keys
+    return list(pd.DatetimeIndex(keys))
+
+
+def _grouped_quantiles(flow, quantiles, groupby):
+    """Linear quantiles of each group of each column in one sorted pass.
+
+    Values are sorted by group and then by value, so each group is a sorted
+    slice and all of the quantiles of all of the groups are gathered at once.
+    """
+    codes, keys = pd.factorize(_flow_group_keys(flow.index, groupby), sort=True)
+    results = {}
+    for column in flow.columns:
+        values = flow[column].to_numpy(dtype="float64", na_value=np.nan)
+        present = ~np.isnan(values)
+        order = np.lexsort((values[present], codes[present]))
+        values = values[present][order]
+        counts = np.bincount(codes[present], minlength=len(keys))
+        starts = np.cumsum(counts) - counts
+
+        # Empty groups gather from the first value and are masked after.
+        values = np.append(values, np.nan)
+        position = quantiles[np.newaxis, :] * (counts[:, np.newaxis] - 1)
+        lower = np.floor(position).astype("int64")
+        upper = np.minimum(lower + 1, counts[:, np.newaxis] - 1)
+        below = values[np.maximum(starts[:, np.newaxis] + lower, 0)]
+        above = values[np.maximum(starts[:, np.newaxis] + upper, 0)]
+        quantile = below + (above - below) * (position - lower)
+        quantile[counts == 0] = np.nan
+        for key, row in zip(keys, quantile):
+            results[(key, column)] = row
+    return results
+
+
+def _flow_chunks(input_ts, chunksize, skiprows):
+    """Pieces of `chunksize` rows of the input.
+
+    Text files and standard input are split into files of the header line
+    and `chunksize` lines, so that `columnar.read_iso_ts` reads each chunk
+    like the whole input.
+    """
+    if isinstance(input_ts, (pd.DataFrame, pd.Series)):
+        for start in range(0, len(input_ts), chunksize):
+            yield input_ts.iloc[start : start + chunksize]
+        return
+    name = archive.split_name(input_ts)
+    if name is not None:
+        path, columns = name
+        yield from archive.FlowArchive(path).chunks(chunksize, columns=columns)
+        return
+    if input_ts == "-":
+        yield from _text_chunks(sys.stdin, chunksize)
+    elif (
+        isinstance(input_ts, str)
+        and os.path.splitext(input_ts)[1].lower() in _TEXT_EXTENSIONS
+        and os.path.exists(input_ts)
+    ):
+        with open(input_ts, encoding="utf-8") as fpi:
+            yield from _text_chunks(fpi, chunksize)
+    else:
+        # Other formats can't be read in pieces.
+        yield from _flow_chunks(
+            columnar.read_iso_ts(input_ts, skiprows=skiprows), chunksize, None
+        )
+
+
+# The files that tsutils.read_iso_ts reads as comma separated text.
+_TEXT_EXTENSIONS = (".csv", ".txt", ".dat")
+
+
+def _text_chunks(lines, chunksize):
+    """Files of the header line and each `chunksize` lines after it.
+
+    The same temporary file is written for each chunk, so each must be read
+    before the next is taken.
+    """
+    header = next(lines, None)
+    if header is None:
+        return
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "chunk.csv")
+        while True:
+            rows = list(itertools.islice(lines, chunksize))
+            if not rows:
+                return
+            with open(path, "w", encoding="utf-8") as fpo:
+                fpo.write(header)
+                fpo.writelines(rows)
+            yield path
+
+
+def _chunked_quantiles(flows, quantiles, groupby=None):
+    """Exact linear quantiles of each column from sorted runs on disk.
+
+    Each chunk of each column (and of each group when `groupby` is given) is
+    sorted and saved as a run.  The flows on either side of each quantile
+    position are then found by selection over the memory mapped runs, as
+    with `pandas.DataFrame.quantile`.
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        runs = {}
+        numbers = itertools.count()
+        for flow in flows:
+            if groupby is None:
+                codes, keys = np.zeros(len(flow), dtype="int64"), [None]
+            else:
+                codes, keys = pd.factorize(
+                    _flow_group_keys(flow.index, groupby), sort=True
+                )
+            for column in flow.columns:
+                values = flow[column].to_numpy(dtype="float64", na_value=np.nan)
+                present = ~np.isnan(values)
+                order = np.lexsort((values[present], codes[present]))
+                values = values[present][order]
+                counts = np.bincount(codes[present], minlength=len(keys))
+                for key, run in zip(keys, np.split(values, np.cumsum(counts)[:-1])):
+                    runs.setdefault((key, column), [])
+                    if len(run) > 0:
+                        filename = os.path.join(tmpdir, str(next(numbers)))
+                        np.save(filename, run)
+                        runs[key, column].append(
+                            np.load(f"{filename}.npy", mmap_mode="r")
+                        )
+
+        # The memory maps are released before the files are removed.
+        return {name: _runs_quantiles(runs.pop(name), quantiles) for name in list(runs)}
+
+
+def _runs_quantiles(runs, quantiles):
+    """Linear quantiles of the values of sorted runs."""
+    total = sum(len(run) for run in runs)
+    if total == 0:
+        return np.full(len(quantiles), np.nan)
+    position = quantiles * (total - 1)
+    lower = np.floor(position).astype("int64")
+    upper = np.minimum(lower + 1, total - 1)
+    values = _select_ranks(runs, np.concatenate([lower, upper]))
+    below, above = values[: len(lower)], values[len(lower) :]
+    return below + (above - below) * (position - lower)
+
+
+def _select_ranks(runs, ranks):
+    """The values of the `ranks` (from 0) among the values of sorted runs.
+
+    Each step takes the weighted median of the middle values of the part of
+    each run that can still hold some of the ranks as the pivot, which
+    removes at least a quarter of the remaining values.  The ranks below and
+    above the pivot go on to separate steps, so the steps that narrow the
+    runs are shared by all of the ranks.
+    """
+    ranks = np.asarray(ranks, dtype="int64")
+    values = np.empty(len(ranks))
+    highs = np.array([len(run) for run in runs], dtype="int64")
+    # The bounds of the runs that hold the ranks at positions `which`.
+    steps = [(np.zeros_like(highs), highs, np.arange(len(ranks)))]
+    while steps:
+        lows, highs, which = steps.pop()
+        active = np.flatnonzero(highs > lows)
+        middles = np.array([runs[i][(lows[i] + highs[i]) // 2] for i in active])
+        order = np.argsort(middles, kind="stable")
+        weights = np.cumsum((highs - lows)[active][order])
+        pivot = middles[order][np.searchsorted(weights, weights[-1] / 2)]
+
+        less = np.array([np.searchsorted(run, pivot, side="left") for run in runs])
+        more = np.array([np.searchsorted(run, pivot, side="right") for run in runs])
+        below = ranks[which] < less.sum()
+        above = ranks[which] >= more.sum()
+        values[which[~below & ~above]] = pivot
+        if below.any():
+            steps.append((lows, np.minimum(highs, less), which[below]))
+        if above.any():
+            steps.append((np.maximum(lows, more), highs, which[above]))
+    return values
+
+
+def _storm_event_ids(values, rise_lag, fall_lag, min_peak, window):
+    """Storm event number of each value, or 0 outside of the storm events."""
+    peaks = storm_peaks(values, min_peak, window)
+
+    # Union of the storm windows from the running sum of a difference array
+    # of window starts and ends, with the windows clipped to the series.
+    nvalues = len(values)
+    starts = np.clip(peaks - rise_lag, 0, nvalues)
+    ends = np.clip(peaks + fall_lag + 1, 0, nvalues)
+    inside = (
+        np.cumsum(
+            np.bincount(starts, minlength=nvalues + 1)
+            - np.bincount(ends, minlength=nvalues + 1)
+        )[:nvalues]
+        > 0
+    )
+
+    # Each contiguous run of storm values is one event.
+    first = inside & ~np.concatenate([[False], inside[:-1]])
+    return np.where(inside, np.cumsum(first), 0)
+
+
+def _storm_summary(flow, events):
+    """Summary statistics of each storm event with grouped reductions."""
+    summaries = []
+    for column, ids in events.items():
+        inside = ids > 0
+        values = flow[column].to_numpy(dtype="float64", na_value=np.nan)[inside]
+        times = flow.index[inside]
+        ids = ids[inside]
+
+        # Trapezoid between consecutive values of the same event.
+        seconds = (times[1:] - times[:-1]).total_seconds().to_numpy()
+        same = ids[1:] == ids[:-1]
+        area = np.where(same, (values[1:] + values[:-1]) / 2 * seconds, 0.0)
+
+        group = pd.DataFrame({"Event": ids, "Time": times, "Flow": values}).groupby(
+            "Event"
+        )
+        # The positions of the peaks, skipping missing flows in an event.
+        flows = pd.Series(values).dropna()
+        peak = flows.groupby(ids[flows.index]).idxmax()
+        summary = pd.DataFrame(
+            {
+                "Start": group["Time"].first(),
+                "End": group["Time"].last(),
+                "Peak": group["Flow"].max(),
+                "Peak time": times[peak.to_numpy()],
+                "Volume": pd.Series(area).groupby(ids[:-1]).sum(),
+            }
+        )
+        summary["Volume"] = summary["Volume"].fillna(0.0)
+        summary.insert(2, "Duration", summary["End"] - summary["Start"])
+        summary.insert(5, "Rise", summary["Peak time"] - summary["Start"])
+        summary.insert(6, "Fall", summary["End"] - summary["Peak time"])
+        summaries.append(summary.rename_axis("Event").reset_index())
+    if len(summaries) == 1:
+        return summaries[0]
+    return (
+        pd.concat(summaries, keys=flow.columns, names=["Column", None])
+        .reset_index(level=0)
+        .reset_index(drop=True)
+    )
 
 
 @tsutils.doc(tsutils.docstrings)
@@ -198,10 +606,16 @@ def storm_events(
     index_type="datetime",
     names=None,
     target_units=None,
+    summary=False,
 ):
     """
     Storm events.
 
+    The storm window of each peak includes `rise_lag` terms before and
+    `fall_lag` terms after the peak.  Overlapping or adjacent windows are
+    combined into one storm event.  Each selected column is processed
+    separately.
+
     Parameters
     ----------
     rise_lag : int
@@ -213,7 +627,7 @@ def storm_events(
     min_peak : int, float
         [optional, default=0]
 
-        All detected storm peaks in the hydrograph must be greater than
+        All detected storm peaks in the hydrograph must be at least
         `min_peak`.
     window : int
         [optional, default=1]
@@ -232,12 +646,37 @@ def storm_events(
     ${index_type}
     ${names}
     ${target_units}
+    summary : bool
+        [optional, default=False]
+
+        If False, return the time series terms within the storm events.  If
+        True, return a summary of each storm event.
+
+    Returns
+    -------
+    storms
+        If `summary` is False, a DataFrame of the time series terms that are
+        within a storm event of any column.  Each column is followed by
+        a "<column>_event" column with the event number, counting from 1
+        for each column.  Terms that are not within a storm event of
+        a column are missing for that column.
+
+        If `summary` is True, a DataFrame with one row for each storm event
+        and the columns "Event", "Start", "End", "Duration", "Peak", "Peak
+        time", "Rise", "Fall" and "Volume".  The "Duration", "Rise" and
+        "Fall" are the times from the start to the end, the start to the
+        peak, and the peak to the end.  The "Volume" is the trapezoidal
+        integral of the flow over the event in flow units times seconds.  If
+        more than one column is selected, the first column, "Column", is the
+        name of the column.
     """
+    rise_lag = int(float(rise_lag))
+    fall_lag = int(float(fall_lag))
     if rise_lag < 0 or fall_lag < 0:
         raise ValueError("rise_lag and fall_lag must be greater than 0.")
 
     flow = tsutils.common_kwds(
-        tsutils.read_iso_ts(
+        columnar.read_iso_ts(
             input_ts,
             skiprows=skiprows,
             names=names,
@@ -252,23 +691,30 @@ def storm_events(
         source_units=source_units,
         target_units=target_units,
     )
-    if min_peak is None:
-        min_peak = flow.median()
-    peaks, _ = find_peaks(
-        flow.iloc[:, 0].astype("float64"), distance=window, height=min_peak
-    )
-    collected = set()
-    for peak in peaks:
-        collected.update(
-            range(peak - int(float(rise_lag)), peak + int(float(fall_lag)) + 1)
+    events = {
+        column: _storm_event_ids(
+            flow[column].to_numpy(dtype="float64", na_value=np.nan),
+            rise_lag,
+            fall_lag,
+            flow[column].median() if min_peak is None else min_peak,
+            window,
         )
-    index = sorted(list(collected))
-    ndf = pd.DataFrame(flow.iloc[index, 0])
-    ndf.columns = flow.columns
+        for column in flow.columns
+    }
+    if summary is True:
+        return _storm_summary(flow, events)
+
+    inside = np.logical_or.reduce([ids > 0 for ids in events.values()])
+    ndf = pd.DataFrame(index=flow.index[inside])
+    for column, ids in events.items():
+        ndf[column] = flow[column].where(ids > 0)[inside]
+        ndf[f"{column}_event"] = pd.Series(ids, index=flow.index, dtype="Int64").where(
+            ids > 0
+        )[inside]
     return ndf
 
 
-@tsutils.transform_args(indice_codes=tsutils.make_list)
+@tsutils.transform_args(indice_codes=tsutils.make_list, drainage_area=tsutils.make_list)
 @tsutils.doc(tsutils.docstrings)
 def indices(
     *indice_codes,
@@ -659,7 +1105,9 @@ def indices(
         [optional, default=1]
 
         The drainage area to use for the calculations.  This is the drainage
-        area in square miles.
+        area in square miles.  If more than one column is selected then
+        either a single drainage area for all columns or a list with one
+        drainage area for each column.
     ${input_ts}
     ${columns}
     ${source_units}
@@ -673,11 +1121,18 @@ def indices(
     ${names}
     ${target_units}
     ${print_input}
+
+    Returns
+    -------
+    indices
+        If one column is selected, a dictionary of "CODE: description" keys
+        and index values.  If more than one column is selected, a station x
+        index DataFrame with the same "CODE: description" column names.
     """
 
     indice_codes = list(indice_codes)
     flow = tsutils.common_kwds(
-        tsutils.read_iso_ts(
+        columnar.read_iso_ts(
             input_ts,
             skiprows=skiprows,
             names=names,
@@ -692,9 +1147,31 @@ def indices(
         source_units=source_units,
         target_units=target_units,
     )
-    indice_class = ind.Indices(
-        flow, water_year=water_year, use_median=use_median, drainage_area=drainage_area
-    )
+    if drainage_area is None:
+        drainage_area = [1]
+    if len(drainage_area) not in (1, len(flow.columns)):
+        raise ValueError(
+            tsutils.error_wrapper(
+                f"""
+                Give one drainage area for all columns or one for each of the
+                {len(flow.columns)} columns, instead of {len(drainage_area)}.
+                """
+            )
+        )
+    if len(flow.columns) > 1:
+        indice_class = ind.MultiIndices(
+            flow,
+            water_year=water_year,
+            use_median=use_median,
+            drainage_area=drainage_area if len(drainage_area) > 1 else drainage_area[0],
+        )
+    else:
+        indice_class = ind.Indices(
+            flow,
+            water_year=water_year,
+            use_median=use_median,
+            drainage_area=drainage_area[0],
+        )
 
     sclasses = [
         "HARSH_INTERMITTENT",
@@ -1027,10 +1504,145 @@ def indices(
         "RA9": "CV: number of flow reversals from one day to the next",
     }
 
-    return {
+    results = {
         f"{icode}: {description[icode]}": getattr(indice_class, icode)()
         for icode in indice_codes + sorted(class_codes, key=natural_keys)
     }
+    if isinstance(indice_class, ind.MultiIndices):
+        return pd.DataFrame(results, index=flow.columns)
+    return results
+
+
+def _time_unit(time_units):
+    """Length of one of the exceedance `time_units`."""
+    year = datetime.timedelta(days=365, hours=6, minutes=9, seconds=9)
+    return {
+        "year": year,
+        "month": year / 12,
+        "day": datetime.timedelta(days=1),
+        "hour": datetime.timedelta(hours=1),
+        "min": datetime.timedelta(minutes=1),
+        "sec": datetime.timedelta(seconds=1),
+        "years": year,
+        "months": year / 12,
+        "days": datetime.timedelta(days=1),
+        "hours": datetime.timedelta(hours=1),
+        "mins": datetime.timedelta(minutes=1),
+        "secs": datetime.timedelta(seconds=1),
+    }.get(time_units, time_units)
+
+
+def _exceedance_periods(times, values, thresholds, under_over):
+    """Periods that `values` are over (or under) each of the `thresholds`.
+
+    `times` are the integer times of the `values` and `thresholds` must be
+    sorted and unique.  Each interval between consecutive values crosses the
+    contiguous range of thresholds between its two values, so the crossings
+    of all thresholds are found in one pass over the intervals.  The time
+    of each crossing is linearly interpolated within the interval and
+    truncated to whole time units.
+
+    Returns the threshold position, the positions of the first and last
+    values, and the interpolated times before the first and after the last
+    value of each period, sorted by threshold position then time.
+    """
+    side = "right" if under_over == "over" else "left"
+    lo = np.minimum(values[:-1], values[1:])
+    hi = np.maximum(values[:-1], values[1:])
+    first = np.searchsorted(thresholds, lo, side=side)
+    count = np.searchsorted(thresholds, hi, side=side) - first
+
+    # One (interval, threshold) pair for each crossing.
+    interval = np.repeat(np.arange(len(count)), count)
+    ithresh = np.repeat(first - np.cumsum(count) + count, count) + np.arange(
+        count.sum()
+    )
+    flow = thresholds[ithresh]
+    before = values[interval]
+    after = values[interval + 1]
+    delta = np.diff(times)[interval]
+    into = after >= flow if under_over == "over" else after <= flow
+    part = np.where(
+        into,
+        (after - flow) / (after - before) * delta,
+        (before - flow) / (before - after) * delta,
+    )
+    part = np.trunc(part).astype("int64")
+
+    # Periods already in progress at the first value or still in progress at
+    # the last value.
+    ivalue = np.arange(len(thresholds))
+    if len(values) == 0:
+        ifirst = ilast = ivalue[:0]
+    elif under_over == "over":
+        ifirst = ivalue[: np.searchsorted(thresholds, values[0], side="right")]
+        ilast = ivalue[: np.searchsorted(thresholds, values[-1], side="right")]
+    else:
+        ifirst = ivalue[np.searchsorted(thresholds, values[0], side="left") :]
+        ilast = ivalue[np.searchsorted(thresholds, values[-1], side="left") :]
+
+    # The crossings are in time order, so a stable sort on the threshold
+    # position gives threshold then time order.  NumPy uses a radix sort for
+    # a stable sort of 16 bit integers.
+    key_type = "uint16" if len(thresholds) <= np.iinfo("uint16").max else "int64"
+
+    def _sorted(ithresh, ivalue, part):
+        order = np.argsort(ithresh.astype(key_type), kind="stable")
+        return ithresh[order], ivalue[order], part[order]
+
+    istart, start, start_part = _sorted(
+        np.concatenate([ifirst, ithresh[into]]),
+        np.concatenate([np.zeros(len(ifirst), dtype="int64"), interval[into] + 1]),
+        np.concatenate([np.zeros(len(ifirst), dtype="int64"), part[into]]),
+    )
+    _, end, end_part = _sorted(
+        np.concatenate([ithresh[~into], ilast]),
+        np.concatenate([interval[~into], np.full(len(ilast), len(values) - 1)]),
+        np.concatenate([part[~into], np.zeros(len(ilast), dtype="int64")]),
+    )
+    return istart, start, end, start_part, end_part
+
+
+def _exceedance_series(series, thresholds, under_over):
+    """The times, values, levels and periods of exceedance of one series.
+
+    All of the thresholds are processed together from one pass over the
+    crossings, with integer times at microsecond, or finer, resolution.
+    """
+    series = series.dropna()
+    unit = series.index.unit if series.index.unit in ("us", "ns") else "us"
+    times = series.index.as_unit(unit).asi8
+    values = series.to_numpy(dtype="float64")
+    levels = np.unique(thresholds)
+    periods = _exceedance_periods(times, values, levels, under_over)
+    return unit, times, values, levels, periods
+
+
+def _exceedance_table(series, thresholds, delays, under_over, punits):
+    """Exceedance time of one series for each threshold and delay."""
+    # The delay is subtracted from each period of exceedance.  A period still
+    # open at the end of the series is handled like the periods that close
+    # with a crossing.
+    unit, times, values, levels, periods = _exceedance_series(
+        series, thresholds, under_over
+    )
+    ithresh, start, end, start_part, end_part = periods
+    periods = start_part + times[end] - times[start] + end_part
+    bounds = np.searchsorted(ithresh, np.arange(len(levels) + 1))
+    if len(values) > 0:
+        mask = values[-1] >= levels if under_over == "over" else values[-1] <= levels
+    else:
+        mask = np.zeros(len(levels), dtype=bool)
+
+    e_table = {}
+    for flow, delay in zip(thresholds, delays):
+        delay = np.timedelta64(delay).astype(f"timedelta64[{unit}]").astype("int64")
+        pos = np.searchsorted(levels, flow)
+        duration = np.maximum(periods[bounds[pos] : bounds[pos + 1]] - delay, 0).sum()
+        if not mask[pos]:
+            duration += max(-delay, 0)
+        e_table[flow] = pd.Timedelta(int(duration), unit=unit) / punits
+    return e_table
 
 
 @validate_call
@@ -1101,9 +1713,16 @@ def exceedance_time(
     ${names}
     ${target_units}
     ${print_input}
+
+    Returns
+    -------
+    exceedance_time
+        If one column is selected, a dictionary of threshold keys and
+        exceedance time values.  If more than one column is selected,
+        a threshold x column DataFrame of exceedance times.
     """
     series = tsutils.common_kwds(
-        tsutils.read_iso_ts(
+        columnar.read_iso_ts(
             input_ts,
             skiprows=skiprows,
             names=names,
@@ -1118,23 +1737,7 @@ def exceedance_time(
         source_units=source_units,
         target_units=target_units,
     )
-    year = datetime.timedelta(days=365, hours=6, minutes=9, seconds=9)
-    punits = {
-        "year": year,
-        "month": year / 12,
-        "day": datetime.timedelta(days=1),
-        "hour": datetime.timedelta(hours=1),
-        "min": datetime.timedelta(minutes=1),
-        "sec": datetime.timedelta(seconds=1),
-        "years": year,
-        "months": year / 12,
-        "days": datetime.timedelta(days=1),
-        "hours": datetime.timedelta(hours=1),
-        "mins": datetime.timedelta(minutes=1),
-        "secs": datetime.timedelta(seconds=1),
-    }.get(time_units, time_units)
-
-    series = pd.Series(series.iloc[:, 0])
+    punits = _time_unit(time_units)
 
     if isinstance(delays, (int, float)):
         delays = [delays]
@@ -1153,43 +1756,160 @@ def exceedance_time(
             )
         )
 
-    e_table = {}
     thresholds = [float(i) for i in thresholds]
-    for flow, delay in zip(thresholds, delays):
-        mask = series >= flow if under_over == "over" else series <= flow
-        accum = datetime.timedelta(days=0)
-        duration = datetime.timedelta(days=0)
-        first = True
-        for index, value in mask.items():
-            if pd.isna(value):
-                continue
-            if first is True:
-                previous_index = index
-                previous_value = value
-                first = False
-                continue
-            delta = index - previous_index
-            if bool(previous_value) and bool(value):
-                accum += delta
-            elif not bool(previous_value) and bool(value):
-                accum += (
-                    (series[index] - flow)
-                    / (series[index] - series[previous_index])
-                    * delta
-                )
-            elif bool(previous_value) and not bool(value):
-                accum += (
-                    (series[previous_index] - flow)
-                    / (series[previous_index] - series[index])
-                    * delta
-                )
-                duration = duration + max(datetime.timedelta(days=0), accum - delay)
-                accum = datetime.timedelta(days=0)
-            previous_index = index
-            previous_value = value
-        duration = duration + max(datetime.timedelta(days=0), accum - delay)
-        e_table[flow] = duration / punits
-    return e_table
+    e_table = {
+        column: _exceedance_table(
+            series[column], thresholds, delays, under_over, punits
+        )
+        for column in series.columns
+    }
+    if len(series.columns) > 1:
+        return pd.DataFrame(e_table, index=list(e_table[series.columns[0]]))
+    return e_table[series.columns[0]]
+
+
+def _exceedance_catalogue(series, thresholds, under_over, punits):
+    """Events of one series for each threshold."""
+    unit, times, values, levels, periods = _exceedance_series(
+        series, thresholds, under_over
+    )
+    ithresh, start, end, start_part, end_part = periods
+
+    # Maximum (or minimum) of each event from one reduceat over the event
+    # bounds.  Every other result is between events and is discarded.
+    extreme = np.fmax if under_over == "over" else np.fmin
+    if len(start) > 0:
+        bounds = np.column_stack([start, end + 1]).ravel()
+        extreme = extreme.reduceat(np.append(values, np.nan), bounds)[::2]
+    else:
+        extreme = values[:0]
+
+    def _to_index(stamps):
+        stamps = pd.DatetimeIndex(stamps.astype(f"datetime64[{unit}]"))
+        if series.index.tz is not None:
+            stamps = stamps.tz_localize("UTC").tz_convert(series.index.tz)
+        return stamps
+
+    start = times[start] - start_part
+    end = times[end] + end_part
+    return pd.DataFrame(
+        {
+            "Threshold": levels[ithresh],
+            "Start": _to_index(start),
+            "End": _to_index(end),
+            "Duration": pd.to_timedelta(end - start, unit=unit) / punits,
+            "Peak" if under_over == "over" else "Minimum": extreme,
+        }
+    )
+
+
+@validate_call
+@tsutils.doc(tsutils.docstrings)
+def exceedance_events(
+    *thresholds,
+    input_ts="-",
+    under_over="over",
+    time_units: Literal[
+        "year",
+        "month",
+        "day",
+        "hour",
+        "min",
+        "sec",
+        "years",
+        "months",
+        "days",
+        "hours",
+        "mins",
+        "secs",
+    ] = "day",
+    columns=None,
+    source_units=None,
+    start_date=None,
+    end_date=None,
+    dropna="no",
+    clean=False,
+    round_index=None,
+    skiprows=None,
+    index_type="datetime",
+    names=None,
+    target_units=None,
+):
+    """
+    Catalogue of each event where a time series exceeds (or is below) a threshold.
+
+    The events are found with the same crossings as `exceedance_time`.  The
+    start and end of each event are linearly interpolated between the
+    values on either side of the threshold.
+
+    Parameters
+    ----------
+    *thresholds : list
+        List of thresholds to find the events for.
+    ${input_ts}
+    under_over : str
+        [optional, default "over"]
+
+        Whether to find the events over or under the thresholds.
+    time_units : str
+        [optional, default "day"]
+
+        Units for the returned event durations.  Can be any of the following
+        strings: "year", "month", "day", "hour", "min", or "sec".
+    ${columns}
+    ${source_units}
+    ${start_date}
+    ${end_date}
+    ${dropna}
+    ${clean}
+    ${round_index}
+    ${skiprows}
+    ${index_type}
+    ${names}
+    ${target_units}
+
+    Returns
+    -------
+    events
+        DataFrame with one row for each event, sorted by threshold and start,
+        with the "Threshold", "Start", "End" and "Duration" of the event and
+        the "Peak" value for events over the threshold or the "Minimum"
+        value for events under the threshold.  If more than one column is
+        selected, the first column, "Column", is the name of the series.
+    """
+    series = tsutils.common_kwds(
+        columnar.read_iso_ts(
+            input_ts,
+            skiprows=skiprows,
+            names=names,
+            index_type=index_type,
+        ),
+        start_date=start_date,
+        end_date=end_date,
+        pick=columns,
+        round_index=round_index,
+        dropna=dropna,
+        clean=clean,
+        source_units=source_units,
+        target_units=target_units,
+    )
+    punits = _time_unit(time_units)
+
+    thresholds = [float(i) for i in thresholds]
+    if len(series.columns) == 1:
+        return _exceedance_catalogue(series.iloc[:, 0], thresholds, under_over, punits)
+    return (
+        pd.concat(
+            [
+                _exceedance_catalogue(series[column], thresholds, under_over, punits)
+                for column in series.columns
+            ],
+            keys=series.columns,
+            names=["Column", None],
+        )
+        .reset_index(level=0)
+        .reset_index(drop=True)
+    )
 
 
 def about():
@@ -1202,6 +1922,22 @@ def main():
     if not os.path.exists("debug_hydrotoolbox"):
         sys.tracebacklimit = 1
 
+    program = _program(sys.argv[1:])
+    program()
+
+
+def _program(args=None):
+    """Build the command line program.
+
+    Parameters
+    ----------
+    args : list
+        [optional, default is None]
+
+        The command line arguments.  The baseflow_sep subcommands, which
+        import scipy and the baseflow methods, are only added when they are
+        used, or for all commands when `args` is None.
+    """
     from cltoolbox import Program
 
     program = Program("hydrotoolbox", "0.0")
@@ -1213,7 +1949,9 @@ def main():
 The table format.  Can be one of 'csv', 'tsv', 'csv_nos', 'tsv_nos',
 'plain', 'simple', 'github', 'grid', 'fancy_grid', 'pipe', 'orgtbl',
 'jira', 'presto', 'psql', 'rst', 'mediawiki', 'moinmoin', 'youtrack',
-'html', 'latex', 'latex_raw', 'latex_booktabs' and 'textile'."""
+'html', 'latex', 'latex_raw', 'latex_booktabs' and 'textile', or one of
+the binary columnar formats 'parquet', 'feather' and 'npz' written to
+standard output to redirect to a file."""
     float_format_docstring = r"""[optional, default is 'g']
 
 The format for floating point numbers in the output table."""
@@ -1223,10 +1961,56 @@ The format for floating point numbers in the output table."""
         """Display version number and system information."""
         tsutils.about(__name__)
 
-    @program.command("exceedance_time", formatter_class=RawTextHelpFormatter)
+    @program.command("exceedance_events", formatter_class=RawTextHelpFormatter)
     @program.arg("tablefmt", help=tablefmt_docstring)
     @program.arg("float_format", help=float_format_docstring)
-    @tsutils.copy_doc(exceedance_time)
+    @tsutils.copy_doc(exceedance_events)
+    def _exceedance_events_cli(
+        input_ts="-",
+        under_over="over",
+        time_units="day",
+        columns=None,
+        source_units=None,
+        start_date=None,
+        end_date=None,
+        dropna="no",
+        clean=False,
+        round_index=None,
+        skiprows=None,
+        index_type="datetime",
+        names=None,
+        target_units=None,
+        tablefmt="csv_nos",
+        float_format=".3f",
+        *thresholds,
+    ):
+        columnar.printiso(
+            exceedance_events(
+                *thresholds,
+                input_ts=input_ts,
+                under_over=under_over,
+                time_units=time_units,
+                columns=columns,
+                source_units=source_units,
+                start_date=start_date,
+                end_date=end_date,
+                dropna=dropna,
+                clean=clean,
+                round_index=round_index,
+                skiprows=skiprows,
+                index_type=index_type,
+                names=names,
+                target_units=target_units,
+            ),
+            tablefmt=tablefmt,
+            float_format=float_format,
+            showindex="never",
+        )
+
+    @program.command("exceedance_time", formatter_class=RawTextHelpFormatter)
+    @program.arg("tablefmt", help=tablefmt_docstring)
+    @program.arg("float_format", help=float_format_docstring)
+    @tsutils.copy_doc(exceedance_time)
     def _exceedance_time_cli(
         input_ts="-",
         delays=0,
@@ -1248,6 +2032,7 @@ The format for floating point numbers in the output table."""
         *thresholds,
     ):
         ans = exceedance_time(
+            *thresholds,
             input_ts=input_ts,
             delays=delays,
             under_over=under_over,
@@ -1263,16 +2048,298 @@ The format for floating point numbers in the output table."""
             index_type=index_type,
             names=names,
             target_units=target_units,
-            *thresholds,
         )
-        ans = list(ans.items())
-        tsutils.printiso(
+        if isinstance(ans, pd.DataFrame):
+            headers = ["Flow"] + [
+                f"{i} Exceedance Time ({under_over} {time_units})" for i in ans.columns
+            ]
+            ans = [[key, *val] for key, val in ans.iterrows()]
+        else:
+            headers = ["Flow", f"Exceedance Time ({under_over} {time_units})"]
+            ans = list(ans.items())
+        columnar.printiso(
             ans,
-            headers=["Flow", f"Exceedance Time ({under_over} {time_units})"],
+            headers=headers,
             tablefmt=tablefmt,
             float_format=float_format,
         )
 
+    if args is None or "baseflow_sep" in args:
+        _add_baseflow_sep(program, tablefmt_docstring, float_format_docstring)
+
+    @program.command("recession", formatter_class=RawTextHelpFormatter)
+    @program.arg("tablefmt", help=tablefmt_docstring)
+    @program.arg("float_format", help=float_format_docstring)
+    @tsutils.copy_doc(recession)
+    def _recession_cli(
+        date=None,
+        ice_period=None,
+        input_ts="-",
+        columns=None,
+        source_units=None,
+        start_date=None,
+        end_date=None,
+        dropna="no",
+        clean=False,
+        round_index=None,
+        skiprows=None,
+        index_type="datetime",
+        names=None,
+        target_units=None,
+        n_jobs=1,
+        tablefmt="plain",
+        float_format="g",
+    ):
+        columnar.printiso(
+            recession(
+                date=date,
+                ice_period=ice_period,
+                input_ts=input_ts,
+                columns=columns,
+                source_units=source_units,
+                start_date=start_date,
+                end_date=end_date,
+                dropna=dropna,
+                clean=clean,
+                round_index=round_index,
+                skiprows=skiprows,
+                index_type=index_type,
+                names=names,
+                target_units=target_units,
+                n_jobs=n_jobs,
+            ),
+            tablefmt=tablefmt,
+        )
+
+    @program.command("flow_duration", formatter_class=RawTextHelpFormatter)
+    @program.arg("tablefmt", help=tablefmt_docstring)
+    @program.arg("float_format", help=float_format_docstring)
+    @tsutils.copy_doc(flow_duration)
+    def _flow_duration_cli(
+        input_ts="-",
+        exceedance_probabilities=(99.5, 99, 98, 95, 90, 75, 50, 25, 10, 5, 2, 1, 0.5),
+        columns=None,
+        source_units=None,
+        start_date=None,
+        end_date=None,
+        dropna="no",
+        clean=False,
+        round_index=None,
+        skiprows=None,
+        index_type="datetime",
+        names=None,
+        target_units=None,
+        chunksize=None,
+        groupby=None,
+        tablefmt="csv",
+        float_format="g",
+    ):
+        columnar.printiso(
+            flow_duration(
+                input_ts=input_ts,
+                exceedance_probabilities=exceedance_probabilities,
+                columns=columns,
+                source_units=source_units,
+                start_date=start_date,
+                end_date=end_date,
+                dropna=dropna,
+                clean=clean,
+                round_index=round_index,
+                skiprows=skiprows,
+                index_type=index_type,
+                names=names,
+                target_units=target_units,
+                chunksize=chunksize,
+                groupby=groupby,
+            ),
+            tablefmt=tablefmt,
+            showindex=True,
+        )
+
+    @program.command("storm_events", formatter_class=RawTextHelpFormatter)
+    @program.arg("tablefmt", help=tablefmt_docstring)
+    @program.arg("float_format", help=float_format_docstring)
+    @tsutils.copy_doc(storm_events)
+    def _storm_events_cli(
+        rise_lag,
+        fall_lag,
+        input_ts="-",
+        window=1,
+        min_peak=0,
+        columns=None,
+        source_units=None,
+        start_date=None,
+        end_date=None,
+        dropna="no",
+        clean=False,
+        round_index=None,
+        skiprows=None,
+        index_type="datetime",
+        names=None,
+        target_units=None,
+        summary=False,
+        tablefmt="plain",
+        float_format="g",
+    ):
+        columnar.printiso(
+            storm_events(
+                rise_lag=rise_lag,
+                fall_lag=fall_lag,
+                input_ts=input_ts,
+                window=window,
+                min_peak=min_peak,
+                columns=columns,
+                source_units=source_units,
+                start_date=start_date,
+                end_date=end_date,
+                dropna=dropna,
+                clean=clean,
+                round_index=round_index,
+                skiprows=skiprows,
+                index_type=index_type,
+                names=names,
+                target_units=target_units,
+                summary=summary,
+            ),
+            tablefmt=tablefmt,
+            showindex="never" if summary else True,
+        )
+
+    @program.command("indices", formatter_class=RawTextHelpFormatter)
+    @program.arg("tablefmt", help=tablefmt_docstring)
+    @program.arg("float_format", help=float_format_docstring)
+    @tsutils.copy_doc(indices)
+    def _indices_cli(
+        indice_codes,
+        water_year="YE-SEP",
+        drainage_area="1",
+        use_median=False,
+        input_ts="-",
+        columns=None,
+        source_units=None,
+        start_date=None,
+        end_date=None,
+        dropna="no",
+        clean=False,
+        round_index=None,
+        skiprows=None,
+        index_type="datetime",
+        names=None,
+        target_units=None,
+        tablefmt="plain",
+        float_format="g",
+    ):
+        ans = indices(
+            indice_codes,
+            input_ts=input_ts,
+            water_year=water_year,
+            drainage_area=drainage_area,
+            use_median=use_median,
+            columns=columns,
+            source_units=source_units,
+            start_date=start_date,
+            end_date=end_date,
+            dropna=dropna,
+            clean=clean,
+            round_index=round_index,
+            skiprows=skiprows,
+            index_type=index_type,
+            names=names,
+            target_units=target_units,
+        )
+        if isinstance(ans, pd.DataFrame):
+            headers = ["Indices"] + [str(i) for i in ans.index]
+            ret = [[key, *val] for key, val in ans.T.iterrows()]
+        else:
+            headers = ["Indices", "Value"]
+            ret = [[key, val] for key, val in ans.items()]
+        columnar.printiso(
+            ret,
+            tablefmt=tablefmt,
+            headers=headers,
+            float_format=".3f",
+        )
+
+    @program.command("run", formatter_class=RawTextHelpFormatter)
+    def _run_cli(pipeline):
+        """Run several analyses on one flow record that is read once.
+
+        The pipeline file is TOML like::
+
+            input_ts = "gauge.csv"
+            target_units = "cms"
+
+            [[analysis]]
+            function = "flow_duration"
+            output = "flow_duration.csv"
+
+            [[analysis]]
+            function = "baseflow_sep.eckhardt"
+            k = 0.97
+            bfi_max = 0.8
+            output = "eckhardt.csv"
+
+        The top level keys are the options that read and clean the flows.
+        Each analysis names a hydrotoolbox function, "baseflow_sep.<method>"
+        for the baseflow separations, and gives its other options, with the
+        thresholds of "exceedance_time" and "exceedance_events" as a
+        "thresholds" list and the codes of "indices" as an "indice_codes"
+        list.  "output" is the file to write the result to, or "-" for
+        standard output, and "tablefmt" and "float_format" format it.
+
+        Parameters
+        ----------
+        pipeline : str
+            Path of the TOML pipeline file.
+        """
+        from hydrotoolbox import pipeline as pipelines
+
+        pipelines.run(pipeline)
+
+    @program.command("serve", formatter_class=RawTextHelpFormatter)
+    def _serve_cli(socket=None):
+        r"""Run hydrotoolbox commands in one long running process.
+
+        Avoids the start up time of a new process for each command.  Each
+        request is one line of JSON like::
+
+            {"args": ["flow_duration", "--groupby", "season"],
+             "stdin": "Datetime,flow\n2000-01-01,3.2\n...",
+             "cwd": "/path/for/relative/file/names"}
+
+        where "args" are the same as the command line arguments after
+        "hydrotoolbox" and "stdin" and "cwd" are optional.  Each response
+        is one line of JSON like::
+
+            {"returncode": 0, "stdout": "...", "stderr": ""}
+
+        with the base64 encoded output of the binary table formats as
+        "stdout_base64".
+
+        Requests are read from standard input until it is closed, or from
+        connections to a Unix socket if `socket` is given.
+
+        Parameters
+        ----------
+        socket : str
+            [optional, default is None]
+
+            Path of a Unix socket to listen on instead of reading requests
+            from standard input.
+        """
+        from hydrotoolbox import server
+
+        # The program of this command may lack the subcommands that were
+        # not named on the command line, so the server builds all of them.
+        server.serve(socket=socket)
+
+    return program
+
+
+def _add_baseflow_sep(program, tablefmt_docstring, float_format_docstring):
+    """Add the baseflow_sep subcommands to the command line program."""
+    from hydrotoolbox import baseflow_sep
+
     @program.baseflow_sep.command("boughton", formatter_class=RawTextHelpFormatter)
     @program.arg("tablefmt", help=tablefmt_docstring)
     @program.arg("float_format", help=float_format_docstring)
@@ -1280,6 +2347,8 @@ The format for floating point numbers in the output table."""
     def _boughton_cli(
         input_ts="-",
         columns=None,
+        k=None,
+        C=None,
         source_units=None,
         start_date=None,
         end_date=None,
@@ -1291,14 +2360,18 @@ The format for floating point numbers in the output table."""
         names=None,
         target_units=None,
         print_input=False,
+        resolution="daily",
+        chunksize=None,
         tablefmt="csv",
         float_format="g",
     ):
         """Boughton double-parameter filter (Boughton, 2004)"""
-        tsutils.printiso(
+        columnar.printiso(
             baseflow_sep.boughton(
                 input_ts=input_ts,
                 columns=columns,
+                k=k,
+                C=C,
                 source_units=source_units,
                 start_date=start_date,
                 end_date=end_date,
@@ -1310,6 +2383,8 @@ The format for floating point numbers in the output table."""
                 names=names,
                 target_units=target_units,
                 print_input=print_input,
+                resolution=resolution,
+                chunksize=chunksize,
             ),
             tablefmt=tablefmt,
             float_format=float_format,
@@ -1334,6 +2409,8 @@ The format for floating point numbers in the output table."""
         names=None,
         target_units=None,
         print_input=False,
+        resolution="daily",
+        chunksize=None,
         tablefmt="csv",
         float_format="g",
     ):
@@ -1357,9 +2434,11 @@ The format for floating point numbers in the output table."""
         ${names}
         ${target_units}
         ${print_input}
+        ${resolution}
+        ${chunksize}
         ${tablefmt}
         """
-        tsutils.printiso(
+        columnar.printiso(
             baseflow_sep.chapman(
                 k=k,
                 input_ts=input_ts,
@@ -1375,6 +2454,8 @@ The format for floating point numbers in the output table."""
                 names=names,
                 target_units=target_units,
                 print_input=print_input,
+                resolution=resolution,
+                chunksize=chunksize,
             ),
             tablefmt=tablefmt,
             float_format=float_format,
@@ -1401,11 +2482,13 @@ The format for floating point numbers in the output table."""
         names=None,
         target_units=None,
         print_input=False,
+        resolution="daily",
+        chunksize=None,
         tablefmt="csv",
         float_format="g",
     ):
         """Digital filter (Chapman and Maxwell, 1996)"""
-        tsutils.printiso(
+        columnar.printiso(
             baseflow_sep.chapman_maxwell(
                 k=k,
                 input_ts=input_ts,
@@ -1421,6 +2504,8 @@ The format for floating point numbers in the output table."""
                 names=names,
                 target_units=target_units,
                 print_input=print_input,
+                resolution=resolution,
+                chunksize=chunksize,
             ),
             tablefmt=tablefmt,
             float_format=float_format,
@@ -1446,6 +2531,8 @@ The format for floating point numbers in the output table."""
         names=None,
         target_units=None,
         print_input=False,
+        resolution="daily",
+        chunksize=None,
         tablefmt="csv",
         float_format="g",
     ):
@@ -1468,9 +2555,11 @@ The format for floating point numbers in the output table."""
         ${names}
         ${target_units}
         ${print_input}
+        ${resolution}
+        ${chunksize}
         ${tablefmt}
         """
-        tsutils.printiso(
+        columnar.printiso(
             baseflow_sep.eckhardt(
                 input_ts=input_ts,
                 columns=columns,
@@ -1487,6 +2576,8 @@ The format for floating point numbers in the output table."""
                 names=names,
                 target_units=target_units,
                 print_input=print_input,
+                resolution=resolution,
+                chunksize=chunksize,
             ),
             tablefmt=tablefmt,
             float_format=float_format,
@@ -1510,10 +2601,11 @@ The format for floating point numbers in the output table."""
         names=None,
         target_units=None,
         print_input=False,
+        resolution="daily",
         tablefmt="csv",
         float_format="g",
     ):
-        tsutils.printiso(
+        columnar.printiso(
             baseflow_sep.ewma(
                 input_ts=input_ts,
                 columns=columns,
@@ -1528,6 +2620,7 @@ The format for floating point numbers in the output table."""
                 names=names,
                 target_units=target_units,
                 print_input=print_input,
+                resolution=resolution,
             ),
             tablefmt=tablefmt,
         )
@@ -1550,10 +2643,11 @@ The format for floating point numbers in the output table."""
         names=None,
         target_units=None,
         print_input=False,
+        resolution="daily",
         tablefmt="csv",
         float_format="g",
     ):
-        tsutils.printiso(
+        columnar.printiso(
             baseflow_sep.five_day(
                 input_ts=input_ts,
                 columns=columns,
@@ -1568,6 +2662,7 @@ The format for floating point numbers in the output table."""
                 names=names,
                 target_units=target_units,
                 print_input=print_input,
+                resolution=resolution,
             ),
             tablefmt=tablefmt,
         )
@@ -1592,10 +2687,11 @@ The format for floating point numbers in the output table."""
         names=None,
         target_units=None,
         print_input=False,
+        resolution="daily",
         tablefmt="csv",
         float_format="g",
     ):
-        tsutils.printiso(
+        columnar.printiso(
             baseflow_sep.furey(
                 k=k,
                 c3c1=c3c1,
@@ -1612,6 +2708,7 @@ The format for floating point numbers in the output table."""
                 names=names,
                 target_units=target_units,
                 print_input=print_input,
+                resolution=resolution,
             ),
             tablefmt=tablefmt,
         )
@@ -1635,10 +2732,12 @@ The format for floating point numbers in the output table."""
         names=None,
         target_units=None,
         print_input=False,
+        resolution="daily",
+        chunksize=None,
         tablefmt="csv",
         float_format="g",
     ):
-        tsutils.printiso(
+        columnar.printiso(
             baseflow_sep.lyne_hollick(
                 input_ts=input_ts,
                 alpha=alpha,
@@ -1654,6 +2753,8 @@ The format for floating point numbers in the output table."""
                 names=names,
                 target_units=target_units,
                 print_input=print_input,
+                resolution=resolution,
+                chunksize=chunksize,
             ),
             tablefmt=tablefmt,
         )
@@ -1679,10 +2780,12 @@ The format for floating point numbers in the output table."""
         names=None,
         target_units=None,
         print_input=False,
+        resolution="daily",
+        chunksize=None,
         tablefmt="csv",
         float_format="g",
     ):
-        tsutils.printiso(
+        columnar.printiso(
             baseflow_sep.ihacres(
                 k,
                 C,
@@ -1700,6 +2803,8 @@ The format for floating point numbers in the output table."""
                 names=names,
                 target_units=target_units,
                 print_input=print_input,
+                resolution=resolution,
+                chunksize=chunksize,
             ),
             tablefmt=tablefmt,
         )
@@ -1722,10 +2827,11 @@ The format for floating point numbers in the output table."""
         names=None,
         target_units=None,
         print_input=False,
+        resolution="daily",
         tablefmt="csv",
         float_format="g",
     ):
-        tsutils.printiso(
+        columnar.printiso(
             baseflow_sep.ukih(
                 input_ts=input_ts,
                 columns=columns,
@@ -1740,6 +2846,7 @@ The format for floating point numbers in the output table."""
                 names=names,
                 target_units=target_units,
                 print_input=print_input,
+                resolution=resolution,
             ),
             tablefmt=tablefmt,
         )
@@ -1762,10 +2869,11 @@ The format for floating point numbers in the output table."""
         names=None,
         target_units=None,
         print_input=False,
+        resolution="daily",
         tablefmt="csv",
         float_format="g",
     ):
-        tsutils.printiso(
+        columnar.printiso(
             baseflow_sep.willems(
                 input_ts=input_ts,
                 columns=columns,
@@ -1780,6 +2888,7 @@ The format for floating point numbers in the output table."""
                 names=names,
                 target_units=target_units,
                 print_input=print_input,
+                resolution=resolution,
             ),
             tablefmt=tablefmt,
         )
@@ -1806,10 +2915,11 @@ The format for floating point numbers in the output table."""
         names=None,
         target_units=None,
         print_input=False,
+        resolution="daily",
         tablefmt="csv",
         float_format="g",
     ):
-        tsutils.printiso(
+        columnar.printiso(
             baseflow_sep.usgs_hysep_fixed(
                 num_days=num_days,
                 area=area,
@@ -1826,6 +2936,7 @@ The format for floating point numbers in the output table."""
                 names=names,
                 target_units=target_units,
                 print_input=print_input,
+                resolution=resolution,
             ),
             tablefmt=tablefmt,
         )
@@ -1852,10 +2963,11 @@ The format for floating point numbers in the output table."""
         names=None,
         target_units=None,
         print_input=False,
+        resolution="daily",
         tablefmt="csv",
         float_format="g",
     ):
-        tsutils.printiso(
+        columnar.printiso(
             baseflow_sep.usgs_hysep_local(
                 num_days=num_days,
                 area=area,
@@ -1872,6 +2984,7 @@ The format for floating point numbers in the output table."""
                 names=names,
                 target_units=target_units,
                 print_input=print_input,
+                resolution=resolution,
             ),
             tablefmt=tablefmt,
         )
@@ -1898,10 +3011,11 @@ The format for floating point numbers in the output table."""
         names=None,
         target_units=None,
         print_input=False,
+        resolution="daily",
         tablefmt="csv",
         float_format="g",
     ):
-        tsutils.printiso(
+        columnar.printiso(
             baseflow_sep.usgs_hysep_slide(
                 num_days=num_days,
                 area=area,
@@ -1918,6 +3032,7 @@ The format for floating point numbers in the output table."""
                 names=names,
                 target_units=target_units,
                 print_input=print_input,
+                resolution=resolution,
             ),
             tablefmt=tablefmt,
         )
@@ -1960,7 +3075,7 @@ The format for floating point numbers in the output table."""
     #     ${print_input}
     #     ${tablefmt}
     #     """
-    #     tsutils.printiso(
+    #     columnar.printiso(
     #         baseflow_sep.strict(
     #             input_ts=input_ts,
     #             columns=columns,
@@ -1979,191 +3094,6 @@ The format for floating point numbers in the output table."""
     #         tablefmt=tablefmt,
     #     )
 
-    @program.command("recession", formatter_class=RawTextHelpFormatter)
-    @program.arg("tablefmt", help=tablefmt_docstring)
-    @program.arg("float_format", help=float_format_docstring)
-    @tsutils.copy_doc(recession)
-    def _recession_cli(
-        date=None,
-        ice_period=None,
-        input_ts="-",
-        columns=None,
-        source_units=None,
-        start_date=None,
-        end_date=None,
-        dropna="no",
-        clean=False,
-        round_index=None,
-        skiprows=None,
-        index_type="datetime",
-        names=None,
-        target_units=None,
-        tablefmt="plain",
-        float_format="g",
-    ):
-        tsutils.printiso(
-            recession(
-                date=date,
-                ice_period=ice_period,
-                input_ts=input_ts,
-                columns=columns,
-                source_units=source_units,
-                start_date=start_date,
-                end_date=end_date,
-                dropna=dropna,
-                clean=clean,
-                round_index=round_index,
-                skiprows=skiprows,
-                index_type=index_type,
-                names=names,
-                target_units=target_units,
-            ),
-            tablefmt=tablefmt,
-        )
-
-    @program.command("flow_duration", formatter_class=RawTextHelpFormatter)
-    @program.arg("tablefmt", help=tablefmt_docstring)
-    @program.arg("float_format", help=float_format_docstring)
-    @tsutils.copy_doc(flow_duration)
-    def _flow_duration_cli(
-        input_ts="-",
-        exceedance_probabilities=(99.5, 99, 98, 95, 90, 75, 50, 25, 10, 5, 2, 1, 0.5),
-        columns=None,
-        source_units=None,
-        start_date=None,
-        end_date=None,
-        dropna="no",
-        clean=False,
-        round_index=None,
-        skiprows=None,
-        index_type="datetime",
-        names=None,
-        target_units=None,
-        tablefmt="csv",
-        float_format="g",
-    ):
-        tsutils.printiso(
-            flow_duration(
-                input_ts=input_ts,
-                exceedance_probabilities=exceedance_probabilities,
-                columns=columns,
-                source_units=source_units,
-                start_date=start_date,
-                end_date=end_date,
-                dropna=dropna,
-                clean=clean,
-                round_index=round_index,
-                skiprows=skiprows,
-                index_type=index_type,
-                names=names,
-                target_units=target_units,
-            ),
-            tablefmt=tablefmt,
-            showindex=True,
-        )
-
-    @program.command("storm_events", formatter_class=RawTextHelpFormatter)
-    @program.arg("tablefmt", help=tablefmt_docstring)
-    @program.arg("float_format", help=float_format_docstring)
-    @tsutils.copy_doc(storm_events)
-    def _storm_events_cli(
-        rise_lag,
-        fall_lag,
-        input_ts="-",
-        window=1,
-        min_peak=0,
-        columns=None,
-        source_units=None,
-        start_date=None,
-        end_date=None,
-        dropna="no",
-        clean=False,
-        round_index=None,
-        skiprows=None,
-        index_type="datetime",
-        names=None,
-        target_units=None,
-        tablefmt="plain",
-        float_format="g",
-    ):
-        tsutils.printiso(
-            storm_events(
-                rise_lag=rise_lag,
-                fall_lag=fall_lag,
-                input_ts=input_ts,
-                window=window,
-                min_peak=min_peak,
-                columns=columns,
-                source_units=source_units,
-                start_date=start_date,
-                end_date=end_date,
-                dropna=dropna,
-                clean=clean,
-                round_index=round_index,
-                skiprows=skiprows,
-                index_type=index_type,
-                names=names,
-                target_units=target_units,
-            ),
-            tablefmt=tablefmt,
-        )
-
-    @program.command("indices", formatter_class=RawTextHelpFormatter)
-    @program.arg("tablefmt", help=tablefmt_docstring)
-    @program.arg("float_format", help=float_format_docstring)
-    @tsutils.copy_doc(indices)
-    def _indices_cli(
-        indice_codes,
-        water_year="YE-SEP",
-        drainage_area=1,
-        use_median=False,
-        input_ts="-",
-        columns=None,
-        source_units=None,
-        start_date=None,
-        end_date=None,
-        dropna="no",
-        clean=False,
-        round_index=None,
-        skiprows=None,
-        index_type="datetime",
-        names=None,
-        target_units=None,
-        tablefmt="plain",
-        float_format="g",
-    ):
-        ret = [
-            [key, val]
-            for key, val in (
-                indices(
-                    indice_codes,
-                    input_ts=input_ts,
-                    water_year=water_year,
-                    drainage_area=drainage_area,
-                    use_median=use_median,
-                    columns=columns,
-                    source_units=source_units,
-                    start_date=start_date,
-                    end_date=end_date,
-                    dropna=dropna,
-                    clean=clean,
-                    round_index=round_index,
-                    skiprows=skiprows,
-                    index_type=index_type,
-                    names=names,
-                    target_units=target_units,
-                )
-            ).items()
-        ]
-        tsutils.printiso(
-            ret,
-            tablefmt=tablefmt,
-            headers=["Indices", "Value"],
-            float_format=".3f",
-        )
-
-    program()
-
 
 if __name__ == "__main__":
     main()
@@ -1,45 +1,146 @@
+import types
+from functools import cached_property
 from typing import Optional
 
 import numpy as np
 import pandas as pd
-from scipy.signal import find_peaks
 
 from hydrotoolbox.toolbox_utils.src.toolbox_utils import tsutils
 
 
 class Indices:
     def __init__(self, data, use_median=False, water_year="YE-SEP", drainage_area=1):
+        self.use_median = use_median
+        self.water_year = tsutils.pandas_offset_by_version(water_year)
+        self.drainage_area = float(drainage_area)
+
+        self.data = self._clean(data)
+        self._rolled = {}
+
+    def _clean(self, data):
+        """Return the single flow series with negative and missing values dropped."""
         if isinstance(data, pd.DataFrame) and len(data.columns) != 1:
             raise ValueError(
                 tsutils.error_wrapper(
                     f"""
                     Can only calculate indices on 1 series, you gave
-                    {len(data.columns)}.
+                    {len(data.columns)}.  Use MultiIndices for several
+                    series.
+                    """
+                )
+            )
+        data = pd.Series(data.iloc[:, 0].values, index=data.index)
+        data[data < 0] = pd.NA
+        return data.dropna()
+
+    # The calendar keys are integer arrays aligned with self.data and are
+    # computed once.  The monthly and water year groupings, and the aggregates
+    # calculated from them, group on these keys and are only built the first
+    # time an index needs them.
+
+    @cached_property
+    def _month_key(self):
+        """Calendar month (1-12) of each value."""
+        return np.asarray(self.data.index.month)
+
+    @cached_property
+    def _doy_key(self):
+        """Day of year (1-366) of each value."""
+        return np.asarray(self.data.index.dayofyear)
+
+    @cached_property
+    def _year_month_key(self):
+        """Sequential month number (year * 12 + month - 1) of each value."""
+        return np.asarray(self.data.index.year) * 12 + self._month_key - 1
+
+    @cached_property
+    def _water_year_key(self):
+        """Water year of each value, as the calendar year the water year ends in."""
+        offset = pd.tseries.frequencies.to_offset(self.water_year)
+        if isinstance(offset, pd.offsets.YearEnd):
+            last_month = offset.month
+        elif isinstance(offset, pd.offsets.YearBegin):
+            last_month = offset.month - 1
+        else:
+            raise TypeError(
+                tsutils.error_wrapper(
+                    f"""
+                    The water_year must be an annual offset, for example "YE-SEP",
+                    instead of "{self.water_year}".
                     """
                 )
             )
+        return np.asarray(self.data.index.year) + (self._month_key > last_month)
 
-        self.use_median = use_median
-        self.water_year = tsutils.pandas_offset_by_version(water_year)
-        self.drainage_area = float(drainage_area)
+    @staticmethod
+    def _span(key):
+        """All integer keys from the first to the last in `key`."""
+        if len(key) == 0:
+            return pd.RangeIndex(0)
+        return pd.RangeIndex(key.min(), key.max() + 1)
 
-        self.data = pd.Series(data.iloc[:, 0].values, index=data.index)
-        self.data[self.data < 0] = pd.NA
-        self.data = self.data.dropna()
+    def _fill_years(self, stat, fill_value=np.nan):
+        """Reindex a water year aggregate to every water year in the record.
 
-        self.data_monthly = self.data.groupby(
-            pd.Grouper(freq=tsutils.pandas_offset_by_version("ME"))
-        )
-        self.data_yearly = self.data.groupby(pd.Grouper(freq=self.water_year))
+        Water years without data get `fill_value`, which is what grouping with
+        a pd.Grouper would give: NaN for most aggregates and 0 for sums and
+        counts.
+        """
+        return stat.reindex(self._span(self._water_year_key), fill_value=fill_value)
+
+    def _fill_months(self, stat):
+        """Reindex a monthly aggregate to every month in the record."""
+        return stat.reindex(self._span(self._year_month_key))
+
+    def _by_calendar_month(self, stat):
+        """Mean (or median) of a monthly aggregate for each calendar month."""
+        grouped = stat.groupby(stat.index % 12 + 1)
+        stat = grouped.median() if self.use_median is True else grouped.mean()
+        return stat.reindex(range(1, 13))
+
+    @cached_property
+    def data_monthly(self):
+        return self.data.groupby(self._year_month_key)
+
+    @cached_property
+    def data_yearly(self):
+        return self.data.groupby(self._water_year_key)
+
+    @cached_property
+    def data_monthly_mean(self):
+        return self.data_monthly.mean().pipe(self._fill_months)
+
+    @cached_property
+    def data_monthly_min(self):
+        return self.data_monthly.min().pipe(self._fill_months)
+
+    @cached_property
+    def data_monthly_max(self):
+        return self.data_monthly.max().pipe(self._fill_months)
+
+    @cached_property
+    def data_monthly_std(self):
+        return self.data_monthly.std().pipe(self._fill_months)
+
+    @cached_property
+    def data_yearly_mean(self):
+        return self.data_yearly.mean().pipe(self._fill_years)
 
-        self.data_monthly_mean = self.data_monthly.mean()
-        self.data_yearly_mean = self.data_yearly.mean()
+    @cached_property
+    def data_yearly_median(self):
+        return self.data_yearly.median().pipe(self._fill_years)
 
-        self.data_monthly_min = self.data_monthly.min()
-        self.data_yearly_min = self.data_yearly.min()
+    @cached_property
+    def data_yearly_min(self):
+        return self.data_yearly.min().pipe(self._fill_years)
 
-        self.data_monthly_max = self.data_monthly.max()
-        self.data_yearly_max = self.data_yearly.max()
+    @cached_property
+    def data_yearly_max(self):
+        return self.data_yearly.max().pipe(self._fill_years)
+
+    @cached_property
+    def data_yearly_std(self):
+        return self.data_yearly.std().pipe(self._fill_years)
 
     def MA1(self):
         """MA1
@@ -60,8 +161,7 @@ class Indices:
         for each year of daily flows. Compute the mean of the annual
         coefficients of variation.
         percent—temporal"""
-        group = self.data.groupby(pd.Grouper(freq=self.water_year))
-        tmpdata = group.std() / group.mean()
+        tmpdata = self.data_yearly_std / self.data_yearly_mean
         if self.use_median is True:
             return tmpdata.median() * 100
         return tmpdata.mean() * 100
@@ -167,11 +267,16 @@ Spread in daily flows is computed like MA9, except using the 25th and 75th
 percentiles.
 dimensionless—spatial"""
 
+    @cached_property
+    def _monthly_flows(self):
+        """Mean (or median) of all daily flows in each calendar month."""
+        grouped = self.data.groupby(self._month_key)
+        stat = grouped.median() if self.use_median is True else grouped.mean()
+        return stat.reindex(range(1, 13))
+
     def _make_MA_12_23(month: int):
         def template(self):
-            if self.use_median is True:
-                return self.data[self.data.index.month == month].median()
-            return self.data[self.data.index.month == month].mean()
+            return self._monthly_flows.loc[month]
 
         return template
 
@@ -276,15 +381,17 @@ entire flow record.
 MA23 is the mean of all December flow values over the entire record
 (cubic feet per second— temporal)."""
 
+    @cached_property
+    def _monthly_cvs(self):
+        """Coefficient of variation, in percent, for each calendar month."""
+        return (
+            self._by_calendar_month(self.data_monthly_std / self.data_monthly_mean)
+            * 100
+        )
+
     def _make_MA_24_35(month: int):
         def template(self):
-            group = self.data.groupby(
-                pd.Grouper(freq=tsutils.pandas_offset_by_version("ME"))
-            )
-            tmpdata = group.std() / group.mean()
-            if self.use_median is True:
-                return tmpdata[tmpdata.index.month == month].median() * 100
-            return tmpdata[tmpdata.index.month == month].mean() * 100
+            return self._monthly_cvs.loc[month]
 
         return template
 
@@ -417,7 +524,7 @@ percent—temporal"""
         median monthly flow.
         dimensionless-spatial"""
         return (
-            max(self.data_monthly_mean) - min(self.data_monthly_mean)
+            self.data_monthly_mean.max() - self.data_monthly_mean.min()
         ) / self.data_monthly_mean.median()
 
     def _make_MA_37_38(high: float, low: float):
@@ -474,7 +581,7 @@ dimensionless—spatial"""
         the minimum annual flow divided by the median annual flow.
         dimensionless-spatial"""
         return (
-            max(self.data_yearly_mean) - min(self.data_yearly_mean)
+            self.data_yearly_mean.max() - self.data_yearly_mean.min()
         ) / self.data_yearly_mean.median()
 
     def _make_MA_43_44(high: float, low: float):
@@ -514,15 +621,14 @@ dimensionless-spatial"""
             self.data_yearly_mean.mean() - self.data_yearly_mean.median()
         ) / self.data_yearly_mean.median()
 
+    @cached_property
+    def _monthly_mins(self):
+        """Mean (or median) of the monthly minimums for each calendar month."""
+        return self._by_calendar_month(self.data_monthly_min)
+
     def _make_ML_1_12(month: int):
         def template(self):
-            if self.use_median is True:
-                return self.data_monthly_min[
-                    self.data_monthly_min.index.month == month
-                ].median()
-            return self.data_monthly_min[
-                self.data_monthly_min.index.month == month
-            ].mean()
+            return self._monthly_mins.loc[month]
 
         return template
 
@@ -637,10 +743,7 @@ cubic feet per second—temporal"""
         Compute the minimum annual flow for each year. ML14 is the mean of the
         ratios of minimum annual flows to the median flow for each year.
         dimensionless—temporal"""
-        return (
-            self.data_yearly_min
-            / self.data.groupby(pd.Grouper(freq=self.water_year)).median()
-        ).mean()
+        return (self.data_yearly_min / self.data_yearly_median).mean()
 
     def ML15(self):
         """ML15
@@ -654,7 +757,23 @@ cubic feet per second—temporal"""
         Median of annual minimum flows. ML16 is the median of the ratios of
         minimum annual flows to the median flow for each year.
         dimensionless— temporal"""
-        return (self.data_yearly_min / self.data_yearly.median()).median()
+        return (self.data_yearly_min / self.data_yearly_median).median()
+
+    @cached_property
+    def _yearly_min_7day(self):
+        """Yearly minimum of the 7-day moving average flow."""
+        return (
+            self.data.rolling(7)
+            .mean()
+            .groupby(self._water_year_key)
+            .min()
+            .pipe(self._fill_years)
+        )
+
+    @cached_property
+    def _min_7day_ratios(self):
+        """Yearly minimum 7-day moving average flow / yearly mean flow."""
+        return self._yearly_min_7day / self.data_yearly_mean
 
     def ML17(self):
         """ML17
@@ -663,10 +782,7 @@ cubic feet per second—temporal"""
         annual flow for that year. ML17 is the mean (or median if use_median is
         set) of those ratios.
         dimensionless—temporal"""
-        stat = (
-            self.data.rolling(7).mean().groupby(pd.Grouper(freq=self.water_year)).min()
-            / self.data_yearly_mean
-        )
+        stat = self._min_7day_ratios
         return stat.median() if self.use_median is True else stat.mean()
 
     def ML18(self):
@@ -675,9 +791,7 @@ cubic feet per second—temporal"""
         of 7-day moving average flows to mean annual flows for each year. ML18
         is the standard deviation times 100 divided by the mean of the ratios.
         percent—spatial"""
-        ratios = (
-            self.data.rolling(7).mean().groupby(pd.Grouper(freq=self.water_year))
-        ).min() / self.data_yearly_mean
+        ratios = self._min_7day_ratios
         return ratios.std() / ratios.mean() * 100
 
     def ML19(self):
@@ -720,10 +834,14 @@ cubic feet per second—temporal"""
         cubic feet per second/square mile—temporal"""
         return self.data_yearly_min.mean() / self.drainage_area
 
+    @cached_property
+    def _monthly_maxs(self):
+        """Mean (or median) of the monthly maximums for each calendar month."""
+        return self._by_calendar_month(self.data_monthly_max)
+
     def _make_MH_1_12(month: int):
         def template(self):
-            stat = self.data_monthly_max[self.data_monthly_max.index.month == month]
-            return stat.median() if self.use_median is True else stat.mean()
+            return self._monthly_maxs.loc[month]
 
         return template
 
@@ -839,7 +957,7 @@ second—temporal"""
         monthly maximum flows. Compute the ratio of annual maximum flow to
         median annual flow for each year. MH14 is the median of these ratios.
         dimensionless—temporal"""
-        return (self.data_yearly_max / self.data_yearly.median()).median()
+        return (self.data_yearly_max / self.data_yearly_median).median()
 
     def _MH_15_17(quant: float):
         def template(self):
@@ -907,10 +1025,14 @@ dimensionless—spatial"""
 
             # Mean of the yearly volume (sum of flows) above the median
             # * med_mult
-            qmean = flow.groupby(pd.Grouper(freq=self.water_year)).sum().mean()
+            qmean = self._fill_years(
+                flow.groupby(self._water_year_key).sum(), fill_value=0
+            ).mean()
 
             nevents = (flow > 0) & (flow.shift(-1) == 0)
-            nevents = nevents.groupby(pd.Grouper(freq=self.water_year)).sum().mean()
+            nevents = self._fill_years(
+                nevents.groupby(self._water_year_key).sum(), fill_value=0
+            ).mean()
 
             return qmean / nevents / med
 
@@ -927,6 +1049,8 @@ dimensionless—spatial"""
             else:
                 medm = self.MA2() * med_mult
 
+            from scipy.signal import find_peaks
+
             peaks, _ = find_peaks(self.data, height=medm)
             return self.data.iloc[peaks].mean() / self.MA2()
 
@@ -953,29 +1077,37 @@ dimensionless—spatial"""
         year, average duration of events, count of all matching days for each
         year.
         """
-        nnp = {}
-        lfdur = {}
-        allnp = {}
-        for group_name, group_df in self.data_yearly:
-            nnp[group_name] = 0
-            lfdur[group_name] = 0
-            allnp[group_name] = 0
-            pdur = 0
-            flag = 0
-            for index, value in group_df.items():
-                if eval(f"value {than} thresh"):
-                    pdur = pdur + 1
-                    flag = flag + 1
-                    allnp[group_name] += 1
-                    if flag == 1:
-                        nnp[group_name] += 1
-                else:
-                    flag = 0
-            if nnp[group_name] > 0:
-                lfdur[group_name] = pdur / nnp[group_name]
-        lfdur = pd.Series(data=lfdur.values())
-        lfdur = lfdur[lfdur > 0]
-        return pd.Series(data=nnp.values()), lfdur, pd.Series(data=allnp.values())
+        values = self.data.to_numpy(dtype="float64")
+        if than == "<":
+            match = values < thresh
+        elif than == ">":
+            match = values > thresh
+        else:
+            raise ValueError(
+                tsutils.error_wrapper(
+                    f"""
+                    The comparison operator must be "<" or ">", instead of
+                    "{than}".
+                    """
+                )
+            )
+
+        # An event starts at each matching value that doesn't continue an
+        # event from the previous value in the same water year.
+        wyear = self._water_year_key
+        cont = np.zeros(len(match), dtype=bool)
+        cont[1:] = match[:-1] & (wyear[1:] == wyear[:-1])
+        starts = match & ~cont
+
+        nnp = self._fill_years(
+            pd.Series(starts).groupby(wyear).sum(), fill_value=0
+        ).reset_index(drop=True)
+        allnp = self._fill_years(
+            pd.Series(match).groupby(wyear).sum(), fill_value=0
+        ).reset_index(drop=True)
+        lfdur = allnp[nnp > 0] / nnp[nnp > 0]
+        lfdur = lfdur[lfdur > 0].reset_index(drop=True)
+        return nnp, lfdur, allnp
 
     def FL1(self):
         thresh = self.data.quantile(0.25)
@@ -1037,7 +1169,7 @@ dimensionless—spatial"""
     FH9 = _make_FH_8_9(0.25)
 
     def FH10(self):
-        thresh = self.data_yearly.min().median()
+        thresh = self.data_yearly_min.median()
         nnp, _, _ = self.event_statistics(thresh, ">")
         return nnp.median() if self.use_median is True else nnp.mean()
 
@@ -1045,18 +1177,17 @@ dimensionless—spatial"""
         return None
 
     def DL1(self):
-        stat = self.data_yearly.min()
+        stat = self.data_yearly_min
         return stat.median() if self.use_median is True else stat.mean()
 
     def _preroll(self, days, stattype):
-        stats = []
-        for _, vals in self.data_yearly:
-            rmean = vals.rolling(days).mean()
-            if stattype == "min":
-                stats.append(rmean.min())
-            elif stattype == "max":
-                stats.append(rmean.max())
-        return pd.Series(data=stats, index=range(len(stats)))
+        """Yearly minimum or maximum of the `days` moving average flow."""
+        if (days, stattype) not in self._rolled:
+            rmean = self.data_yearly.rolling(days).mean().groupby(level=0)
+            self._rolled[(days, stattype)] = (
+                rmean.min() if stattype == "min" else rmean.max()
+            )
+        return self._rolled[(days, stattype)]
 
     def _roll(self, days, stattype):
         stat = self._preroll(days, stattype)
@@ -1115,29 +1246,38 @@ dimensionless—spatial"""
         _, lfdur, _ = self.event_statistics(thresh, "<")
         return lfdur.std() / lfdur.mean() * 100
 
+    @cached_property
+    def _zero_days_by_year(self):
+        """Number of zero flow days in every water year of the record."""
+        zero = pd.Series(np.asarray(self.data == 0, dtype=bool))
+        return zero.groupby(self._water_year_key).sum().pipe(self._fill_years, 0)
+
+    @cached_property
+    def _zero_days_yearly(self):
+        """Number of zero flow days in each water year from the first to the
+        last water year with zero flows."""
+        stat = self._zero_days_by_year
+        years = stat.index[stat > 0]
+        if len(years) == 0:
+            return stat.iloc[:0]
+        return stat.loc[years.min() : years.max()]
+
     def DL18(self):
-        stat = (
-            self.data[self.data == 0].groupby(pd.Grouper(freq=self.water_year)).count()
-        )
+        stat = self._zero_days_yearly
         if any(stat):
             return stat.median() if self.use_median is True else stat.mean()
         return 0
 
     def DL19(self):
-        stat = (
-            self.data[self.data == 0].groupby(pd.Grouper(freq=self.water_year)).count()
-        )
+        stat = self._zero_days_yearly
         ret = stat.std() / stat.mean() * 100
-        try:
-            return ret.fillna(0)
-        except AttributeError:
-            return 0 if isinstance(ret, type(pd.NA)) else ret
+        return 0 if pd.isna(ret) else ret
 
     def DL20(self):
         return self.data_monthly_mean[self.data_monthly_mean == 0].count()
 
     def DH1(self):
-        stat = self.data_yearly.max()
+        stat = self.data_yearly_max
         stat = stat.median() if self.use_median else stat.mean()
         return stat
 
@@ -1212,38 +1352,30 @@ dimensionless—spatial"""
 
         lq[self.data == 0.0] = np.log10(0.01)
 
-        table = [
-            lq[lq < 0.1 * lma1],
-            lq[(lq >= 0.1 * lma1) & (lq < 0.25 * lma1)],
-            lq[(lq >= 0.25 * lma1) & (lq < 0.5 * lma1)],
-            lq[(lq >= 0.5 * lma1) & (lq < 0.75 * lma1)],
-            lq[(lq >= 0.75 * lma1) & (lq < lma1)],
-            lq[(lq >= lma1) & (lq < 1.25 * lma1)],
-            lq[(lq >= 1.25 * lma1) & (lq < 1.5 * lma1)],
-            lq[(lq >= 1.5 * lma1) & (lq < 1.75 * lma1)],
-            lq[(lq >= 1.75 * lma1) & (lq < 2.0 * lma1)],
-            lq[(lq >= 2.0 * lma1) & (lq < 2.25 * lma1)],
-            lq[lq >= 2.25 * lma1],
+        masks = [
+            lq < 0.1 * lma1,
+            (lq >= 0.1 * lma1) & (lq < 0.25 * lma1),
+            (lq >= 0.25 * lma1) & (lq < 0.5 * lma1),
+            (lq >= 0.5 * lma1) & (lq < 0.75 * lma1),
+            (lq >= 0.75 * lma1) & (lq < lma1),
+            (lq >= lma1) & (lq < 1.25 * lma1),
+            (lq >= 1.25 * lma1) & (lq < 1.5 * lma1),
+            (lq >= 1.5 * lma1) & (lq < 1.75 * lma1),
+            (lq >= 1.75 * lma1) & (lq < 2.0 * lma1),
+            (lq >= 2.0 * lma1) & (lq < 2.25 * lma1),
+            lq >= 2.25 * lma1,
         ]
 
-        ndf = pd.DataFrame()
-        for indx, df in enumerate(table):
-            if df.empty:
-                ndf = pd.concat(
-                    [
-                        ndf,
-                        pd.DataFrame(
-                            data=[0] * 365, index=range(1, 366), columns=[indx]
-                        ),
-                    ],
-                    axis="columns",
-                )
-                continue
-            ldf = [df[df.index.dayofyear == day].count() for day in range(1, 366)]
-            ndf = pd.concat(
-                [ndf, pd.DataFrame(data=ldf, index=range(1, 366), columns=[indx])],
-                axis="columns",
-            )
+        # Count of each flow class on each day of the year.
+        ndf = pd.DataFrame(
+            {
+                indx: np.bincount(
+                    self._doy_key[np.asarray(mask, dtype=bool)], minlength=367
+                )[1:366]
+                for indx, mask in enumerate(masks)
+            },
+            index=range(1, 366),
+        )
         Z = ndf.sum().sum()
         XJ = ndf.T.sum()
         YI = ndf.sum()
@@ -1264,19 +1396,21 @@ dimensionless—spatial"""
     def TA3(self):
         return None
 
+    @cached_property
+    def _yearly_min_doy(self):
+        """Day of year of the minimum flow in each water year."""
+        return self.data_yearly.idxmin().dt.dayofyear
+
+    @cached_property
+    def _yearly_max_doy(self):
+        """Day of year of the maximum flow in each water year."""
+        return self.data_yearly.idxmax().dt.dayofyear
+
     def _min_max_doy(self, stat):
         if stat == "min":
-            jd = (
-                self.data.groupby(pd.Grouper(freq=self.water_year))
-                .idxmin()
-                .dt.dayofyear
-            )
+            jd = self._yearly_min_doy.copy()
         if stat == "max":
-            jd = (
-                self.data.groupby(pd.Grouper(freq=self.water_year))
-                .idxmax()
-                .dt.dayofyear
-            )
+            jd = self._yearly_max_doy.copy()
         mask = jd > 365.25
         jd.loc[mask] = jd.loc[mask] - 365.25
         jd = jd * 2 * np.pi / 365.25
@@ -1386,22 +1520,308 @@ dimensionless—spatial"""
         log = log[log > 0]
         return log.median()
 
-    def _changes(self):
-        peaks = find_peaks(self.data)[0]
-        valleys = find_peaks(-self.data)[0]
-        changes = np.append(peaks, valleys)
-        changes = pd.DataFrame(self.data.iloc[changes])
-        df = pd.DataFrame(range(len(changes.index)), index=changes.index)
-        df = df.groupby(pd.Grouper(freq=self.water_year)).count()
-        return df
+    @cached_property
+    def reversals_yearly(self):
+        """Number of reversals in each water year.
+
+        A reversal is a change from rising to falling flows, or from falling
+        to rising.  A reversal across a run of equal flows is placed at the
+        middle of the run.  The counts cover the water years from the first
+        to the last reversal.
+        """
+        delta = np.diff(np.asarray(self.data, dtype="float64"))
+        moves = np.flatnonzero(delta)
+        rising = delta[moves] > 0
+        turns = np.flatnonzero(rising[:-1] != rising[1:])
+        where = (moves[turns] + 1 + moves[turns + 1]) // 2
+        years = self._water_year_key[where]
+        if len(years) == 0:
+            return pd.Series([], dtype="int64")
+        return pd.Series(
+            np.bincount(years - years.min()),
+            index=pd.RangeIndex(years.min(), years.max() + 1),
+        )
 
     def RA8(self):
-        df = self._changes()
-        return df.median()[0] if self.use_median else df.mean()[0]
+        stat = self.reversals_yearly
+        return stat.median() if self.use_median else stat.mean()
 
     def RA9(self):
-        df = self._changes()
-        return (df.std() / df.mean())[0] * 100
+        stat = self.reversals_yearly
+        return stat.std() / stat.mean() * 100
+
+
+class MultiIndices(Indices):
+    """Hydrologic indices for many stations at once.
+
+    The flows are kept as one aligned (time x station) DataFrame.  Indices
+    that are grouped reductions (means, medians, minimums, maximums,
+    quantiles, ...) over the whole record, months, or water years are
+    evaluated for all stations in one pass and return a Series indexed by
+    station.  The remaining indices depend on the sequence of each station's
+    valid values (rolling windows, day to day changes, events) and are
+    calculated station by station with `Indices`.
+    """
+
+    _vectorized = frozenset(
+        [f"MA{i}" for i in range(1, 46)]
+        + [f"ML{i}" for i in range(1, 17)]
+        + ["ML19", "ML21", "ML22"]
+        + [f"MH{i}" for i in range(1, 21)]
+        + ["DL1", "DL11", "DL14", "DL15", "DL20", "DH1", "DH11", "DH14"]
+    )
+
+    def __init__(self, data, use_median=False, water_year="YE-SEP", drainage_area=1):
+        super().__init__(data, use_median=use_median, water_year=water_year)
+        if np.ndim(drainage_area) == 0:
+            self.drainage_area = float(drainage_area)
+        else:
+            self.drainage_area = pd.Series(
+                np.asarray(drainage_area, dtype="float64"), index=self.data.columns
+            )
+        self._stations = {}
+
+    def _clean(self, data):
+        """Return the aligned flows with negative values set to missing."""
+        data = pd.DataFrame(data).astype("float64")
+        data = data.where(data >= 0)
+        return data.dropna(how="all")
+
+    def _station(self, col):
+        """Return, and cache, the single station `Indices` for `col`."""
+        if col not in self._stations:
+            drainage_area = self.drainage_area
+            if isinstance(drainage_area, pd.Series):
+                drainage_area = drainage_area[col]
+            self._stations[col] = Indices(
+                self.data[[col]],
+                use_median=self.use_median,
+                water_year=self.water_year,
+                drainage_area=drainage_area,
+            )
+        return self._stations[col]
+
+    def compute(self, *codes):
+        """Return a station x index DataFrame for the hydrologic index `codes`."""
+        return pd.DataFrame(
+            {code: getattr(self, code)() for code in codes}, index=self.data.columns
+        )
+
+    def _by_station(self, code):
+        """Return the index `code` calculated station by station."""
+        return pd.Series(
+            {col: getattr(self._station(col), code)() for col in self.data.columns},
+            index=self.data.columns,
+            dtype="float64",
+        )
+
+    def _by_station_method(code: str):
+        def template(self):
+            return self._by_station(code)
+
+        template.__name__ = code
+        template.__doc__ = getattr(Indices, code).__doc__
+        return template
+
+    # The indices that are not `_vectorized`.
+    ML17 = _by_station_method("ML17")
+    ML18 = _by_station_method("ML18")
+    ML20 = _by_station_method("ML20")
+    MH21 = _by_station_method("MH21")
+    MH22 = _by_station_method("MH22")
+    MH23 = _by_station_method("MH23")
+    MH24 = _by_station_method("MH24")
+    MH25 = _by_station_method("MH25")
+    MH26 = _by_station_method("MH26")
+    MH27 = _by_station_method("MH27")
+    FL1 = _by_station_method("FL1")
+    FL2 = _by_station_method("FL2")
+    FL3 = _by_station_method("FL3")
+    FH1 = _by_station_method("FH1")
+    FH2 = _by_station_method("FH2")
+    FH3 = _by_station_method("FH3")
+    FH4 = _by_station_method("FH4")
+    FH5 = _by_station_method("FH5")
+    FH6 = _by_station_method("FH6")
+    FH7 = _by_station_method("FH7")
+    FH8 = _by_station_method("FH8")
+    FH9 = _by_station_method("FH9")
+    FH10 = _by_station_method("FH10")
+    FH11 = _by_station_method("FH11")
+    DL2 = _by_station_method("DL2")
+    DL3 = _by_station_method("DL3")
+    DL4 = _by_station_method("DL4")
+    DL5 = _by_station_method("DL5")
+    DL6 = _by_station_method("DL6")
+    DL7 = _by_station_method("DL7")
+    DL8 = _by_station_method("DL8")
+    DL9 = _by_station_method("DL9")
+    DL10 = _by_station_method("DL10")
+    DL12 = _by_station_method("DL12")
+    DL13 = _by_station_method("DL13")
+    DL16 = _by_station_method("DL16")
+    DL17 = _by_station_method("DL17")
+    DL18 = _by_station_method("DL18")
+    DL19 = _by_station_method("DL19")
+    DH2 = _by_station_method("DH2")
+    DH3 = _by_station_method("DH3")
+    DH4 = _by_station_method("DH4")
+    DH5 = _by_station_method("DH5")
+    DH6 = _by_station_method("DH6")
+    DH7 = _by_station_method("DH7")
+    DH8 = _by_station_method("DH8")
+    DH9 = _by_station_method("DH9")
+    DH10 = _by_station_method("DH10")
+    DH12 = _by_station_method("DH12")
+    DH13 = _by_station_method("DH13")
+    DH15 = _by_station_method("DH15")
+    DH16 = _by_station_method("DH16")
+    DH17 = _by_station_method("DH17")
+    DH18 = _by_station_method("DH18")
+    DH19 = _by_station_method("DH19")
+    DH20 = _by_station_method("DH20")
+    DH21 = _by_station_method("DH21")
+    DH22 = _by_station_method("DH22")
+    DH23 = _by_station_method("DH23")
+    DH24 = _by_station_method("DH24")
+    TA1 = _by_station_method("TA1")
+    TA2 = _by_station_method("TA2")
+    TA3 = _by_station_method("TA3")
+    TL1 = _by_station_method("TL1")
+    TL2 = _by_station_method("TL2")
+    TL3 = _by_station_method("TL3")
+    TL4 = _by_station_method("TL4")
+    TH1 = _by_station_method("TH1")
+    TH2 = _by_station_method("TH2")
+    TH3 = _by_station_method("TH3")
+    RA1 = _by_station_method("RA1")
+    RA2 = _by_station_method("RA2")
+    RA3 = _by_station_method("RA3")
+    RA4 = _by_station_method("RA4")
+    RA5 = _by_station_method("RA5")
+    RA6 = _by_station_method("RA6")
+    RA7 = _by_station_method("RA7")
+    RA8 = _by_station_method("RA8")
+    RA9 = _by_station_method("RA9")
+
+
+class IndexState:
+    """Monthly and water year summary tables of one station's flows.
+
+    The tables are the aggregates that `Indices` calculates from the whole
+    record: monthly and annual means, minimums, maximums..., the annual
+    extremes of the moving average flows, the zero flow day counts and the
+    days of year of the annual extremes.  `append` calculates them only for
+    the water years covered by the new flows, so that the indices that are
+    means or medians of these tables refresh in about one water year of
+    work.  Indices that depend on statistics of the whole record, for
+    example flow quantiles or the thresholds of the event statistics, are
+    still calculated from all of the flows.
+
+    The state is a plain Python object and can be pickled between updates.
+    """
+
+    # Table name and the value of water years or months without data.
+    _tables = types.MappingProxyType(
+        {
+            "data_monthly_mean": np.nan,
+            "data_monthly_min": np.nan,
+            "data_monthly_max": np.nan,
+            "data_monthly_std": np.nan,
+            "data_yearly_mean": np.nan,
+            "data_yearly_median": np.nan,
+            "data_yearly_min": np.nan,
+            "data_yearly_max": np.nan,
+            "data_yearly_std": np.nan,
+            "_yearly_min_7day": np.nan,
+            "_zero_days_by_year": 0,
+            "_yearly_min_doy": None,
+            "_yearly_max_doy": None,
+        }
+    )
+
+    # Moving average windows, in days, of the rolling extremes.
+    _windows = (1, 3, 7, 30, 90)
+
+    def __init__(self, data, use_median=False, water_year="YE-SEP", drainage_area=1):
+        self.use_median = use_median
+        self.water_year = water_year
+        self.drainage_area = drainage_area
+
+        ind = self._indices(data)
+        self.data = ind.data
+        self.tables = {name: getattr(ind, name) for name in self._tables}
+        self.rolled = {
+            (days, stattype): ind._preroll(days, stattype)
+            for days in self._windows
+            for stattype in ("min", "max")
+        }
+
+    def _indices(self, data):
+        return Indices(
+            data,
+            use_median=self.use_median,
+            water_year=self.water_year,
+            drainage_area=self.drainage_area,
+        )
+
+    def append(self, data):
+        """Add flows that follow the flows already in the state.
+
+        Only the water years from the one containing the first new flow are
+        recalculated, so a partial water year can be completed by later
+        appends.
+        """
+        new = self._indices(data).data
+        if len(new) == 0:
+            return self
+        if len(self.data) > 0 and new.index[0] <= self.data.index[-1]:
+            raise ValueError(
+                tsutils.error_wrapper(
+                    f"""
+                    The appended flows must start after the last flow in the
+                    state, {self.data.index[-1]}, instead of at
+                    {new.index[0]}.
+                    """
+                )
+            )
+
+        # The water year of the first new flow starts less than a year before
+        # it.  The 6 flows before that carry the 7-day moving average across
+        # the start of the water year.
+        cut = new.index[0] - pd.DateOffset(years=1)
+        recent = self.data[self.data.index >= cut]
+        context = self.data[self.data.index < cut].iloc[-6:]
+        ind = self._indices(pd.concat([context, recent, new]).to_frame())
+
+        wyear = ind._water_year_key
+        first = np.searchsorted(wyear, wyear[len(context) + len(recent)])
+        first_year = wyear[first]
+        first_month = ind._year_month_key[first]
+
+        for name, fill_value in self._tables.items():
+            stat = getattr(ind, name)
+            old = self.tables[name]
+            start = first_month if name.startswith("data_monthly") else first_year
+            stat = pd.concat([old[old.index < start], stat[stat.index >= start]])
+            if fill_value is not None:
+                stat = stat.reindex(Indices._span(stat.index), fill_value=fill_value)
+            self.tables[name] = stat
+        for key, old in self.rolled.items():
+            stat = ind._preroll(*key)
+            self.rolled[key] = pd.concat(
+                [old[old.index < first_year], stat[stat.index >= first_year]]
+            )
+
+        self.data = pd.concat([self.data, new])
+        return self
+
+    def indices(self):
+        """Return the `Indices` of the flows, using the summary tables."""
+        ind = self._indices(self.data.to_frame())
+        ind.__dict__.update(self.tables)
+        ind._rolled.update(self.rolled)
+        return ind
 
 
 if __name__ == "__main__":
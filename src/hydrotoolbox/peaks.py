@@ -0,0 +1,45 @@
+"""Storm peaks of `storm_events` and `streaming.StormDetector`."""
+
+__all__ = [
+    "select_peaks",
+    "storm_peaks",
+]
+
+import numpy as np
+
+
+def storm_peaks(values, min_peak, window):
+    """Positions of the peaks of at least `min_peak`, `window` terms apart.
+
+    The `height` and `distance` selection of scipy.signal.find_peaks on all
+    of the flows.
+    """
+    from scipy.signal import find_peaks
+
+    return find_peaks(values, height=min_peak, distance=window)[0]
+
+
+def select_peaks(peaks, heights, window):
+    """Remove the peaks within `window` terms of a higher peak.
+
+    This is the `distance` selection of scipy.signal.find_peaks for peaks
+    that are found a few flows at a time, except that peaks of equal height
+    are always resolved in favor of the later peak, where scipy's order
+    depends on its sort.  Only groups of peaks closer than `window` are
+    processed.
+    """
+    keep = np.ones(len(peaks), dtype=bool)
+    close = np.diff(peaks) < window
+    crowded = np.concatenate([[False], close]) | np.concatenate([close, [False]])
+    for j in np.lexsort((peaks, heights))[::-1]:
+        if not crowded[j] or not keep[j]:
+            continue
+        k = j - 1
+        while k >= 0 and peaks[j] - peaks[k] < window:
+            keep[k] = False
+            k -= 1
+        k = j + 1
+        while k < len(peaks) and peaks[k] - peaks[j] < window:
+            keep[k] = False
+            k += 1
+    return peaks[keep]
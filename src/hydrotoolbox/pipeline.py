@@ -0,0 +1,227 @@
+"""Run several analyses on one flow record that is read once.
+
+A pipeline is a TOML file (or the same structure as a dictionary) like::
+
+    input_ts = "gauge.csv"
+    target_units = "cms"
+    start_date = "2000-10-01"
+
+    [[analysis]]
+    function = "flow_duration"
+    output = "flow_duration.csv"
+
+    [[analysis]]
+    function = "exceedance_time"
+    thresholds = [10, 100]
+    time_units = "hour"
+    output = "exceedance_time.csv"
+
+    [[analysis]]
+    function = "baseflow_sep.eckhardt"
+    k = 0.97
+    bfi_max = 0.8
+    output = "eckhardt.csv"
+
+The top level keys are the options that read and clean the flows, which is
+done once.  Each analysis names a hydrotoolbox function and gives its other
+keyword arguments, with the thresholds of `exceedance_time` and
+`exceedance_events` as a "thresholds" list and the codes of `indices` as an
+"indice_codes" list.  The optional "output", "tablefmt" and
+"float_format" keys write the result like the command line does, with an
+"output" of "-" for standard output and "parquet", "feather" or "npz" as the
+"tablefmt" of binary columnar files.  The optional "name" key tells apart
+analyses that use the same function.
+"""
+
+__all__ = [
+    "run",
+]
+
+import contextlib
+import sys
+
+import pandas as pd
+
+try:
+    import tomllib
+except ImportError:
+    import tomli as tomllib
+
+from hydrotoolbox import columnar
+from hydrotoolbox.toolbox_utils.src.toolbox_utils import tsutils
+
+_READ_OPTIONS = (
+    "input_ts",
+    "columns",
+    "source_units",
+    "start_date",
+    "end_date",
+    "dropna",
+    "clean",
+    "round_index",
+    "skiprows",
+    "index_type",
+    "names",
+    "target_units",
+)
+
+# Options given as a list to the positional arguments of a function.
+_POSITIONAL = {
+    "exceedance_events": "thresholds",
+    "exceedance_time": "thresholds",
+    "indices": "indice_codes",
+}
+
+_OUTPUT_OPTIONS = (
+    "name",
+    "function",
+    "output",
+    "tablefmt",
+    "float_format",
+)
+
+
+def _functions():
+    """The functions a pipeline can run, by name."""
+    from hydrotoolbox import baseflow_sep, hydrotoolbox
+
+    functions = {
+        name: getattr(hydrotoolbox, name)
+        for name in (
+            "exceedance_events",
+            "exceedance_time",
+            "flow_duration",
+            "indices",
+            "recession",
+            "storm_events",
+        )
+    }
+    functions.update(
+        {
+            f"baseflow_sep.{name}": getattr(baseflow_sep, name)
+            for name in baseflow_sep.__all__
+        }
+    )
+    return functions
+
+
+def _table(result, name):
+    """A DataFrame of the result of an analysis, for writing."""
+    # Writing renames the index, which must not change the result.
+    return columnar.to_frame(result, name=name).copy()
+
+
+def run(pipeline, write=True):
+    """Run the analyses of a pipeline on one flow record that is read once.
+
+    Parameters
+    ----------
+    pipeline : str, os.PathLike or dict
+        The path of a TOML pipeline file, or its contents as a dictionary.
+    write : bool
+        [optional, default is True]
+
+        Write the result of each analysis that has an "output" file.
+
+    Returns
+    -------
+    results
+        A dictionary of the result of each analysis, by its "name" or else
+        its "function".
+    """
+    if not isinstance(pipeline, dict):
+        with open(pipeline, "rb") as fpi:
+            pipeline = tomllib.load(fpi)
+    pipeline = dict(pipeline)
+    analyses = pipeline.pop("analysis", [])
+    unknown = set(pipeline) - set(_READ_OPTIONS)
+    if unknown:
+        raise ValueError(
+            tsutils.error_wrapper(
+                f"""
+                The pipeline options {sorted(unknown)} are not one of
+                {_READ_OPTIONS} or "analysis".
+                """
+            )
+        )
+    names = [analysis.get("name", analysis.get("function")) for analysis in analyses]
+    repeated = sorted({name for name in names if names.count(name) > 1}, key=str)
+    if repeated:
+        raise ValueError(
+            tsutils.error_wrapper(
+                f"""
+                The analysis names {repeated} are used more than once.  Give
+                analyses of the same function different "name" keys.
+                """
+            )
+        )
+
+    flow = tsutils.common_kwds(
+        columnar.read_iso_ts(
+            pipeline.get("input_ts", "-"),
+            skiprows=pipeline.get("skiprows"),
+            names=pipeline.get("names"),
+            index_type=pipeline.get("index_type", "datetime"),
+        ),
+        start_date=pipeline.get("start_date"),
+        end_date=pipeline.get("end_date"),
+        pick=pipeline.get("columns"),
+        round_index=pipeline.get("round_index"),
+        dropna=pipeline.get("dropna", "no"),
+        clean=pipeline.get("clean", False),
+        source_units=pipeline.get("source_units"),
+        target_units=pipeline.get("target_units"),
+    )
+
+    functions = _functions()
+    results = {}
+    outputs = []
+    for analysis in analyses:
+        function = analysis.get("function")
+        if function not in functions:
+            raise ValueError(
+                tsutils.error_wrapper(
+                    f"""
+                    The analysis function must be one of {sorted(functions)},
+                    instead of {function}.
+                    """
+                )
+            )
+        name = analysis.get("name", function)
+        kwds = {
+            key: value for key, value in analysis.items() if key not in _OUTPUT_OPTIONS
+        }
+        args = kwds.pop(_POSITIONAL.get(function), [])
+        if not isinstance(args, list):
+            args = [args]
+        kwds.setdefault("input_ts", flow)
+        results[name] = functions[function](*args, **kwds)
+
+        if "output" in analysis:
+            outputs.append(
+                (
+                    analysis["output"],
+                    _table(results[name], name),
+                    analysis.get("tablefmt", "csv"),
+                    analysis.get("float_format", "g"),
+                )
+            )
+
+    if write:
+        for output, table, tablefmt, float_format in outputs:
+            showindex = "never" if isinstance(table.index, pd.RangeIndex) else True
+            if tablefmt in columnar.FORMATS and output != "-":
+                columnar.write(table, tablefmt, output, showindex=showindex)
+                continue
+            with contextlib.ExitStack() as stack:
+                if output != "-":
+                    fpo = stack.enter_context(open(output, "w", encoding="utf-8"))
+                    stack.enter_context(contextlib.redirect_stdout(fpo))
+                columnar.printiso(
+                    table,
+                    tablefmt=tablefmt,
+                    float_format=float_format,
+                    showindex=showindex,
+                )
+                sys.stdout.flush()
+    return results
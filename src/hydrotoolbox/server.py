@@ -0,0 +1,228 @@
+"""Run hydrotoolbox commands in one long running process.
+
+The command line program is built once and each request runs one command
+with captured standard input, output and error.  Requests and responses are
+JSON lines, read from standard input or from connections to a Unix socket.
+"""
+
+__all__ = [
+    "request",
+    "run_command",
+    "serve",
+]
+
+import base64
+import contextlib
+import io
+import json
+import os
+import shlex
+import socketserver
+import stat
+import sys
+
+
+def run_command(program, args, stdin="", cwd=None):
+    """Run one command of the command line program.
+
+    Parameters
+    ----------
+    program : cltoolbox.Program
+        The command line program.
+    args : list or str
+        The command line arguments after "hydrotoolbox", as a list or as a
+        string that is split like a shell would.
+    stdin : str
+        [optional, default is ""]
+
+        The standard input of the command.
+    cwd : str
+        [optional, default is None]
+
+        The directory to run the command in, for relative file names.
+
+    Returns
+    -------
+    response
+        A dictionary with the "returncode" and the captured "stdout" and
+        "stderr" of the command.  The binary output of the "npz", "parquet"
+        and "feather" table formats is returned base64 encoded as
+        "stdout_base64".
+    """
+    if isinstance(args, str):
+        args = shlex.split(args)
+    stdout = _Output()
+    stderr = io.StringIO()
+    returncode = 0
+    saved_stdin = sys.stdin
+    saved_cwd = os.getcwd()
+    try:
+        sys.stdin = io.StringIO(stdin or "")
+        if cwd is not None:
+            os.chdir(cwd)
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                program.execute([str(arg) for arg in args])
+            except SystemExit as exc:
+                # argparse exits after --help and for bad arguments.
+                if isinstance(exc.code, int):
+                    returncode = exc.code
+                elif exc.code is not None:
+                    print(exc.code, file=sys.stderr)
+                    returncode = 1
+            except Exception as exc:  # noqa: BLE001
+                # Any error of a command is its response, and the server
+                # goes on to the next request.
+                print(f"{type(exc).__name__}: {exc}", file=sys.stderr)
+                returncode = 1
+    finally:
+        sys.stdin = saved_stdin
+        os.chdir(saved_cwd)
+    response = {
+        "returncode": returncode,
+        "stdout": stdout.getvalue(),
+        "stderr": stderr.getvalue(),
+    }
+    binary = stdout.buffer.getvalue()
+    if binary:
+        response["stdout_base64"] = base64.b64encode(binary).decode("ascii")
+    return response
+
+
+class _Output(io.StringIO):
+    """Captured standard output with a `buffer` for binary output."""
+
+    def __init__(self):
+        super().__init__()
+        self.buffer = io.BytesIO()
+
+
+def _respond(program, line):
+    """The JSON response line to a JSON request line."""
+    try:
+        message = json.loads(line)
+        if not isinstance(message, dict):
+            raise TypeError("the request must be a JSON object")
+        response = run_command(
+            program,
+            message["args"],
+            stdin=message.get("stdin", ""),
+            cwd=message.get("cwd"),
+        )
+    except (ValueError, KeyError, TypeError) as exc:
+        response = {
+            "returncode": 1,
+            "stdout": "",
+            "stderr": f"Bad request: {exc}\n",
+        }
+    return json.dumps(response) + "\n"
+
+
+def serve(program=None, socket=None, requests=None, responses=None):
+    """Answer requests to run commands until the input is closed.
+
+    Parameters
+    ----------
+    program : cltoolbox.Program
+        [optional, default is None]
+
+        The command line program, built here if not given.
+    socket : str
+        [optional, default is None]
+
+        Path of a Unix socket to listen on.  Each connection sends request
+        lines and gets a response line for each, and the server runs until
+        it is interrupted.
+    requests
+        [optional, default is sys.stdin]
+
+        Where to read request lines from when there is no `socket`.
+    responses
+        [optional, default is sys.stdout]
+
+        Where to write response lines to when there is no `socket`.
+    """
+    if program is None:
+        from hydrotoolbox.hydrotoolbox import _program
+
+        program = _program()
+
+    if socket is None:
+        requests = sys.stdin if requests is None else requests
+        responses = sys.stdout if responses is None else responses
+        for line in requests:
+            if line.strip():
+                responses.write(_respond(program, line))
+                responses.flush()
+        return
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            for line in self.rfile:
+                if line.strip():
+                    self.wfile.write(_respond(program, line).encode())
+                    self.wfile.flush()
+
+    if os.path.lexists(socket):
+        # Only a socket left by an earlier server is replaced.
+        if not stat.S_ISSOCK(os.lstat(socket).st_mode):
+            raise ValueError(
+                f"The socket path {socket} is a file that is not a socket."
+            )
+        os.remove(socket)
+    # Commands share the standard streams and working directory, so the
+    # requests are answered one at a time.
+    with socketserver.UnixStreamServer(socket, Handler) as server:
+        created = os.lstat(socket)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            # Unless another server has replaced it, remove the socket.
+            with contextlib.suppress(FileNotFoundError):
+                current = os.lstat(socket)
+                if (current.st_dev, current.st_ino) == (
+                    created.st_dev,
+                    created.st_ino,
+                ):
+                    os.remove(socket)
+
+
+def request(socket, args, stdin="", cwd=None):
+    """Send one command to a server listening on a Unix socket.
+
+    Parameters
+    ----------
+    socket : str
+        Path of the Unix socket of a `hydrotoolbox serve --socket` server.
+    args : list or str
+        The command line arguments after "hydrotoolbox".
+    stdin : str
+        [optional, default is ""]
+
+        The standard input of the command.
+    cwd : str
+        [optional, default is the current directory]
+
+        The directory to run the command in, for relative file names.
+
+    Returns
+    -------
+    response
+        A dictionary with the "returncode", "stdout" and "stderr" of the
+        command, and the "stdout_base64" of binary output.
+    """
+    import socket as sockets
+
+    message = {
+        "args": args,
+        "stdin": stdin,
+        "cwd": os.getcwd() if cwd is None else cwd,
+    }
+    with sockets.socket(sockets.AF_UNIX, sockets.SOCK_STREAM) as connection:
+        connection.connect(socket)
+        stream = connection.makefile("rwb")
+        stream.write((json.dumps(message) + "\n").encode())
+        stream.flush()
+        return json.loads(stream.readline())
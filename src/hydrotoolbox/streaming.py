@@ -0,0 +1,550 @@
+"""Tools for flows that arrive a few values at a time."""
+
+__all__ = [
+    "BaseflowFilter",
+    "FlowDurationSketch",
+    "StormDetector",
+]
+
+import types
+
+import numpy as np
+import pandas as pd
+from scipy.signal import find_peaks
+
+from hydrotoolbox.peaks import select_peaks
+from hydrotoolbox.toolbox_utils.src.toolbox_utils import tsutils
+
+
+class StormDetector:
+    """Storm events of a flow series that arrives a few values at a time.
+
+    The storms are the ones that `hydrotoolbox.storm_events` finds in the
+    whole series with the same `rise_lag`, `fall_lag`, `min_peak` and
+    `window`, except that when two peaks of equal height are within
+    `window` of each other the later one is always kept.  Each call to
+    `update` returns the storm events that were completed by the new flows,
+    and `flush` returns the rest at the end of the series.
+
+    Only the flows that can still be part of a storm event are kept, which
+    is about `rise_lag` + `window` + `fall_lag` values plus all of the flows
+    of the storm event in progress.  The memory used therefore grows with
+    the length of a storm event until it is completed.
+
+    Parameters
+    ----------
+    rise_lag : int
+        Sets the number of time-series terms to include from the rising limb
+        of the hydrograph.
+    fall_lag : int
+        Sets the number of time-series terms to include from the falling limb
+        of the hydrograph.
+    min_peak : int, float
+        [optional, default=0]
+
+        All detected storm peaks in the hydrograph must be at least
+        `min_peak`.  Unlike `storm_events` there is no default from the
+        median flow, which isn't known until the end of the series.
+    window : int
+        [optional, default=1]
+
+        Adjacent peaks can not be within `window` time-series terms of each
+        other.
+    """
+
+    def __init__(self, rise_lag, fall_lag, min_peak=0, window=1):
+        self.rise_lag = int(float(rise_lag))
+        self.fall_lag = int(float(fall_lag))
+        if self.rise_lag < 0 or self.fall_lag < 0:
+            raise ValueError("rise_lag and fall_lag must be greater than 0.")
+        self.min_peak = float(min_peak)
+        self.window = int(np.ceil(float(window)))
+        if self.window < 1:
+            raise ValueError(
+                tsutils.error_wrapper(
+                    f"""
+                    The window must be 1 or greater, instead of {window}.
+                    """
+                )
+            )
+
+        self.name = None
+        self.events = 0
+
+        # Positions are counted from the first flow of the series.  The
+        # buffer holds the flows from position self._start.
+        self._values = np.empty(0)
+        self._index = None
+        self._start = 0
+        self._count = 0
+
+        # All peaks before self._scan are known.  The peaks over min_peak that
+        # are still within `window` of a peak that might be found later are
+        # pending, and the windows of the selected peaks that haven't been
+        # returned are merged into [start, end] storm events.
+        self._scan = 0
+        self._pending = np.empty(0, dtype="int64")
+        self._storms = []
+
+    def update(self, flow):
+        """Add new flows and return the storm events they completed.
+
+        Parameters
+        ----------
+        flow : pandas.Series or pandas.DataFrame
+            The flows that follow the flows already given, as a Series or
+            a single column DataFrame.
+
+        Returns
+        -------
+        storms
+            A DataFrame of the time series terms of the completed storm
+            events with the flows and a "<name>_event" column of event
+            numbers, like `storm_events`.
+        """
+        if isinstance(flow, pd.DataFrame):
+            flow = flow.iloc[:, 0]
+        if self.name is None:
+            self.name = flow.name
+        values = flow.to_numpy(dtype="float64", na_value=np.nan)
+        self._values = np.concatenate([self._values, values])
+        if self._index is None:
+            self._index = flow.index
+        else:
+            self._index = self._index.append(flow.index)
+        self._count += len(values)
+
+        self._find_peaks(final=False)
+        return self._emit(final=False)
+
+    def flush(self):
+        """Return the storm events still in progress at the end of the flows."""
+        self._find_peaks(final=True)
+        return self._emit(final=True)
+
+    def _find_peaks(self, final):
+        values = self._values
+        if final or len(values) == 0:
+            scan = self._count
+        else:
+            # A plateau at the end of the buffer is a peak if the next
+            # different flow is lower, so peaks from its start are unknown.
+            differ = np.flatnonzero(values != values[-1])
+            plateau = differ[-1] + 1 if len(differ) > 0 else 0
+            if plateau > 0 and values[plateau - 1] < values[plateau]:
+                scan = self._start + plateau
+            else:
+                scan = self._count
+
+        peaks = find_peaks(values)[0] + self._start
+        peaks = peaks[(peaks >= self._scan) & (peaks < scan)]
+        peaks = peaks[values[peaks - self._start] >= self.min_peak]
+        self._pending = np.concatenate([self._pending, peaks])
+        self._scan = scan
+
+        # Peaks closer than `window` form groups.  Peaks in different groups
+        # can't remove each other, so each group is resolved when no more
+        # peaks can join it.
+        pending = self._pending
+        if len(pending) == 0:
+            return
+        breaks = np.flatnonzero(np.diff(pending) >= self.window) + 1
+        groups = np.split(pending, breaks)
+        if not final and groups[-1][-1] + self.window > scan:
+            self._pending = groups.pop()
+        else:
+            self._pending = pending[:0]
+        for group in groups:
+            heights = self._values[group - self._start]
+            for peak in select_peaks(group, heights, self.window):
+                self._add_storm(peak)
+
+    def _add_storm(self, peak):
+        start = max(peak - self.rise_lag, 0)
+        end = peak + self.fall_lag
+        # Peaks are added in order, so only the last storm can overlap or
+        # touch the new window.
+        if self._storms and start <= self._storms[-1][1] + 1:
+            self._storms[-1][1] = max(self._storms[-1][1], end)
+        else:
+            self._storms.append([start, end])
+
+    def _emit(self, final):
+        # A storm is complete when all of its flows have arrived and the
+        # window of no later peak can reach it.
+        if final:
+            later = np.inf
+        else:
+            later = min([self._scan, *self._pending[:1]]) - self.rise_lag
+        done = []
+        while self._storms:
+            start, end = self._storms[0]
+            if final:
+                end = min(end, self._count - 1)
+            elif end + 1 >= later or end >= self._count:
+                break
+            self._storms.pop(0)
+            done.append((start, end))
+
+        frames = []
+        for start, end in done:
+            self.events += 1
+            rows = slice(start - self._start, end - self._start + 1)
+            frames.append(
+                pd.DataFrame(
+                    {
+                        self.name: self._values[rows],
+                        f"{self.name}_event": pd.array(
+                            [self.events] * (end - start + 1), dtype="Int64"
+                        ),
+                    },
+                    index=self._index[rows],
+                )
+            )
+
+        # Keep the flows that can still be part of a storm or a peak.
+        if final:
+            keep = self._count
+        else:
+            keep = min(
+                self._scan - 1,
+                later,
+                *[storm[0] for storm in self._storms[:1]],
+            )
+        keep = int(min(max(keep, self._start), self._count))
+        self._values = self._values[keep - self._start :]
+        if self._index is not None:
+            self._index = self._index[keep - self._start :]
+        self._start = keep
+
+        if frames:
+            return pd.concat(frames)
+        return pd.DataFrame(
+            {
+                self.name: np.empty(0),
+                f"{self.name}_event": pd.array([], dtype="Int64"),
+            },
+            index=self._index[:0] if self._index is not None else None,
+        )
+
+
+class FlowDurationSketch:
+    """Approximate flow duration curves of flows read a chunk at a time.
+
+    Each column keeps the counts of its flows in logarithmic buckets, so the
+    memory depends on the range of the flows and not on the length of the
+    record.  Sketches of the same columns from different files or years can
+    be combined with `merge`.
+
+    Every flow duration value is within `relative_accuracy` of the value that
+    `hydrotoolbox.flow_duration` returns for all of the flows, i.e.
+    ``abs(approximate - exact) <= relative_accuracy * abs(exact)``.  Zero
+    flows are counted exactly.  A value interpolated between a negative and a
+    positive flow is instead within `relative_accuracy` of the larger of the
+    two.
+
+    Parameters
+    ----------
+    relative_accuracy : float
+        [optional, default=0.01]
+
+        The relative error bound of the flow duration values, greater than 0
+        and less than 1.
+    """
+
+    def __init__(self, relative_accuracy=0.01):
+        self.relative_accuracy = float(relative_accuracy)
+        if not 0 < self.relative_accuracy < 1:
+            raise ValueError(
+                tsutils.error_wrapper(
+                    f"""
+                    The relative_accuracy must be greater than 0 and less than
+                    1, instead of {relative_accuracy}.
+                    """
+                )
+            )
+        self._log_gamma = np.log1p(
+            2 * self.relative_accuracy / (1 - self.relative_accuracy)
+        )
+
+        # For each column the sorted bucket keys and counts of the positive
+        # flows, the same for the absolute values of the negative flows, and
+        # the count of zero flows.
+        self._columns = {}
+
+    def update(self, flow):
+        """Add a chunk of flows.
+
+        Parameters
+        ----------
+        flow : pandas.Series or pandas.DataFrame
+            The flows.  Each column is sketched separately and missing values
+            are skipped.
+
+        Returns
+        -------
+        self
+            The sketch, to allow ``sketch.update(a).update(b)``.
+        """
+        if isinstance(flow, pd.Series):
+            flow = flow.to_frame()
+        for column in flow.columns:
+            values = flow[column].to_numpy(dtype="float64", na_value=np.nan)
+            values = values[~np.isnan(values)]
+            positive = values[values > 0]
+            negative = -values[values < 0]
+            self._add(
+                column,
+                np.unique(self._keys(positive), return_counts=True),
+                np.unique(self._keys(negative), return_counts=True),
+                len(values) - len(positive) - len(negative),
+            )
+        return self
+
+    def merge(self, other):
+        """Add the flows of another sketch.
+
+        Parameters
+        ----------
+        other : FlowDurationSketch
+            A sketch with the same `relative_accuracy`.
+
+        Returns
+        -------
+        self
+            The combined sketch.
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError(
+                tsutils.error_wrapper(
+                    f"""
+                    Can only merge sketches with the same relative_accuracy,
+                    instead of {self.relative_accuracy} and
+                    {other.relative_accuracy}.
+                    """
+                )
+            )
+        for column, (positive, negative, zeros) in other._columns.items():
+            self._add(column, positive, negative, zeros)
+        return self
+
+    def flow_duration(
+        self,
+        exceedance_probabilities=(99.5, 99, 98, 95, 90, 75, 50, 25, 10, 5, 2, 1, 0.5),
+    ):
+        """Flow duration from the sketch.
+
+        Parameters
+        ----------
+        exceedance_probabilities
+            [optional, default: (99.5, 99, 98, 95, 90, 75, 50, 25, 10, 5, 2,
+            1, 0.5)]
+            Exceedance probabilities
+
+        Returns
+        -------
+        flow_duration
+            A DataFrame like `hydrotoolbox.flow_duration` with the
+            `relative_accuracy` in its ``attrs``.
+        """
+        exceedance_probabilities = np.array(exceedance_probabilities) / 100
+        quantiles = 1 - exceedance_probabilities
+        ndf = pd.DataFrame(
+            {
+                column: self._quantiles(*state, quantiles)
+                for column, state in self._columns.items()
+            },
+            index=pd.Index(exceedance_probabilities, name="Quantiles"),
+        )
+        ndf.attrs["relative_accuracy"] = self.relative_accuracy
+        return ndf
+
+    def _keys(self, values):
+        return np.ceil(np.log(values) / self._log_gamma).astype("int64")
+
+    def _add(self, column, positive, negative, zeros):
+        if column not in self._columns:
+            self._columns[column] = (positive, negative, zeros)
+            return
+        old_positive, old_negative, old_zeros = self._columns[column]
+        self._columns[column] = (
+            _merge_buckets(old_positive, positive),
+            _merge_buckets(old_negative, negative),
+            old_zeros + zeros,
+        )
+
+    def _quantiles(self, positive, negative, zeros, quantiles):
+        # Every flow in bucket `key` is within relative_accuracy of
+        # 2 * gamma**key / (gamma + 1).
+        gamma = np.exp(self._log_gamma)
+        values = np.concatenate(
+            [
+                -2 * np.exp(negative[0][::-1] * self._log_gamma) / (gamma + 1),
+                [0.0],
+                2 * np.exp(positive[0] * self._log_gamma) / (gamma + 1),
+            ]
+        )
+        counts = np.concatenate([negative[1][::-1], [zeros], positive[1]])
+        total = counts.sum()
+        if total == 0:
+            return np.full(len(quantiles), np.nan)
+
+        # Linear interpolation between the flows on either side of the
+        # position, like pandas.DataFrame.quantile.
+        position = quantiles * (total - 1)
+        lower = np.floor(position)
+        ends = np.cumsum(counts)
+        below = values[np.searchsorted(ends, lower, side="right")]
+        above = values[
+            np.searchsorted(ends, np.minimum(lower + 1, total - 1), side="right")
+        ]
+        return below + (above - below) * (position - lower)
+
+
+def _merge_buckets(first, second):
+    """Add the counts of two sets of sorted bucket keys and counts."""
+    keys, inverse = np.unique(
+        np.concatenate([first[0], second[0]]), return_inverse=True
+    )
+    counts = np.bincount(
+        inverse, weights=np.concatenate([first[1], second[1]]), minlength=len(keys)
+    )
+    return keys, counts.astype("int64")
+
+
+class BaseflowFilter:
+    """Baseflow of a recursive digital filter, a chunk of flows at a time.
+
+    The filter state of each column is carried from one chunk to the next,
+    so the baseflow is the same as the `hydrotoolbox.baseflow_sep` function
+    of the same `method` would return for all of the flows, while only one
+    chunk is in memory.  Like `baseflow_sep` the flows are put on a daily
+    index, and missing, zero and negative flows are skipped by the filter
+    and missing in the baseflow.
+
+    Parameters
+    ----------
+    method : str
+        One of "boughton", "chapman", "chapman_maxwell", "eckhardt",
+        "ihacres" or "lyne_hollick".
+    k : float
+        The groundwater recession constant.  It can't be estimated from
+        flows that are only seen a chunk at a time.
+    C : float
+        [optional, default=None]
+
+        The shape parameter of "boughton" and "ihacres".
+    a : float
+        [optional, default=None]
+
+        The "ihacres" parameter of the previous total flow.
+    bfi_max : float
+        [optional, default=None]
+
+        The long-term ratio of baseflow to total streamflow of "eckhardt".
+    """
+
+    _PARAMETERS = types.MappingProxyType(
+        {
+            "boughton": ("k", "C"),
+            "chapman": ("k",),
+            "chapman_maxwell": ("k",),
+            "eckhardt": ("k", "bfi_max"),
+            "ihacres": ("k", "C", "a"),
+            "lyne_hollick": ("k",),
+        }
+    )
+
+    def __init__(self, method, k, C=None, a=None, bfi_max=None):
+        if method not in self._PARAMETERS:
+            raise ValueError(
+                tsutils.error_wrapper(
+                    f"""
+                    The method must be one of {sorted(self._PARAMETERS)},
+                    instead of {method}.
+                    """
+                )
+            )
+        given = {"k": k, "C": C, "a": a, "bfi_max": bfi_max}
+        missing = [name for name in self._PARAMETERS[method] if given[name] is None]
+        if missing:
+            raise ValueError(
+                tsutils.error_wrapper(
+                    f"""
+                    The {method} filter needs {missing} to filter flows a
+                    chunk at a time, because they can only be estimated from
+                    all of the flows.
+                    """
+                )
+            )
+        self.method = method
+        self.parameters = [float(given[name]) for name in self._PARAMETERS[method]]
+        self.negative = 0
+        self.missing = 0
+
+        # The filter state of each column, and the first date of the next
+        # chunk on the daily index.
+        self._states = {}
+        self._next = None
+
+    def update(self, flow):
+        """Return the baseflow of the flows that follow the flows already given.
+
+        Parameters
+        ----------
+        flow : pandas.Series or pandas.DataFrame
+            The flows, with a date/time index.  They must start after the
+            last day of the previous chunk.
+
+        Returns
+        -------
+        baseflow
+            A DataFrame of the baseflow of each column on a daily index from
+            the day after the previous chunk to the last day of this one.
+        """
+        from hydrotoolbox.baseflow import methods
+
+        if isinstance(flow, pd.Series):
+            flow = flow.to_frame()
+        if len(flow) == 0:
+            return pd.DataFrame(columns=flow.columns, index=flow.index, dtype="float64")
+        if (flow.index[1:] - flow.index[:-1] < pd.Timedelta(days=1)).any():
+            raise ValueError(
+                tsutils.error_wrapper(
+                    """
+                    The baseflow filter needs daily flows, but there are
+                    flows less than a day apart.
+                    """
+                )
+            )
+        if self._next is not None and flow.index[0] < self._next:
+            raise ValueError(
+                tsutils.error_wrapper(
+                    f"""
+                    The flows must follow the flows already given, but they
+                    start at {flow.index[0]}, before {self._next}.
+                    """
+                )
+            )
+        start = flow.index[0] if self._next is None else self._next
+        index = pd.date_range(start=start, end=flow.index[-1], freq="D")
+        self._next = index[-1] + pd.Timedelta(days=1) if len(index) else start
+        flow = flow.reindex(index)
+
+        function = getattr(methods, self.method)
+        baseflow = np.full((len(index), len(flow.columns)), np.nan)
+        for position, column in enumerate(flow.columns):
+            values = flow[column].to_numpy(dtype="float64", na_value=np.nan)
+            missing = np.isnan(values)
+            valid = ~missing & (values > 0)
+            self.missing += int(missing.sum())
+            self.negative += int((~missing & ~valid).sum())
+            if valid.any():
+                baseflow[valid, position] = function(
+                    values[valid],
+                    *self.parameters,
+                    state=self._states.setdefault(column, {}),
+                )[0]
+        return pd.DataFrame(
+            baseflow, index=index.rename("Datetime"), columns=flow.columns
+        )
@@ -1,10 +1,21 @@
 """Utilities for other functions in hydrotoolbox."""
 
 import math
+from functools import cache
 
-from pint import UnitRegistry
 
-ureg = UnitRegistry()
+@cache
+def _unit_registry():
+    """The pint unit registry, created on first use since it is slow to build."""
+    from pint import UnitRegistry
+
+    return UnitRegistry()
+
+
+def __getattr__(name):
+    if name == "ureg":
+        return _unit_registry()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def nstar(area=None, area_unit="mile**2"):
@@ -18,7 +29,7 @@ def nstar(area=None, area_unit="mile**2"):
     if area is None:
         numdays = 5
     else:
-        area = area * ureg(area_unit)
+        area = area * _unit_registry()(area_unit)
         area = area.to("miles**2").magnitude
         numdays = area**0.2
     inn = math.ceil(2 * numdays)
@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+from pandas.testing import assert_frame_equal
+
+from hydrotoolbox import baseflow_sep, columnar, flow_duration
+from hydrotoolbox.archive import FlowArchive, write_archive
+
+
+def _flows():
+    index = pd.date_range("1900-01-01", periods=4000, freq="D", name="Datetime")
+    rng = np.random.default_rng(45)
+    return pd.DataFrame(
+        rng.lognormal(2, 1, (len(index), 3)),
+        index=index,
+        columns=["r0001", "r0002", "r0003"],
+    )
+
+
+def test_write_and_read_archive(tmp_path):
+    # Arrange
+    flows = _flows()
+    path = tmp_path / "realizations.flows"
+
+    # Act
+    write_archive(path, flows)
+    archive = FlowArchive(path)
+    picked = columnar.read(f"{path},r0003,r0001")
+
+    # Assert
+    assert not (path / "index.npy").exists()
+    assert isinstance(archive.values, np.memmap)
+    assert archive.values.flags.f_contiguous
+    assert_frame_equal(archive.frame(), flows, check_freq=False)
+    assert_frame_equal(picked, flows[["r0003", "r0001"]], check_freq=False)
+    assert np.shares_memory(archive["r0002"].to_numpy(), archive.values)
+
+
+def test_irregular_index(tmp_path):
+    # Arrange
+    flows = _flows().iloc[[0, 3, 4, 10, 50]]
+
+    # Act
+    archive = write_archive(tmp_path / "gauges.flows", flows)
+
+    # Assert
+    assert (tmp_path / "gauges.flows" / "index.npy").exists()
+    assert_frame_equal(
+        FlowArchive(tmp_path / "gauges.flows").frame(), flows, check_freq=False
+    )
+    assert len(archive) == 5
+
+
+def test_analyses_read_archive(tmp_path):
+    # Arrange
+    flows = _flows()
+    path = tmp_path / "realizations.flows"
+    write_archive(path, flows)
+
+    # Act
+    duration = flow_duration(str(path))
+    chunked = flow_duration(f"{path},r0002", chunksize=1000)
+    baseflow = baseflow_sep.eckhardt(f"{path},r0001", bfi_max=0.8)
+
+    # Assert
+    assert_frame_equal(duration, flow_duration(flows), check_dtype=False)
+    assert_frame_equal(chunked, flow_duration(flows[["r0002"]]), check_dtype=False)
+    assert_frame_equal(
+        baseflow,
+        baseflow_sep.eckhardt(flows[["r0001"]], bfi_max=0.8),
+        check_dtype=False,
+    )
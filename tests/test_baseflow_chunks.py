@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from hydrotoolbox import baseflow_sep
+from hydrotoolbox.streaming import BaseflowFilter
+
+
+@pytest.mark.parametrize(
+    "method, kwds",
+    [
+        ("boughton", {"k": 0.97, "C": 0.1}),
+        ("eckhardt", {"k": 0.97, "bfi_max": 0.8}),
+        ("ihacres", {"k": 0.97, "C": 0.1, "a": 0.2}),
+        ("lyne_hollick", {"alpha": 0.925}),
+    ],
+)
+def test_chunks_match_whole_record(method, kwds):
+    # Arrange
+    flow = pd.read_csv("tests/data.csv", index_col=0, parse_dates=True).iloc[:3000]
+    flow.iloc[10, 0] = np.nan
+    flow.iloc[20, 0] = 0
+    flow = flow.drop(flow.index[100:105])
+    function = getattr(baseflow_sep, method)
+    expected = function(input_ts=flow, print_input=True, **kwds)
+
+    # Act
+    chunks = list(function(input_ts=flow, print_input=True, chunksize=700, **kwds))
+
+    # Assert
+    assert len(chunks) == 5
+    assert_frame_equal(pd.concat(chunks), expected, check_freq=False, check_names=False)
+
+
+def test_chunks_need_parameters():
+    # Act and Assert
+    with pytest.raises(ValueError, match="bfi_max"):
+        baseflow_sep.eckhardt(input_ts="tests/data.csv", k=0.97, chunksize=100)
+
+
+def test_chunks_in_order():
+    # Arrange
+    flow = pd.read_csv("tests/data.csv", index_col=0, parse_dates=True).iloc[:100]
+    bf_filter = BaseflowFilter("chapman", k=0.97)
+    bf_filter.update(flow.iloc[:50])
+
+    # Act and Assert
+    with pytest.raises(ValueError, match="must follow"):
+        bf_filter.update(flow.iloc[40:60])
+    with pytest.raises(ValueError, match="must follow"):
+        bf_filter.update(flow.iloc[:10])
+    assert len(bf_filter.update(flow.iloc[50:])) == 50
@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from hydrotoolbox.baseflow_sep import bfsep
+
+
+def test_bfsep_daily_index():
+    # Arrange
+    flow = pd.read_csv("tests/data.csv", index_col=0, parse_dates=True).iloc[:400]
+    flow = flow.drop(flow.index[100:105])
+    flow.iloc[10, 0] = -1.0
+
+    # Act
+    result = bfsep(flow, "chapman", True, k=0.95)
+
+    # Assert
+    assert len(result) == 400
+    assert result.index.freqstr == "D"
+    assert list(result.columns) == ["Q", "Q::chapman"]
+    assert result.iloc[100:105].isna().all().all()
+    assert pd.isna(result.iloc[10, 1])
+    assert np.isclose(result.iloc[10, 0], -1.0)
+
+
+def test_bfsep_duplicate_dates():
+    # Arrange
+    flow = pd.read_csv("tests/data.csv", index_col=0, parse_dates=True).iloc[:10]
+    flow = pd.concat([flow, flow.iloc[[3]]])
+
+    # Act and Assert
+    with pytest.raises(ValueError, match="duplicates"):
+        bfsep(flow, "chapman", False, k=0.95)
+
+
+def test_bfsep_resolution():
+    # Arrange
+    daily = pd.read_csv("tests/data.csv", index_col=0, parse_dates=True).iloc[:400]
+    hourly = pd.DataFrame(
+        {"Q": np.repeat(daily["Q"].to_numpy(), 24)},
+        index=pd.date_range(daily.index[0], periods=24 * 400, freq="h"),
+    )
+
+    # Act
+    means = bfsep(hourly, "chapman", False, k=0.95)
+    native = bfsep(hourly, "chapman", True, k=0.95, resolution="native")
+    native_daily = bfsep(daily, "chapman", False, k=0.95, resolution="native")
+
+    # Assert
+    expected = bfsep(daily, "chapman", False, k=0.95)
+    pd.testing.assert_frame_equal(means, expected)
+    pd.testing.assert_frame_equal(native_daily, expected)
+    assert native.index.freqstr == "h"
+    assert (native["Q::chapman"] <= native["Q"]).all()
+    with pytest.raises(ValueError, match="native"):
+        bfsep(hourly, "five_day", False, resolution="native")
+
+
+@pytest.mark.parametrize(
+    "method, kwds",
+    [
+        ("chapman", {"k": 0.95}),
+        ("chapman_maxwell", {"k": 0.95}),
+        ("boughton", {"k": 0.95, "C": 0.05}),
+        ("eckhardt", {"k": 0.95, "bfi_max": 0.8}),
+        ("lyne_hollick", {"k": 0.925}),
+    ],
+)
+def test_bfsep_native_bfi(method, kwds):
+    # Arrange
+    daily = pd.read_csv("tests/data.csv", index_col=0, parse_dates=True).iloc[:3650]
+    hourly = pd.DataFrame(
+        {"Q": np.repeat(daily["Q"].to_numpy(), 24)},
+        index=pd.date_range(daily.index[0], periods=24 * 3650, freq="h"),
+    )
+
+    # Act
+    daily_bf = bfsep(daily, method, False, **kwds)
+    native_bf = bfsep(hourly, method, False, resolution="native", **kwds)
+
+    # Assert
+    daily_bfi = daily_bf.iloc[:, 0].sum() / daily["Q"].sum()
+    native_bfi = native_bf.iloc[:, 0].sum() / hourly["Q"].sum()
+    assert abs(native_bfi - daily_bfi) < 0.02
+
+
+def test_bfsep_native_parameters():
+    # Arrange
+    hourly = pd.DataFrame(
+        {"Q": np.arange(1.0, 49.0)},
+        index=pd.date_range("2000-01-01", periods=48, freq="h"),
+    )
+
+    # Act and Assert
+    with pytest.raises(ValueError, match="native"):
+        bfsep(hourly, "ihacres", False, k=0.95, C=0.1, a=0.1, resolution="native")
+    with pytest.raises(ValueError, match="native"):
+        bfsep(hourly, "boughton", False, k=0.95, resolution="native")
@@ -0,0 +1,93 @@
+import numpy as np
+import pandas as pd
+import pytest
+from hydrotoolbox.toolbox_utils.src.toolbox_utils import tsutils
+from pandas.testing import assert_frame_equal
+
+from hydrotoolbox import columnar, flow_duration, storm_events
+
+
+@pytest.fixture
+def flow():
+    return pd.read_csv("tests/data.csv", index_col=0, parse_dates=True).iloc[:3000]
+
+
+def test_read_npz_and_npy(tmp_path, flow):
+    # Arrange
+    np.savez(
+        tmp_path / "flow.npz", __index__=flow.index.to_numpy(), Q=flow["Q"].to_numpy()
+    )
+    records = np.zeros(len(flow), dtype=[("date", "datetime64[s]"), ("Q", "f8")])
+    records["date"] = flow.index.to_numpy()
+    records["Q"] = flow["Q"].to_numpy()
+    np.save(tmp_path / "flow.npy", records)
+    expected = flow_duration(flow)
+
+    # Act
+    from_npz = flow_duration(str(tmp_path / "flow.npz"))
+    from_npy = flow_duration(str(tmp_path / "flow.npy"))
+
+    # Assert
+    assert_frame_equal(from_npz, expected, check_dtype=False)
+    assert_frame_equal(from_npy, expected, check_dtype=False)
+
+
+@pytest.mark.parametrize("fmt", ["npz", "parquet", "feather"])
+def test_write_round_trip(tmp_path, flow, fmt):
+    # Arrange
+    if fmt != "npz":
+        pytest.importorskip("pyarrow")
+    events = storm_events(2, 3, flow)
+    filename = tmp_path / f"events.{fmt}"
+
+    # Act
+    columnar.write(events, fmt, filename)
+    result = columnar.read(filename)
+
+    # Assert
+    assert_frame_equal(
+        result, events, check_dtype=False, check_freq=False, check_index_type=False
+    )
+
+
+@pytest.mark.parametrize("tablefmt", ["csv", "tsv", "csv_nos"])
+def test_write_text_matches_printiso(capsys, flow, tablefmt):
+    # Arrange
+    table = flow.astype("Float64").assign(Q2=flow["Q"] * 2)
+    table.iloc[3, 0] = pd.NA
+    tsutils.printiso(table.copy(), tablefmt=tablefmt, float_format=".4g")
+    expected = capsys.readouterr().out
+
+    # Act
+    columnar.printiso(table, tablefmt=tablefmt, float_format=".4g")
+    result = capsys.readouterr().out
+
+    # Assert
+    assert result == expected
+    assert table.index.name != "UniqueID"
+
+
+def test_write_text_date_format(capsys):
+    # Arrange
+    table = pd.DataFrame(
+        {"Q": [1.5, 2.0, 3.0, 4.0]},
+        index=pd.DatetimeIndex(
+            ["2000-01-01", "2000-01-02", "2000-01-02 06:00", "2000-01-03"],
+            name="Datetime",
+        ),
+    )
+    tsutils.printiso(table.copy(), tablefmt="csv")
+    expected = capsys.readouterr().out
+
+    # Act
+    columnar.write_text(table, chunksize=2)
+    result = capsys.readouterr().out
+    columnar.printiso(iter([table.iloc[2:], table.iloc[:2]]), tablefmt="csv")
+    streamed = capsys.readouterr().out
+
+    # Assert
+    assert result == expected
+    assert "2000-01-02 00:00:00," in result
+    assert "2000-01-01 00:00:00,1.5" in streamed
+    with pytest.raises(ValueError, match="every chunk"):
+        columnar.printiso(iter([table.iloc[:2], table.iloc[2:]]), tablefmt="csv")
@@ -81,7 +81,30 @@ from hydrotoolbox.toolbox_utils.src.toolbox_utils.utils import pandas_offset_by_
             None,
             {15: 2.0040719118222046},
         ),
-        # Test case 4: Error case, mismatched thresholds and delays
+        # Test case 4: Several unsorted thresholds, each with a delay
+        (
+            [30, 10, 20],
+            pd.Series(
+                [5, 15, 25, 35],
+                index=pd.date_range(start="1/1/2022", periods=4, freq="D"),
+            ),
+            [0.5, 0.25, 1],
+            "over",
+            "day",
+            None,
+            None,
+            None,
+            None,
+            "no",
+            False,
+            None,
+            None,
+            "datetime",
+            None,
+            None,
+            {30: 0.0, 10: 2.25, 20: 0.5},
+        ),
+        # Test case 5: Error case, mismatched thresholds and delays
         (
             [10, 20],
             pd.Series(
@@ -108,6 +131,7 @@ from hydrotoolbox.toolbox_utils.src.toolbox_utils.utils import pandas_offset_by_
         "happy_path_over_day",
         "happy_path_under_hour",
         "edge_case_single_threshold",
+        "multiple_thresholds_with_delays",
         "error_case_mismatched_thresholds_delays",
     ],
 )
@@ -175,3 +199,64 @@ def test_exceedance_time(
         )
         # Assert
         assert result == expected
+
+
+def test_exceedance_time_multiple_columns():
+    # Arrange
+    index = pd.date_range(start="1/1/2022", periods=4, freq="D")
+    input_ts = pd.DataFrame(
+        {"a": [5, 15, 25, 35], "b": [50, 40, None, 10]}, index=index
+    )
+
+    # Act
+    result = hydrotoolbox.exceedance_time(10, 20, input_ts=input_ts)
+
+    # Assert
+    expected = pd.DataFrame(
+        {"a": [2.5, 1.5], "b": [3.0, 1 + 20 / 30 * 2]}, index=[10.0, 20.0]
+    )
+    pd.testing.assert_frame_equal(result, expected)
+    for column in input_ts.columns:
+        assert (
+            hydrotoolbox.exceedance_time(10, 20, input_ts=input_ts[[column]])
+            == result[column].to_dict()
+        )
+
+
+def test_exceedance_events():
+    # Arrange
+    input_ts = pd.DataFrame(
+        {"a": [5, 15, 25, 35, 3, 35]},
+        index=pd.date_range(start="1/1/2022", periods=6, freq="D"),
+    )
+
+    # Act
+    result = hydrotoolbox.exceedance_events(10, 30, input_ts=input_ts)
+
+    # Assert
+    expected = pd.DataFrame(
+        {
+            "Threshold": [10.0, 10.0, 30.0, 30.0],
+            "Start": pd.to_datetime(
+                [
+                    "2022-01-01 12:00",
+                    "2022-01-05 05:15",
+                    "2022-01-03 12:00",
+                    "2022-01-05 20:15",
+                ]
+            ).as_unit(input_ts.index.unit),
+            "End": pd.to_datetime(
+                [
+                    "2022-01-04 18:45",
+                    "2022-01-06 00:00",
+                    "2022-01-04 03:45",
+                    "2022-01-06 00:00",
+                ]
+            ).as_unit(input_ts.index.unit),
+            "Duration": [3.28125, 0.78125, 0.65625, 0.15625],
+            "Peak": [35.0, 35.0, 35.0, 35.0],
+        }
+    )
+    pd.testing.assert_frame_equal(result, expected)
+    totals = result.groupby("Threshold")["Duration"].sum().to_dict()
+    assert totals == hydrotoolbox.exceedance_time(10, 30, input_ts=input_ts)
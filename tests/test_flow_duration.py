@@ -1,7 +1,9 @@
+import numpy as np
 import pandas as pd
 import pytest
 
 from hydrotoolbox import hydrotoolbox
+from hydrotoolbox.streaming import FlowDurationSketch
 
 
 @pytest.mark.parametrize(
@@ -249,3 +251,116 @@ def test_flow_duration(
     pd.testing.assert_frame_equal(
         result, expected, check_index_type=False, check_dtype=False
     )
+
+
+def test_flow_duration_chunksize(tmp_path):
+    # Arrange
+    rng = np.random.default_rng(5)
+    input_ts = pd.DataFrame(
+        {"A": rng.gamma(1, 2, 1000).round(1), "B": rng.gamma(1, 2, 1000)},
+        index=pd.date_range("2000-01-01", periods=1000, freq="h", name="Datetime"),
+    )
+    input_ts.iloc[::7, 1] = np.nan
+    filename = tmp_path / "flow.csv"
+    input_ts.to_csv(filename)
+    expected = hydrotoolbox.flow_duration(input_ts=input_ts)
+
+    # Act
+    result = hydrotoolbox.flow_duration(input_ts=str(filename), chunksize=64)
+
+    # Assert
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".txt"])
+def test_flow_duration_chunksize_reader(tmp_path, suffix):
+    # Arrange
+    rng = np.random.default_rng(8)
+    dates = pd.date_range("2000-01-01", periods=300, freq="D").strftime("%Y-%m-%d")
+    flows = rng.integers(0, 20, (300, 2)).astype(str)
+    flows[::11, 0] = "NA"
+    lines = [f"{date}, {a}, {b}" for date, (a, b) in zip(dates, flows)]
+    filename = tmp_path / f"flow{suffix}"
+    filename.write_text("\n".join(["Datetime, Q1, Q2", *lines]) + "\n")
+    expected = hydrotoolbox.flow_duration(input_ts=str(filename))
+
+    # Act
+    result = hydrotoolbox.flow_duration(input_ts=str(filename), chunksize=32)
+
+    # Assert
+    assert list(result.columns) == ["Q1", "Q2"]
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
+def test_flow_duration_groupby():
+    # Arrange
+    rng = np.random.default_rng(2)
+    input_ts = pd.DataFrame(
+        {"A": rng.gamma(1, 2, 1500), "B": rng.gamma(1, 2, 1500)},
+        index=pd.date_range("2000-01-01", periods=1500, freq="D", name="Datetime"),
+    )
+    input_ts.iloc[:100, 1] = np.nan
+
+    # Act
+    result = hydrotoolbox.flow_duration(input_ts=input_ts, groupby="water_year")
+    chunked = hydrotoolbox.flow_duration(
+        input_ts=input_ts, groupby="water_year", chunksize=128
+    )
+
+    # Assert
+    assert result.index.names == ["Water year", "Quantiles"]
+    assert list(result.index.levels[0]) == [2000, 2001, 2002, 2003, 2004]
+    for year in range(2000, 2005):
+        expected = hydrotoolbox.flow_duration(
+            input_ts=input_ts,
+            start_date=f"{year - 1}-10-01",
+            end_date=f"{year}-09-30",
+        )
+        pd.testing.assert_frame_equal(
+            result.loc[year], expected, check_dtype=False, check_index_type=False
+        )
+    pd.testing.assert_frame_equal(chunked, result)
+
+
+def test_flow_duration_sketch():
+    # Arrange
+    rng = np.random.default_rng(3)
+    input_ts = pd.DataFrame(
+        {"A": rng.lognormal(0, 3, 2000), "B": rng.gamma(1, 2, 2000)},
+        index=pd.date_range("2000-01-01", periods=2000, freq="h"),
+    )
+    input_ts.iloc[::10, 0] = 0
+    exact = hydrotoolbox.flow_duration(input_ts=input_ts)
+
+    # Act
+    first = FlowDurationSketch(relative_accuracy=0.01)
+    for start in range(0, 1200, 100):
+        first.update(input_ts.iloc[start : start + 100])
+    second = FlowDurationSketch(relative_accuracy=0.01).update(input_ts.iloc[1200:])
+    result = first.merge(second).flow_duration()
+
+    # Assert
+    assert result.attrs["relative_accuracy"] == 0.01
+    assert result.index.equals(exact.index)
+    assert (np.abs(result - exact) <= 0.01 * np.abs(exact)).all(axis=None)
+
+
+def test_flow_duration_groupby_fixed_periods():
+    # Arrange
+    rng = np.random.default_rng(5)
+    input_ts = pd.DataFrame(
+        {"A": rng.gamma(1, 2, 100)},
+        index=pd.date_range("2000-01-01", periods=100, freq="D", name="Datetime"),
+    )
+
+    # Act
+    result = hydrotoolbox.flow_duration(input_ts=input_ts, groupby="7D")
+    chunked = hydrotoolbox.flow_duration(input_ts=input_ts, groupby="7D", chunksize=10)
+
+    # Assert
+    starts = result.index.levels[0]
+    assert len(starts) == 15
+    assert starts[0] == pd.Timestamp("1999-12-30")
+    pd.testing.assert_frame_equal(chunked, result)
+    with pytest.raises(ValueError, match="2MS"):
+        hydrotoolbox.flow_duration(input_ts=input_ts, groupby="2MS", chunksize=10)
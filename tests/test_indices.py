@@ -1,10 +1,12 @@
 import re
 import unittest
 
+import numpy as np
 import pandas as pd
 from pandas.testing import assert_frame_equal
 
 from hydrotoolbox import indices
+from hydrotoolbox.indices.indices import IndexState, Indices, MultiIndices
 
 all = [
     "MA1",
@@ -630,3 +632,100 @@ class TestIndices(unittest.TestCase):
             res.iloc[ln, :] = ref.iloc[ln, :]
 
         assert_frame_equal(res, ref, rtol=0.01)
+
+    def test_multiple_columns(self):
+        # Arrange
+        flow = pd.read_csv(
+            "tests/Q_BEC_BE_6500.csv", index_col=0, parse_dates=True
+        ).loc["1955-01-01":]
+        flow = pd.concat(
+            [flow.iloc[:, 0].rename("A"), (flow.iloc[:, 0] * 2).rename("B")], axis=1
+        )
+
+        # Act
+        result = indices(all, input_ts=flow, drainage_area=[1, 2])
+
+        # Assert
+        for drainage_area, col in enumerate(flow.columns, start=1):
+            single = pd.Series(
+                indices(all, input_ts=flow[[col]], drainage_area=drainage_area),
+                dtype="float64",
+                name=col,
+            )
+            pd.testing.assert_series_equal(result.loc[col], single, rtol=1e-9)
+
+    def test_multiple_columns_gaps(self):
+        # Arrange
+        flow = pd.read_csv(
+            "tests/Q_BEC_BE_6500.csv", index_col=0, parse_dates=True
+        ).iloc[:, 0]
+        a = flow.loc["1955-01-01":].copy()
+        a.loc["1970-03-01":"1971-02-15"] = np.nan
+        b = flow.shift(-400).loc["1961-06-01":].copy()
+        b.loc["1985-07-01":"1985-12-31"] = np.nan
+        b.iloc[::97] = np.nan
+        flow = pd.concat([a.rename("A"), b.rename("B")], axis=1)
+
+        # Act
+        result = indices(all, input_ts=flow, drainage_area=[1, 2])
+
+        # Assert
+        for drainage_area, col in enumerate(flow.columns, start=1):
+            single = pd.Series(
+                indices(all, input_ts=flow[[col]], drainage_area=drainage_area),
+                dtype="float64",
+                name=col,
+            )
+            pd.testing.assert_series_equal(result.loc[col], single, rtol=1e-9)
+
+    def test_drainage_areas(self):
+        # Arrange
+        flow = pd.read_csv(
+            "tests/Q_BEC_BE_6500.csv", index_col=0, parse_dates=True
+        ).loc["1955-01-01":]
+
+        # Act
+        # Assert
+        with self.assertRaisesRegex(ValueError, "one for each"):
+            indices(["MA1"], input_ts=flow, drainage_area=[1, 2])
+        self.assertEqual(MultiIndices.ML17.__doc__, Indices.ML17.__doc__)
+
+    def test_multiple_columns_codes(self):
+        # Arrange
+        codes = [
+            code
+            for code in dir(Indices)
+            if re.fullmatch(r"(MA|ML|MH|FL|FH|DL|DH|TA|TL|TH|RA)\d+", code)
+        ]
+
+        # Act
+        # Assert
+        for code in codes:
+            self.assertNotEqual(
+                code in MultiIndices._vectorized, code in vars(MultiIndices), code
+            )
+
+    def test_index_state_append(self):
+        # Arrange
+        flow = pd.read_csv(
+            "tests/Q_BEC_BE_6500.csv", index_col=0, parse_dates=True
+        ).loc["1955-01-01":]
+        full = Indices(flow)
+
+        # Act
+        state = IndexState(flow.loc[:"1990-06-15"])
+        state.append(flow.loc["1990-06-16":"2001-09-30"])
+        state.append(flow.loc["2001-10-01":])
+        result = state.indices()
+
+        # Assert
+        for code in all:
+            self.assertTrue(
+                np.allclose(
+                    float(getattr(result, code)() or np.nan),
+                    float(getattr(full, code)() or np.nan),
+                    rtol=1e-9,
+                    equal_nan=True,
+                ),
+                code,
+            )
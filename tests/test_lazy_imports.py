@@ -0,0 +1,61 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+# Modules that only the commands that use them import.  pandas, pint and
+# scipy.stats are imported by tsutils, which every command needs, and take
+# most of the start up time of every command, so this checks which modules
+# a command imports rather than how long it takes.
+LAZY_MODULES = (
+    "scipy.signal",
+    "hydrotoolbox.baseflow",
+    "hydrotoolbox.baseflow_sep",
+    "hydrotoolbox.streaming",
+)
+
+SCRIPT = """
+import contextlib
+import io
+import json
+import sys
+
+sys.argv = ["hydrotoolbox", *json.loads(sys.argv[1])]
+from hydrotoolbox.hydrotoolbox import main
+
+with contextlib.redirect_stdout(io.StringIO()):
+    try:
+        main()
+    except SystemExit:
+        pass
+print(json.dumps(sorted(sys.modules)))
+"""
+
+
+@pytest.mark.parametrize(
+    "args, loaded",
+    [
+        (["--help"], ()),
+        (["about"], ()),
+        (
+            ["baseflow_sep", "--help"],
+            ("hydrotoolbox.baseflow", "hydrotoolbox.baseflow_sep"),
+        ),
+    ],
+    ids=["help", "about", "baseflow_sep_help"],
+)
+def test_lazy_imports(args, loaded):
+    # Arrange
+    # Act
+    result = subprocess.run(
+        [sys.executable, "-c", SCRIPT, json.dumps(args)],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    modules = json.loads(result.stdout.splitlines()[-1])
+
+    # Assert
+    for module in LAZY_MODULES:
+        assert (module in modules) == (module in loaded), module
@@ -0,0 +1,64 @@
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from hydrotoolbox import baseflow_sep, flow_duration, pipeline
+
+
+def test_run(tmp_path):
+    # Arrange
+    (tmp_path / "pipeline.toml").write_text(
+        f"""
+input_ts = "tests/data.csv"
+start_date = "1930-10-01"
+end_date = "1935-09-30"
+
+[[analysis]]
+function = "flow_duration"
+output = "{(tmp_path / "flow_duration.csv").as_posix()}"
+
+[[analysis]]
+function = "baseflow_sep.eckhardt"
+k = 0.97
+bfi_max = 0.8
+
+[[analysis]]
+name = "low flows"
+function = "exceedance_time"
+thresholds = [1, 5]
+under_over = "under"
+"""
+    )
+    dates = {"start_date": "1930-10-01", "end_date": "1935-09-30"}
+
+    # Act
+    results = pipeline.run(tmp_path / "pipeline.toml")
+
+    # Assert
+    expected = flow_duration("tests/data.csv", **dates)
+    assert_frame_equal(results["flow_duration"], expected)
+    assert_frame_equal(
+        results["baseflow_sep.eckhardt"],
+        baseflow_sep.eckhardt("tests/data.csv", k=0.97, bfi_max=0.8, **dates),
+    )
+    assert list(results["low flows"]) == [1, 5]
+    written = pd.read_csv(tmp_path / "flow_duration.csv", index_col=0)
+    assert list(written.index) == list(expected.index)
+
+
+def test_run_repeated_names():
+    # Arrange
+    analyses = [
+        {"function": "flow_duration"},
+        {"function": "flow_duration", "exceedance_probabilities": [50]},
+    ]
+
+    # Act
+    # Assert
+    with pytest.raises(ValueError, match="more than once"):
+        pipeline.run({"input_ts": "missing.csv", "analysis": analyses})
+    analyses[1]["name"] = "median"
+    results = pipeline.run(
+        {"input_ts": "tests/data.csv", "analysis": analyses}, write=False
+    )
+    assert list(results) == ["flow_duration", "median"]
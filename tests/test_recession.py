@@ -1,3 +1,4 @@
+import pandas as pd
 import pytest
 
 from hydrotoolbox.hydrotoolbox import recession
@@ -95,3 +96,21 @@ def test_recession(
 
         # Assert
         assert abs(result["Q"][0] - expected["Q"][0]) < 1e-6
+
+
+def test_recession_columns():
+    # Arrange
+    flow = pd.read_csv("tests/data.csv", index_col=0, parse_dates=True)
+    input_ts = pd.concat(
+        [flow.iloc[:, 0].rename(f"Q{shift}").shift(shift) for shift in range(40)],
+        axis="columns",
+    ).iloc[40:]
+
+    # Act
+    result = recession(input_ts=input_ts, n_jobs=2)
+
+    # Assert
+    assert list(result) == list(input_ts.columns)
+    for column in input_ts.columns:
+        expected = recession(input_ts=input_ts[[column]])
+        assert result[column] == expected[column]
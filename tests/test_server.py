@@ -0,0 +1,126 @@
+import base64
+import io
+import json
+import os
+import socketserver
+import sys
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from hydrotoolbox import baseflow_sep, columnar, server
+from hydrotoolbox.hydrotoolbox import flow_duration, main
+
+
+def test_serve():
+    # Arrange
+    input_ts = pd.DataFrame(
+        {"flow": [1.0, 4.0, 2.0, 8.0, 5.0, 3.0]},
+        index=pd.date_range("2000-01-01", periods=6, freq="D", name="Datetime"),
+    )
+    requests = io.StringIO(
+        "\n".join(
+            [
+                json.dumps(
+                    {
+                        "args": ["flow_duration"],
+                        "stdin": input_ts.to_csv(),
+                    }
+                ),
+                json.dumps({"args": ["flow_duration", "--bogus"]}),
+                "not a request",
+            ]
+        )
+    )
+    responses = io.StringIO()
+
+    # Act
+    server.serve(requests=requests, responses=responses)
+
+    # Assert
+    first, second, third = (
+        json.loads(line) for line in responses.getvalue().splitlines()
+    )
+    expected = flow_duration(input_ts)
+    assert first["returncode"] == 0
+    assert first["stdout"].splitlines()[1] == f"0.995,{expected.iloc[0, 0]:g}"
+    assert second["returncode"] == 2
+    assert "--bogus" in second["stderr"]
+    assert third["returncode"] == 1
+
+
+def test_serve_keeps_files(tmp_path):
+    # Arrange
+    data = tmp_path / "data.csv"
+    data.write_text("Datetime,flow\n2000-01-01,1.0\n")
+
+    # Act and Assert
+    with pytest.raises(ValueError, match="not a socket"):
+        server.serve(program=object(), socket=str(data))
+    assert data.read_text() == "Datetime,flow\n2000-01-01,1.0\n"
+
+
+def test_serve_main(monkeypatch, capsys):
+    # Arrange
+    request = {
+        "args": ["baseflow_sep", "chapman", "--input_ts", "tests/data.csv"],
+    }
+    monkeypatch.setattr(sys, "argv", ["hydrotoolbox", "serve"])
+    monkeypatch.setattr(sys, "stdin", io.StringIO(json.dumps(request) + "\n"))
+    monkeypatch.setattr(sys, "tracebacklimit", 1000, raising=False)
+
+    # Act
+    main()
+
+    # Assert
+    response = json.loads(capsys.readouterr().out)
+    expected = baseflow_sep.chapman(input_ts="tests/data.csv")
+    assert response["returncode"] == 0, response["stderr"]
+    assert len(response["stdout"].splitlines()) == len(expected) + 1
+
+
+def test_serve_socket(tmp_path, monkeypatch):
+    # Arrange
+    input_ts = pd.DataFrame(
+        {"flow": [1.0, 4.0, 2.0, 8.0, 5.0, 3.0]},
+        index=pd.date_range("2000-01-01", periods=6, freq="D", name="Datetime"),
+    )
+    socket = str(tmp_path / "hydrotoolbox.sock")
+    servers = []
+
+    class Server(socketserver.UnixStreamServer):
+        def __init__(self, *args, **kwds):
+            super().__init__(*args, **kwds)
+            servers.append(self)
+
+    monkeypatch.setattr(server.socketserver, "UnixStreamServer", Server)
+    thread = threading.Thread(target=server.serve, kwargs={"socket": socket})
+    thread.start()
+    try:
+        deadline = time.monotonic() + 30
+        while not servers and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        # Act
+        text = server.request(socket, ["flow_duration"], stdin=input_ts.to_csv())
+        binary = server.request(
+            socket, ["flow_duration", "--tablefmt", "npz"], stdin=input_ts.to_csv()
+        )
+    finally:
+        if servers:
+            servers[0].shutdown()
+        thread.join(30)
+
+    # Assert
+    expected = flow_duration(input_ts)
+    assert text["returncode"] == 0, text["stderr"]
+    assert text["stdout"].splitlines()[1] == f"0.995,{expected.iloc[0, 0]:g}"
+    assert binary["returncode"] == 0, binary["stderr"]
+    filename = tmp_path / "flow_duration.npz"
+    filename.write_bytes(base64.b64decode(binary["stdout_base64"]))
+    result = columnar.read(str(filename))
+    assert list(result.iloc[:, 0]) == list(expected.iloc[:, 0])
+    assert not thread.is_alive()
+    assert not os.path.exists(socket)
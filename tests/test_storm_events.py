@@ -1,8 +1,11 @@
+import numpy as np
 import pandas as pd
 import pytest
 from pandas.testing import assert_frame_equal
+from scipy.signal import find_peaks
 
 from hydrotoolbox import storm_events
+from hydrotoolbox.streaming import StormDetector
 
 
 @pytest.mark.parametrize(
@@ -39,6 +42,7 @@ from hydrotoolbox import storm_events
                         pd.date_range(start="1/3/2020", periods=5, freq="D")
                     ),
                     "flow": [3, 4, 5, 4, 3],
+                    "flow_event": [1, 1, 1, 1, 1],
                 }
             ).set_index("Datetime"),
         ),
@@ -96,8 +100,44 @@ from hydrotoolbox import storm_events
             None,
             ValueError,
         ),
+        # Test ID: 01-04
+        # Test Description:
+        # Testing a storm window that starts before the first value and
+        # expecting the window to be clipped to the series.
+        (
+            3,
+            2,
+            pd.DataFrame(
+                {
+                    "Datetime": pd.date_range(start="1/1/2020", periods=10, freq="D"),
+                    "flow": [1, 5, 4, 3, 2, 1, 0, 0, 0, 0],
+                }
+            ).set_index("Datetime"),
+            None,
+            1,
+            None,
+            None,
+            None,
+            None,
+            "no",
+            False,
+            None,
+            None,
+            "datetime",
+            None,
+            None,
+            pd.DataFrame(
+                {
+                    "Datetime": pd.DatetimeIndex(
+                        pd.date_range(start="1/1/2020", periods=4, freq="D")
+                    ),
+                    "flow": [1, 5, 4, 3],
+                    "flow_event": [1, 1, 1, 1],
+                }
+            ).set_index("Datetime"),
+        ),
     ],
-    ids=["01-01", "01-02", "01-03"],
+    ids=["01-01", "01-02", "01-03", "01-04"],
 )
 def test_storm_events(
     rise_lag,
@@ -169,3 +209,129 @@ def test_storm_events(
             check_freq=False,
             check_dtype=False,
         )
+
+
+def test_storm_events_summary():
+    # Arrange
+    input_ts = pd.DataFrame(
+        {
+            "a": [1, 2, 3, 4, 5, 4, 3, 2, 1, 0, 1, 6, 1, 0],
+            "b": [0, 0, 0, 0, 0, 0, 0, 9, 0, 0, 0, 0, 0, 0],
+        },
+        index=pd.date_range(start="1/1/2020", periods=14, freq="D"),
+    )
+
+    # Act
+    result = storm_events(2, 2, input_ts, summary=True)
+
+    # Assert
+    day = pd.Timedelta(days=1)
+    start = pd.to_datetime(["2020-01-03", "2020-01-10", "2020-01-06"]).as_unit(
+        input_ts.index.unit
+    )
+    expected = pd.DataFrame(
+        {
+            "Column": ["a", "a", "b"],
+            "Event": [1, 2, 1],
+            "Start": start,
+            "End": start + 4 * day,
+            "Duration": [4 * day] * 3,
+            "Peak": [5.0, 6.0, 9.0],
+            "Peak time": start + 2 * day,
+            "Rise": [2 * day] * 3,
+            "Fall": [2 * day] * 3,
+            "Volume": [16 * 86400.0, 8 * 86400.0, 9 * 86400.0],
+        }
+    )
+    assert_frame_equal(result, expected, check_dtype=False)
+
+
+def test_storm_events_summary_missing():
+    # Arrange
+    input_ts = pd.DataFrame(
+        {"a": [0, 1, np.nan, 3, 8, 3, 1, 0, 0, 1, np.nan, 2, 7, 2, 0, 0]},
+        index=pd.date_range(start="1/1/2020", periods=16, freq="D"),
+    )
+
+    # Act
+    result = storm_events(3, 2, input_ts, min_peak=5, summary=True)
+
+    # Assert
+    assert list(result["Peak"]) == [8.0, 7.0]
+    assert list(result["Peak time"]) == list(input_ts.index[[4, 12]])
+    assert list(result["Start"]) == list(input_ts.index[[1, 9]])
+
+
+def test_storm_detector():
+    # Arrange
+    rng = np.random.default_rng(7)
+    input_ts = pd.DataFrame(
+        {"flow": rng.gamma(1, 2, 500)},
+        index=pd.date_range(start="1/1/2020", periods=500, freq="h", name="Datetime"),
+    )
+    expected = storm_events(3, 5, input_ts, min_peak=4, window=6)
+
+    # Act
+    detector = StormDetector(3, 5, min_peak=4, window=6)
+    parts = []
+    buffered = 0
+    for start in range(0, len(input_ts), 7):
+        parts.append(detector.update(input_ts.iloc[start : start + 7]))
+        buffered = max(buffered, len(detector._values))
+    parts.append(detector.flush())
+    result = pd.concat(parts)
+
+    # Assert
+    assert buffered < 100
+    assert_frame_equal(result, expected, check_dtype=False, check_freq=False)
+
+
+def test_storm_detector_long_storm():
+    # Arrange
+    flow = np.zeros(3000)
+    flow[500:2500:2] = 5.0
+    input_ts = pd.Series(
+        flow,
+        index=pd.date_range(start="1/1/2020", periods=3000, freq="h", name="Datetime"),
+        name="flow",
+    )
+    expected = storm_events(3, 5, input_ts.to_frame(), min_peak=4, window=6)
+
+    # Act
+    detector = StormDetector(3, 5, min_peak=4, window=6)
+    parts = []
+    buffered = []
+    for start in range(0, len(input_ts), 7):
+        parts.append(detector.update(input_ts.iloc[start : start + 7]))
+        buffered.append((min(start + 7, 3000), len(detector._values)))
+    parts.append(detector.flush())
+
+    # Assert
+    assert_frame_equal(pd.concat(parts), expected, check_dtype=False)
+    # The flows of the storm in progress, from 497, and a few more are kept,
+    # and they are released when the storm is completed.
+    for end, size in buffered:
+        if 497 < end < 2510:
+            assert size <= end - 497 + 3 + 6 + 5
+        else:
+            assert size <= 3 + 6 + 5 + 7
+
+
+def test_storm_events_peak_distance():
+    # Arrange
+    rng = np.random.default_rng(11)
+    flow = rng.integers(0, 3, 3000).astype("float64")
+    input_ts = pd.DataFrame(
+        {"flow": flow},
+        index=pd.date_range("2020-01-01", periods=3000, freq="h", name="Datetime"),
+    )
+    peaks = find_peaks(flow, height=1, distance=4)[0]
+    expected = np.zeros(len(flow), dtype=bool)
+    for peak in peaks:
+        expected[max(peak - 1, 0) : peak + 2] = True
+
+    # Act
+    result = storm_events(1, 1, input_ts, min_peak=1, window=4)
+
+    # Assert
+    assert list(result.index) == list(input_ts.index[expected])